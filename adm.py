@@ -0,0 +1,208 @@
+import time
+
+import numpy as np
+
+from dm import HAVE_NUMBA
+
+# --- Προσαρμοστική Delta Modulation (Jayant, Song, CVSD) ---
+#
+# Σε όλες τις παραλλαγές το bit είναι d[n] = +1 αν x[n] >= q[n-1], αλλιώς -1,
+# και q[n] = q[n-1] + d[n] * s[n]. Αλλάζει μόνο ο κανόνας για το βήμα s[n]:
+#
+#   jayant: s[n] = s[n-1] * P αν d[n] == d[n-1], αλλιώς s[n-1] / P
+#   song:   s[n] = s[n-1] * 1.5 αν d[n] == d[n-1], αλλιώς s[n-1] * 0.5,
+#           με ελάχιστο βήμα s0 (η παράμετρος)
+#   cvsd:   s[n] = beta * s[n-1] + (1 - beta) * (E_max αν τα τελευταία
+#           run_length bits είναι ίδια, αλλιώς E_min), beta = exp(-1 / (fs * tau))
+#           (συλλαβικό φίλτρο με σταθερά χρόνου tau)
+#
+# Το βήμα περιορίζεται πάντα στο [E_min, E_max]. Όπως στο dm_sweep, όλες οι
+# παράμετροι υπολογίζονται σε ένα πέρασμα με διάνυσμα κατάστασης (ένα ανά
+# παράμετρο).
+
+ADM_MODES = ('jayant', 'song', 'cvsd')
+
+def _ratio_kernel(x, same, diff, lo, hi, q, s, noise, n_over, stairs):
+    keep = stairs.shape[1] > 0
+    for p in range(len(q)):
+        d_prev = 1
+        for n in range(1, len(x)):
+            error = x[n] - q[p]
+            d = 1 if error >= 0 else -1
+            s[p] *= same[p] if d == d_prev else diff[p]
+            s[p] = min(max(s[p], lo[p]), hi[p])
+            q[p] += d * s[p]
+            if abs(error) > s[p]:
+                n_over[p] += 1
+            e = x[n] - q[p]
+            noise[p] += e * e
+            d_prev = d
+            if keep:
+                stairs[p, n] = q[p]
+
+def _cvsd_kernel(x, beta, lo, hi, run_length, q, s, noise, n_over, stairs):
+    keep = stairs.shape[1] > 0
+    for p in range(len(q)):
+        d_prev = 1
+        run = 0
+        for n in range(1, len(x)):
+            error = x[n] - q[p]
+            d = 1 if error >= 0 else -1
+            run = run + 1 if d == d_prev else 1
+            target = hi[p] if run >= run_length else lo[p]
+            s[p] = beta[p] * s[p] + (1 - beta[p]) * target
+            q[p] += d * s[p]
+            if abs(error) > s[p]:
+                n_over[p] += 1
+            e = x[n] - q[p]
+            noise[p] += e * e
+            d_prev = d
+            if keep:
+                stairs[p, n] = q[p]
+
+def _ratio_numpy(x, same, diff, lo, hi, q, s, noise, n_over, stairs):
+    # Χωρίς numba: βρόχος στα δείγματα, διανυσματικά σε όλες τις παραμέτρους
+    keep = stairs.shape[1] > 0
+    d_prev = np.ones(len(q))
+    for n in range(1, len(x)):
+        error = x[n] - q
+        d = np.where(error >= 0, 1.0, -1.0)
+        s *= np.where(d == d_prev, same, diff)
+        np.clip(s, lo, hi, out=s)
+        q += d * s
+        n_over += np.abs(error) > s
+        noise += (x[n] - q) ** 2
+        d_prev = d
+        if keep:
+            stairs[:, n] = q
+
+def _cvsd_numpy(x, beta, lo, hi, run_length, q, s, noise, n_over, stairs):
+    keep = stairs.shape[1] > 0
+    d_prev = np.ones(len(q))
+    run = np.zeros(len(q), dtype=np.int64)
+    for n in range(1, len(x)):
+        error = x[n] - q
+        d = np.where(error >= 0, 1.0, -1.0)
+        run = np.where(d == d_prev, run + 1, 1)
+        s *= beta
+        s += (1 - beta) * np.where(run >= run_length, hi, lo)
+        q += d * s
+        n_over += np.abs(error) > s
+        noise += (x[n] - q) ** 2
+        d_prev = d
+        if keep:
+            stairs[:, n] = q
+
+if HAVE_NUMBA:
+    from numba import njit
+    _ratio_kernel = njit(cache=True, nogil=True)(_ratio_kernel)
+    _cvsd_kernel = njit(cache=True, nogil=True)(_cvsd_kernel)
+else:
+    _ratio_kernel = _ratio_numpy
+    _cvsd_kernel = _cvsd_numpy
+
+def adm_sweep_dtype():
+    """
+    Τύπος του δομημένου πίνακα αποτελεσμάτων (μία γραμμή ανά παράμετρο).
+    """
+    return np.dtype([('fs', 'f8'),                 # Ρυθμός δειγματοληψίας = bitrate (bit/s)
+                     ('param', 'f8'),              # P (jayant), s0 (song) ή tau σε s (cvsd)
+                     ('snr_db', 'f8'),             # 10 log10(ισχύς σήματος / ισχύς σφάλματος)
+                     ('noise_power', 'f8'),        # Μέση ισχύς σφάλματος x - q
+                     ('overload_fraction', 'f8')]) # Ποσοστό δειγμάτων με |x[n] - q[n-1]| > s[n]
+
+def adm_sweep(signal_samples, mode, params, fs, E_min=0.01, E_max=5.0,
+              run_length=3, keep_staircase=False):
+    """
+    Προσαρμοστική DM του ίδιου σήματος για όλες τις παραμέτρους 'params'
+    (βλ. ADM_MODES και την περιγραφή στην αρχή του αρχείου) σε ένα πέρασμα.
+
+    Επιστρέφει δομημένο πίνακα (βλ. adm_sweep_dtype) με τη σειρά των params
+    και, αν keep_staircase=True, και τις σκάλες σε πίνακα (len(params), N),
+    έτοιμες για ανάκτηση με LPF (όπως στο g2.py).
+    """
+    if mode not in ADM_MODES:
+        raise ValueError(f"Άγνωστο mode '{mode}', επιλογές: {ADM_MODES}")
+    x = np.ascontiguousarray(signal_samples, dtype=np.float64)
+    params = np.ascontiguousarray(params, dtype=np.float64).reshape(-1)
+    N, P = len(x), len(params)
+    lo = np.full(P, float(E_min))
+    hi = np.full(P, float(E_max))
+    noise = np.zeros(P)
+    n_over = np.zeros(P, dtype=np.int64)
+    stairs = np.empty((P, N if keep_staircase else 0))
+    if N:
+        q = np.full(P, x[0])
+        if keep_staircase:
+            stairs[:, 0] = x[0]
+        if mode == 'cvsd':
+            beta = np.exp(-1 / (fs * params))
+            _cvsd_kernel(x, beta, lo, hi, run_length, q, lo.copy(), noise, n_over, stairs)
+        else:
+            if mode == 'jayant':
+                same, diff = params, 1 / params
+            else:
+                same, diff = np.full(P, 1.5), np.full(P, 0.5)
+                lo = np.maximum(lo, params)
+            _ratio_kernel(x, same, diff, lo, hi, q, lo.copy(), noise, n_over, stairs)
+
+    result = np.zeros(P, dtype=adm_sweep_dtype())
+    result['fs'] = fs
+    result['param'] = params
+    n = max(N, 1)
+    result['noise_power'] = noise / n
+    result['overload_fraction'] = n_over / n
+    with np.errstate(divide='ignore'):
+        result['snr_db'] = 10 * np.log10(np.sum(x**2) / n / result['noise_power'])
+    if keep_staircase:
+        return result, stairs
+    return result
+
+# Πλέγματα παραμέτρων για τις καμπύλες SNR - bitrate
+DEFAULT_PARAMS = {
+    'jayant': np.linspace(1.05, 3.0, 40),
+    'song': np.logspace(-3, 0, 40),
+    'cvsd': np.logspace(-4.5, -2, 40),
+}
+
+def snr_vs_bitrate(signal_fn, fs_values, T_duration, modes=ADM_MODES, params=None, **kwargs):
+    """
+    Για κάθε fs (= bitrate, 1 bit ανά δείγμα) και κάθε mode, το μέγιστο SNR
+    στο πλέγμα παραμέτρων. Επιστρέφει {mode: (SNR σε dB, βέλτιστη παράμετρος)}
+    με πίνακες μήκους len(fs_values).
+    """
+    # Οι τιμές του καλούντος υπερισχύουν· τα υπόλοιπα modes κρατούν το προεπιλεγμένο πλέγμα
+    params = {**DEFAULT_PARAMS, **(params or {})}
+    curves = {mode: (np.empty(len(fs_values)), np.empty(len(fs_values))) for mode in modes}
+    for i, fs in enumerate(fs_values):
+        x = signal_fn(np.arange(0, T_duration, 1/fs))
+        for mode in modes:
+            stats = adm_sweep(x, mode, params[mode], fs, **kwargs)
+            best = np.argmax(stats['snr_db'])
+            curves[mode][0][i] = stats['snr_db'][best]
+            curves[mode][1][i] = stats['param'][best]
+    return curves
+
+# --- Benchmark και καμπύλες SNR - bitrate ---
+if __name__ == "__main__":
+    from dm import dm_sweep
+    from dsp import m
+
+    print(f"numba: {'ναι' if HAVE_NUMBA else 'όχι (βρόχος Python ανά δείγμα)'}")
+    x = m(np.arange(0, 0.1, 1/200000))
+    for mode in ADM_MODES:
+        params = DEFAULT_PARAMS[mode]
+        adm_sweep(x[:100], mode, params, 200000)  # μεταγλώττιση / cache του numba
+        t0 = time.perf_counter()
+        adm_sweep(x, mode, params, 200000)
+        dt = time.perf_counter() - t0
+        print(f"{mode:>6}: {len(params)} παράμετροι x {len(x)} δείγματα σε {dt:.3f} s "
+              f"({len(params) * len(x) / dt / 1e6:.0f} M ενημερώσεις/s)")
+
+    fs_values = [8000, 16000, 32000, 64000, 128000, 256000]
+    curves = snr_vs_bitrate(m, fs_values, 0.02)
+    E_values = np.logspace(-2, 1, 200)
+    print(f"\n{'bitrate':>8} {'DM':>8} " + " ".join(f"{mode:>8}" for mode in ADM_MODES) + "  (SNR dB)")
+    for i, fs in enumerate(fs_values):
+        snr_dm = np.max(dm_sweep(m(np.arange(0, 0.02, 1/fs)), E_values, fs)['snr_db'])
+        print(f"{fs:>8} {snr_dm:>8.1f} " + " ".join(f"{curves[mode][0][i]:>8.1f}" for mode in ADM_MODES))
@@ -0,0 +1,85 @@
+import time
+
+import numpy as np
+
+# --- Αναλυτικός υπολογισμός aliasing για αθροίσματα τόνων ---
+
+def alias_map(amps, freqs, phases, fs_values, rtol=1e-9):
+    """
+    Φάσμα (συχνότητες, πλάτη, φάσεις) μετά τη δειγματοληψία με fs, χωρίς FFT.
+
+    Κάθε τόνος a*cos(2*pi*f*t + phi) δειγματοληπτημένος στο fs είναι ο τόνος
+    a*cos(2*pi*f_a*t +/- phi) με f_a = |((f + fs/2) mod fs) - fs/2| στη ζώνη
+    [0, fs/2]. Τόνοι που πέφτουν στην ίδια f_a αθροίζονται ως φασιθέτες.
+    Στο 0 και στο fs/2 μένει μόνο το πραγματικό μέρος (πλάτος |a cos(phi)|).
+
+    amps, freqs, phases: σχήμα (..., K) · fs_values: σχήμα που κάνει broadcast
+    με το (...) (π.χ. (F,) για έναν τόνο-σύνολο και F ρυθμούς).
+    Επιστρέφει (f_alias, amp, phase) σχήματος (..., K), ταξινομημένα κατά
+    συχνότητα· οι τόνοι που ενώθηκαν με προηγούμενο έχουν amp = 0.
+    """
+    fs = np.asarray(fs_values, dtype=float)[..., None]
+    amps, freqs, phases, fs = np.broadcast_arrays(
+        np.asarray(amps, dtype=float), np.asarray(freqs, dtype=float),
+        np.asarray(phases, dtype=float), fs)
+
+    # Αναδίπλωση στο [0, fs): πάνω από fs/2 ο τόνος καθρεφτίζεται (αλλάζει πρόσημο η φάση)
+    f_r = np.mod(freqs, fs)
+    mirrored = f_r > fs / 2
+    f_alias = np.where(mirrored, fs - f_r, f_r)
+    c = amps * np.exp(1j * np.where(mirrored, -phases, phases))
+
+    # Ένωση τόνων με ίδια f_alias: ταξινόμηση και άθροισμα ανά ομάδα
+    order = np.argsort(f_alias, axis=-1)
+    f_alias = np.take_along_axis(f_alias, order, axis=-1)
+    c = np.take_along_axis(c, order, axis=-1)
+    same = np.zeros(f_alias.shape, dtype=bool)
+    tol = rtol * fs
+    same[..., 1:] = np.diff(f_alias, axis=-1) <= tol[..., 1:]
+    # Από δεξιά προς αριστερά: κάθε τόνος προστίθεται στον προηγούμενό του
+    # αν έχουν την ίδια συχνότητα, ώστε η ομάδα να καταλήγει στον πρώτο της τόνο
+    c_out = c.copy()
+    for j in range(f_alias.shape[-1] - 1, 0, -1):
+        merge = same[..., j]
+        c_out[..., j - 1] += np.where(merge, c_out[..., j], 0)
+        c_out[..., j] = np.where(merge, 0, c_out[..., j])
+
+    # DC και Nyquist: οι συνιστώσες είναι πραγματικές
+    edge = (f_alias <= tol) | (np.abs(f_alias - fs / 2) <= tol)
+    c_out = np.where(edge, c_out.real, c_out)
+    return f_alias, np.abs(c_out), np.angle(c_out)
+
+def alias_spectrum_lines(amps, freqs, phases, fs, N):
+    """
+    Προβλεπόμενες τιμές του get_spectrum (norm='ortho') στις γραμμές του
+    aliased φάσματος, για N δείγματα που καλύπτουν ακέραιο αριθμό περιόδων.
+    Επιστρέφει (f_alias, μέτρο) μόνο για τις μη μηδενικές γραμμές (f >= 0).
+    """
+    f_a, amp, _ = alias_map(amps, freqs, phases, fs)
+    keep = amp > 1e-9 * np.max(amp)
+    f_a, amp = f_a[keep], amp[keep]
+    edge = np.isclose(f_a, 0) | np.isclose(f_a, fs / 2)
+    # |X_k| = N * a / 2 / sqrt(N) για τόνο, N * a / sqrt(N) στο DC / Nyquist
+    return f_a, np.where(edge, amp, amp / 2) * np.sqrt(N)
+
+# --- Έλεγχος με get_spectrum και throughput ---
+if __name__ == "__main__":
+    from dsp import m, get_spectrum
+    from tonebank import m_tones
+
+    amps, freqs, phases = m_tones()
+    T_duration = 0.02
+    for fs in [4000, 1500, 2000, 2400, 1000, 800, 3000]:
+        samples = m(np.arange(0, T_duration, 1/fs))
+        freq_axis, mag = get_spectrum(samples, fs)
+        f_a, lines = alias_spectrum_lines(amps, freqs, phases, fs, len(samples))
+        measured = np.array([mag[np.argmin(np.abs(np.abs(freq_axis) - f))] for f in f_a])
+        print(f"fs={fs:>5} Hz: γραμμές {np.round(f_a, 1)} Hz, "
+              f"max |αναλυτικό - FFT| = {np.max(np.abs(lines - measured)):.1e}")
+
+    # Throughput: ένα σύνολο τόνων, πολλά fs
+    fs_values = np.random.default_rng(0).uniform(500, 10000, 10**6)
+    t0 = time.perf_counter()
+    alias_map(amps, freqs, phases, fs_values)
+    dt = time.perf_counter() - t0
+    print(f"{len(fs_values):.0e} (σήμα, fs) σε {dt:.2f} s ({len(fs_values) / dt / 1e6:.1f} M/s)")
@@ -0,0 +1,181 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import scipy
+
+from dm import HAVE_NUMBA
+from dsp import m, f_max, get_spectrum, ideal_lpf_reconstruct, quantize_uniform, simulate_dm
+
+# --- Benchmark suite για τους πυρήνες του dsp.py ---
+#
+# run:     κάθε πυρήνας σε πλέγμα (μέγεθος, dtype, παράμετροι) -> αρχείο JSON
+#          με χρόνο, μέγιστη μνήμη (tracemalloc) και throughput.
+# compare: σύγκριση δύο αρχείων αποτελεσμάτων, με σήμανση των regressions.
+
+SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+DTYPES = ['float64', 'float32']
+FS = 50 * f_max
+
+def _signal(n, dtype):
+    return m(np.arange(n) / FS).astype(dtype)
+
+def _setup_spectrum(n, dtype, onesided):
+    x = _signal(n, dtype)
+    return lambda: get_spectrum(x, FS, onesided=onesided)
+
+def _setup_lpf(n, dtype, L, block_size=None):
+    x = _signal(n, dtype)
+    t_target = np.arange(n * L) / (FS * L)
+    return lambda: ideal_lpf_reconstruct(x, None, t_target, FS, block_size=block_size)
+
+def _setup_quantize(n, dtype, L):
+    x = _signal(n, dtype)
+    return lambda: quantize_uniform(x, L, -6, 6)
+
+def _setup_dm(n, dtype, E):
+    x = _signal(n, dtype)
+    return lambda: simulate_dm(x, E)
+
+# Για κάθε πυρήνα: setup(n, dtype, **params) -> συνάρτηση χωρίς ορίσματα,
+# το πλέγμα παραμέτρων και το μέγιστο n (η έξοδος του LPF είναι n * L δείγματα,
+# η simulate_dm χωρίς numba είναι βρόχος Python ανά δείγμα).
+KERNELS = {
+    'get_spectrum': dict(setup=_setup_spectrum, max_n=10**7,
+                         params=[{'onesided': False}, {'onesided': True}]),
+    'ideal_lpf_reconstruct': dict(setup=_setup_lpf, max_n=10**6,
+                                  params=[{'L': 4}, {'L': 15}, {'L': 15, 'block_size': 4096}]),
+    'quantize_uniform': dict(setup=_setup_quantize, max_n=10**7,
+                             params=[{'L': 16}, {'L': 256}]),
+    'simulate_dm': dict(setup=_setup_dm, max_n=10**7,
+                        params=[{'E': 0.2}]),
+}
+
+def case_key(result):
+    """
+    Ταυτότητα μιας μέτρησης (για αντιστοίχιση μεταξύ αρχείων).
+    """
+    params = ",".join(f"{k}={v}" for k, v in sorted(result['params'].items()))
+    return f"{result['kernel']}[n={result['n']},{result['dtype']},{params}]"
+
+def measure(fn, min_time=0.2, max_repeats=100):
+    """
+    Χρόνος (καλύτερος και διάμεσος) με επαναλήψεις για τουλάχιστον min_time,
+    και μέγιστη μνήμη μιας κλήσης σε ξεχωριστή εκτέλεση υπό tracemalloc.
+    """
+    fn()  # ζέσταμα (caches, σελίδες μνήμης)
+    times = []
+    t_start = time.perf_counter()
+    while len(times) < max_repeats and (not times or time.perf_counter() - t_start < min_time):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), float(np.median(times)), len(times), peak
+
+def run_suite(kernels=None, sizes=SIZES, dtypes=DTYPES, min_time=0.2, verbose=True):
+    """
+    Εκτελεί το πλέγμα και επιστρέφει {'meta': ..., 'results': [...]}.
+    """
+    results = []
+    for name in kernels or KERNELS:
+        spec = KERNELS[name]
+        for n in sizes:
+            if n > spec['max_n']:
+                continue
+            for dtype in dtypes:
+                for params in spec['params']:
+                    fn = spec['setup'](n, dtype, **params)
+                    best, median, repeats, peak = measure(fn, min_time)
+                    result = dict(kernel=name, n=n, dtype=dtype, params=params,
+                                  time_s=best, time_median_s=median, repeats=repeats,
+                                  peak_bytes=peak, throughput=n / best)
+                    results.append(result)
+                    if verbose:
+                        print(f"{case_key(result):<70} {best * 1e3:>10.3f} ms "
+                              f"{peak / 2**20:>8.1f} MB {n / best / 1e6:>8.1f} M/s")
+    meta = dict(timestamp=datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                python=sys.version.split()[0], numpy=np.__version__, scipy=scipy.__version__,
+                platform=platform.platform(), machine=platform.machine(), numba=HAVE_NUMBA,
+                min_time=min_time)
+    return {'meta': meta, 'results': results}
+
+def compare(old, new, threshold=0.10, mem_threshold=0.10):
+    """
+    Σύγκριση δύο αποτελεσμάτων run_suite στις κοινές μετρήσεις.
+    Επιστρέφει λίστα (key, λόγος χρόνου new/old, λόγος μνήμης, σημάνσεις).
+    Regression: λόγος χρόνου > 1 + threshold ή λόγος μνήμης > 1 + mem_threshold.
+    """
+    old_cases = {case_key(r): r for r in old['results']}
+    rows = []
+    for r in new['results']:
+        key = case_key(r)
+        if key not in old_cases:
+            continue
+        o = old_cases[key]
+        t_ratio = r['time_s'] / o['time_s']
+        m_ratio = (r['peak_bytes'] + 1) / (o['peak_bytes'] + 1)
+        flags = []
+        if t_ratio > 1 + threshold:
+            flags.append('REGRESSION(time)')
+        elif t_ratio < 1 - threshold:
+            flags.append('faster')
+        if m_ratio > 1 + mem_threshold:
+            flags.append('REGRESSION(memory)')
+        rows.append((key, t_ratio, m_ratio, flags))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks των πυρήνων του dsp.py.")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_run = sub.add_parser('run', help="εκτέλεση του πλέγματος και αποθήκευση σε JSON")
+    p_run.add_argument('--output', default="benchmark_results.json")
+    p_run.add_argument('--kernels', nargs='*', choices=list(KERNELS), default=None)
+    p_run.add_argument('--sizes', nargs='*', type=float, default=SIZES,
+                       help="π.χ. 1e3 1e5 (προεπιλογή 1e3 έως 1e7)")
+    p_run.add_argument('--dtypes', nargs='*', default=DTYPES)
+    p_run.add_argument('--min-time', type=float, default=0.2,
+                       help="ελάχιστος συνολικός χρόνος επαναλήψεων ανά μέτρηση (s)")
+
+    p_cmp = sub.add_parser('compare', help="σύγκριση δύο αρχείων αποτελεσμάτων")
+    p_cmp.add_argument('old')
+    p_cmp.add_argument('new')
+    p_cmp.add_argument('--threshold', type=float, default=0.10,
+                       help="ανεκτή αύξηση χρόνου (0.10 = 10%%)")
+    p_cmp.add_argument('--mem-threshold', type=float, default=0.10)
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        sizes = [int(s) for s in args.sizes]
+        data = run_suite(args.kernels, sizes, args.dtypes, args.min_time)
+        with open(args.output, 'w') as fh:
+            json.dump(data, fh, indent=1)
+        print(f"{len(data['results'])} μετρήσεις στο '{args.output}'")
+        return 0
+
+    with open(args.old) as fh:
+        old = json.load(fh)
+    with open(args.new) as fh:
+        new = json.load(fh)
+    rows = compare(old, new, args.threshold, args.mem_threshold)
+    print(f"{'Μέτρηση':<70} {'χρόνος':>8} {'μνήμη':>8}")
+    n_regressions = 0
+    for key, t_ratio, m_ratio, flags in rows:
+        n_regressions += any(f.startswith('REGRESSION') for f in flags)
+        print(f"{key:<70} {t_ratio:>7.2f}x {m_ratio:>7.2f}x  {' '.join(flags)}")
+    print(f"\n{len(rows)} κοινές μετρήσεις, {n_regressions} regressions "
+          f"(όριο χρόνου +{args.threshold:.0%}, μνήμης +{args.mem_threshold:.0%})")
+    return 1 if n_regressions else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,245 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.stats import norm
+
+from quantizer import UniformQuantizer
+from tonebank import m_tones
+
+# --- Monte Carlo για κβάντιση με dither ---
+#
+# Κάθε υλοποίηση είναι το m(t) με τυχαίες, ανεξάρτητες φάσεις στους τρεις
+# τόνους, κβαντισμένο ομοιόμορφα με n bits μετά από πρόσθεση dither:
+#   'none': χωρίς dither
+#   'rect': ομοιόμορφο στο [-D/2, D/2) (RPDF, ισχύς D^2/12)
+#   'tri':  άθροισμα δύο ομοιόμορφων, στο (-D, D) (TPDF, ισχύς D^2/6)
+# Με subtractive=True το dither αφαιρείται μετά την αποκβάντιση.
+#
+# Οι υλοποιήσεις χωρίζονται σε ομάδες των 'batch', καθεμία με δικό της
+# SeedSequence (spawn από το seed), και οι ομάδες μοιράζονται σε εργασίες
+# των 'job_size' υλοποιήσεων: οι τυχαίοι αριθμοί δεν εξαρτώνται ούτε από
+# το μέγεθος των εργασιών ούτε από το πλήθος των διεργασιών. Το job_size
+# είναι εξ ορισμού n_realizations / (workers * JOBS_PER_WORKER), ώστε να
+# απασχολούνται όλοι οι πυρήνες με ισορροπημένο φορτίο. Κάθε εργασία
+# επιστρέφει μόνο (πλήθος, μέσος, M2) ανά μέγεθος· τα στατιστικά ενώνονται
+# με τη σειρά των εργασιών (Chan et al.), χωρίς να κρατιούνται οι τιμές των
+# υλοποιήσεων, οπότε διαφέρουν μόνο κατά σφάλματα στρογγύλευσης.
+
+DITHERS = ('none', 'rect', 'tri')
+JOBS_PER_WORKER = 4
+
+class OnlineStats:
+    """
+    Μέσος και διασπορά σε ένα πέρασμα (Welford / Chan): update(τιμές)
+    για ένα κομμάτι τιμών, merge(άλλο) για στατιστικά άλλης εργασίας.
+    """
+
+    def __init__(self, n=0, mean=0.0, m2=0.0):
+        self.n = n
+        self.mean = mean
+        self.m2 = m2
+
+    def merge(self, other):
+        n = self.n + other.n
+        if n == 0:
+            return self
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+        return self
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).reshape(-1)
+        if len(values):
+            mean = values.mean()
+            self.merge(OnlineStats(len(values), mean, np.sum((values - mean) ** 2)))
+        return self
+
+    @property
+    def var(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else np.nan
+
+    def ci(self, level=0.95):
+        """
+        Μισό πλάτος του διαστήματος εμπιστοσύνης του μέσου (κανονική προσέγγιση).
+        """
+        return norm.ppf(0.5 + level / 2) * np.sqrt(self.var / self.n)
+
+    def state(self):
+        return (self.n, self.mean, self.m2)
+
+def mc_dtype():
+    """
+    Dtype των αποτελεσμάτων του dither_study.
+    """
+    return np.dtype([('dither', 'U4'), ('subtractive', bool), ('n_bits', np.int64),
+                     ('realizations', np.int64),
+                     ('mse', np.float64), ('mse_ci', np.float64),
+                     ('sqnr_db', np.float64), ('sqnr_ci', np.float64),
+                     ('mse_theory', np.float64)])
+
+def dither_noise(rng, dither, delta, shape):
+    """
+    Δείγματα dither για βήμα κβάντισης delta.
+    """
+    if dither == 'none':
+        return np.zeros(shape)
+    if dither == 'rect':
+        return rng.uniform(-delta / 2, delta / 2, shape)
+    if dither == 'tri':
+        d = rng.uniform(-delta / 2, delta / 2, shape)
+        d += rng.uniform(-delta / 2, delta / 2, shape)
+        return d
+    raise ValueError(f"Άγνωστο dither '{dither}', επιλογές: {DITHERS}")
+
+def mse_theory(dither, delta, subtractive=False):
+    """
+    Ισχύς σφάλματος χωρίς υπερφόρτωση: D^2/12 για τον κβαντιστή, συν την
+    ισχύ του dither όταν δεν αφαιρείται (RPDF: D^2/12, TPDF: D^2/6).
+    Χωρίς dither το D^2/12 είναι μόνο προσέγγιση.
+    """
+    extra = {'none': 0.0, 'rect': 1 / 12, 'tri': 1 / 6}[dither]
+    return delta ** 2 * (1 / 12 + (0.0 if subtractive else extra))
+
+def run_realizations(n_realizations, seed, dither='tri', n_bits=8, subtractive=False,
+                     fs=48000, n_samples=4096, v_min=-8, v_max=8, batch=64):
+    """
+    n_realizations υλοποιήσεις με γεννήτρια από το seed (int ή SeedSequence).
+    Επιστρέφει {'mse': (n, μέσος, M2), 'sqnr_db': (n, μέσος, M2)}.
+    Το εύρος [v_min, v_max] αφήνει περιθώριο για το dither πάνω από το |m| <= 6.
+    """
+    rng = np.random.default_rng(seed)
+    quantizer = UniformQuantizer(1 << n_bits, v_min, v_max)
+    amps, freqs, _ = m_tones()
+    # a cos(wn + phi) = a cos(phi) cos(wn) - a sin(phi) sin(wn): δύο γινόμενα πινάκων ανά ομάδα
+    arg = np.outer(2 * np.pi * freqs / fs, np.arange(n_samples))
+    cos_table, sin_table = np.cos(arg), np.sin(arg)
+    stats = {'mse': OnlineStats(), 'sqnr_db': OnlineStats()}
+    for start in range(0, n_realizations, batch):
+        B = min(batch, n_realizations - start)
+        phases = rng.uniform(0, 2 * np.pi, (B, len(amps)))
+        x = (amps * np.cos(phases)) @ cos_table
+        x -= (amps * np.sin(phases)) @ sin_table
+        d = dither_noise(rng, dither, quantizer.delta, x.shape)
+        y = quantizer(x + d)
+        if subtractive:
+            y -= d
+        mse = np.mean((y - x) ** 2, axis=1)
+        stats['mse'].update(mse)
+        stats['sqnr_db'].update(10 * np.log10(np.mean(x * x, axis=1) / mse))
+    return {name: s.state() for name, s in stats.items()}
+
+def _run_job(job):
+    # Μία εργασία: διαδοχικές ομάδες (πλήθος, seed), ενωμένες με τη σειρά
+    batches, kwargs = job
+    stats = {'mse': OnlineStats(), 'sqnr_db': OnlineStats()}
+    for n, seed in batches:
+        for name, state in run_realizations(n, seed, **kwargs).items():
+            stats[name].merge(OnlineStats(*state))
+    return {name: s.state() for name, s in stats.items()}
+
+def _make_jobs(n_realizations, seed, workers, job_size, kwargs):
+    # Ομάδες των 'batch' με δικό τους seed, μοιρασμένες σε εργασίες των job_size
+    batch = kwargs.get('batch', 64)
+    if job_size is None:
+        job_size = -(-n_realizations // ((workers or os.cpu_count() or 1) * JOBS_PER_WORKER))
+    per_job = max(1, -(-job_size // batch))
+    sizes = [min(batch, n_realizations - s) for s in range(0, n_realizations, batch)]
+    batches = list(zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes))))
+    return [(batches[i:i + per_job], kwargs) for i in range(0, len(batches), per_job)]
+
+def _aggregate(results):
+    stats = {'mse': OnlineStats(), 'sqnr_db': OnlineStats()}
+    for result in results:
+        for name, state in result.items():
+            stats[name].merge(OnlineStats(*state))
+    return stats
+
+def _run_jobs(job_lists, workers):
+    # Όλες οι εργασίες όλων των λιστών σε μία δεξαμενή διεργασιών
+    # (workers=1: σειριακά)· επιστρέφει τα στατιστικά ανά λίστα
+    jobs = [job for job_list in job_lists for job in job_list]
+    if workers == 1:
+        results = list(map(_run_job, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_job, jobs))
+    stats, start = [], 0
+    for job_list in job_lists:
+        stats.append(_aggregate(results[start:start + len(job_list)]))
+        start += len(job_list)
+    return stats
+
+def monte_carlo(n_realizations, seed=0, workers=None, job_size=None, **kwargs):
+    """
+    n_realizations υλοποιήσεις σε εργασίες των job_size (εξ ορισμού
+    n_realizations / (workers * JOBS_PER_WORKER)), παράλληλα (workers=1:
+    σειριακά). Επιστρέφει {'mse': OnlineStats, 'sqnr_db': OnlineStats}.
+    """
+    jobs = _make_jobs(n_realizations, seed, workers, job_size, kwargs)
+    return _run_jobs([jobs], workers)[0]
+
+def dither_study(dithers=DITHERS, n_bits_values=(4, 8, 12), n_realizations=2000,
+                 subtractive=False, seed=0, workers=None, level=0.95, job_size=None,
+                 **kwargs):
+    """
+    Monte Carlo για κάθε (dither, n_bits). Πίνακας mc_dtype με μέσους και
+    μισά πλάτη διαστημάτων εμπιστοσύνης 'level'. Κάθε συνδυασμός παίρνει
+    δικό του seed από το SeedSequence(seed)· οι εργασίες όλων των
+    συνδυασμών μοιράζονται μία δεξαμενή διεργασιών.
+    """
+    combos = [(d, n) for d in dithers for n in n_bits_values]
+    seeds = np.random.SeedSequence(seed).generate_state(len(combos))
+    result = np.zeros(len(combos), dtype=mc_dtype())
+    v_min, v_max = kwargs.get('v_min', -8), kwargs.get('v_max', 8)
+    job_lists = [_make_jobs(n_realizations, int(s), workers, job_size,
+                            dict(kwargs, dither=dither, n_bits=n_bits, subtractive=subtractive))
+                 for (dither, n_bits), s in zip(combos, seeds)]
+    for row, (dither, n_bits), stats in zip(result, combos, _run_jobs(job_lists, workers)):
+        delta = (v_max - v_min) / (1 << n_bits)
+        row['dither'], row['subtractive'], row['n_bits'] = dither, subtractive, n_bits
+        row['realizations'] = stats['mse'].n
+        row['mse'], row['mse_ci'] = stats['mse'].mean, stats['mse'].ci(level)
+        row['sqnr_db'], row['sqnr_ci'] = stats['sqnr_db'].mean, stats['sqnr_db'].ci(level)
+        row['mse_theory'] = mse_theory(dither, delta, subtractive)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo για κβάντιση του m(t) με dither.")
+    parser.add_argument('--realizations', type=int, default=2000)
+    parser.add_argument('--bits', type=int, nargs='*', default=[4, 8, 12])
+    parser.add_argument('--dither', choices=DITHERS, nargs='*', default=list(DITHERS))
+    parser.add_argument('--subtractive', action='store_true')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--scaling', action='store_true',
+                        help="χρόνος για 1, 2, 4, ... διεργασίες (έως os.cpu_count())")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    result = dither_study(args.dither, args.bits, args.realizations, args.subtractive,
+                          args.seed, args.workers)
+    total = time.perf_counter() - t0
+    print(f"{'dither':>6} {'bits':>4} {'MSE / θεωρία':>14} {'± 95%':>8} {'SQNR (dB)':>10} {'± 95%':>7}")
+    for r in result:
+        print(f"{r['dither']:>6} {r['n_bits']:>4} {r['mse'] / r['mse_theory']:>14.4f} "
+              f"{r['mse_ci'] / r['mse_theory']:>8.4f} {r['sqnr_db']:>10.2f} {r['sqnr_ci']:>7.3f}")
+    print(f"\n{len(result)} συνδυασμοί x {args.realizations} υλοποιήσεις σε {total:.1f} s")
+
+    if args.scaling:
+        n_cpu = os.cpu_count() or 1
+        counts = [w for w in (1, 2, 4, 8, 16, 32, 64) if w <= n_cpu]
+        base = None
+        for w in counts:
+            t0 = time.perf_counter()
+            monte_carlo(args.realizations, args.seed, w, dither='tri')
+            elapsed = time.perf_counter() - t0
+            base = base or elapsed
+            print(f"  {w:>3} διεργασίες: {elapsed:6.2f} s (επιτάχυνση x{base / elapsed:.2f})")
+
+if __name__ == "__main__":
+    main()
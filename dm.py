@@ -0,0 +1,249 @@
+import time
+
+import numpy as np
+
+# --- Γρήγορος κωδικοποιητής / αποκωδικοποιητής Delta Modulation ---
+#
+# Ο κωδικοποιητής είναι αναδρομή (κάθε απόφαση εξαρτάται από την προηγούμενη
+# έξοδο), οπότε τρέχει ως μεταγλωττισμένος βρόχος με numba όταν υπάρχει,
+# αλλιώς ως βρόχος Python πάνω σε λίστες float (χωρίς scalars του numpy).
+# Ο αποκωδικοποιητής είναι άθροισμα (np.cumsum), χωρίς βρόχο.
+#
+# Ισοδυναμία με το αρχικό simulate_dm: q[n] = q[n-1] + E * sign(x[n] - q[n-1])
+# με q[0] = x[0]. Οι αποφάσεις είναι -1, 0, +1 (0 μόνο όταν x[n] == q[n-1])
+# και το cumsum του numpy αθροίζει διαδοχικά, άρα η σκάλα βγαίνει ίδια bit
+# προς bit για πεπερασμένες τιμές εισόδου.
+
+def _encode_kernel(x, E, q, d):
+    for n in range(1, len(x)):
+        error = x[n] - q
+        if error > 0:
+            d[n] = 1
+            q += E
+        elif error < 0:
+            d[n] = -1
+            q -= E
+    return q
+
+try:
+    from numba import njit
+    _encode_kernel = njit(cache=True, nogil=True)(_encode_kernel)
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+def dm_encode(signal_samples, E_step):
+    """
+    Αποφάσεις DM (int8: -1, 0, +1) για το σήμα, με αρχική τιμή q[0] = x[0]
+    (d[0] = 0). Επιστρέφει (αποφάσεις, τελευταία τιμή της σκάλας).
+    """
+    x = np.ascontiguousarray(signal_samples, dtype=np.float64)
+    N = len(x)
+    if N == 0:
+        return np.zeros(0, dtype=np.int8), 0.0
+    E = float(E_step)
+    if HAVE_NUMBA:
+        d = np.zeros(N, dtype=np.int8)
+        q = _encode_kernel(x, E, x[0], d)
+    else:
+        d_list = [0] * N
+        q = _encode_kernel(x.tolist(), E, float(x[0]), d_list)
+        d = np.array(d_list, dtype=np.int8)
+    return d, q
+
+def dm_decode(decisions, E_step, q0, out=None):
+    """
+    Σκάλα DM από τις αποφάσεις: q[0] = q0, q[n] = q[n-1] + E * d[n].
+    """
+    d = np.asarray(decisions)
+    if out is None:
+        out = np.empty(len(d), dtype=np.float64)
+    if len(d) == 0:
+        return out
+    np.multiply(d, float(E_step), out=out)
+    out[0] = q0
+    return np.cumsum(out, out=out)
+
+def simulate_dm_fast(signal_samples, E_step):
+    """
+    Ίδια έξοδος με το simulate_dm (dsp.py), χωρίς βρόχο Python ανά δείγμα.
+    """
+    d, _ = dm_encode(signal_samples, E_step)
+    q0 = float(signal_samples[0]) if len(d) else 0.0
+    return dm_decode(d, E_step, q0)
+
+# --- Παράλληλη DM για πολλά βήματα E (σάρωση παραμέτρων) ---
+#
+# Η κατάσταση είναι διάνυσμα q (ένα ανά E) που προχωρά ένα δείγμα τη φορά.
+# Για κάθε δείγμα: υπερφόρτωση κλίσης όταν |x[n] - q[n-1]| > E (η σκάλα δεν
+# προλαβαίνει σε ένα βήμα), αλλιώς κοκκώδης θόρυβος. Το σφάλμα e = x - q
+# αθροίζεται στην αντίστοιχη κατηγορία, χωρίς να κρατιούνται οι σκάλες.
+
+def _sweep_kernel(x, E, q, granular, overload, n_over, stairs):
+    keep = stairs.shape[1] > 0
+    for n in range(1, len(x)):
+        for p in range(len(E)):
+            error = x[n] - q[p]
+            if error > 0:
+                q[p] += E[p]
+            elif error < 0:
+                q[p] -= E[p]
+            e = x[n] - q[p]
+            if abs(error) > E[p]:
+                overload[p] += e * e
+                n_over[p] += 1
+            else:
+                granular[p] += e * e
+            if keep:
+                stairs[p, n] = q[p]
+
+def _sweep_numpy(x, E, q, granular, overload, n_over, stairs):
+    # Χωρίς numba: βρόχος στα δείγματα, διανυσματικά σε όλα τα E
+    keep = stairs.shape[1] > 0
+    for n in range(1, len(x)):
+        error = x[n] - q
+        q += E * np.sign(error)
+        e2 = (x[n] - q) ** 2
+        over = np.abs(error) > E
+        overload += np.where(over, e2, 0.0)
+        granular += np.where(over, 0.0, e2)
+        n_over += over
+        if keep:
+            stairs[:, n] = q
+
+if HAVE_NUMBA:
+    _sweep_kernel = njit(cache=True, nogil=True)(_sweep_kernel)
+else:
+    _sweep_kernel = _sweep_numpy
+
+def dm_sweep_dtype():
+    """
+    Τύπος του δομημένου πίνακα αποτελεσμάτων (μία γραμμή ανά (fs, E)).
+    """
+    return np.dtype([('fs', 'f8'),                 # Ρυθμός δειγματοληψίας (Hz), 0 αν άγνωστος
+                     ('E', 'f8'),                  # Βήμα DM
+                     ('snr_db', 'f8'),             # 10 log10(ισχύς σήματος / ισχύς σφάλματος)
+                     ('noise_power', 'f8'),        # Μέση ισχύς σφάλματος x - q
+                     ('granular_power', 'f8'),     # Μέρος της από δείγματα χωρίς υπερφόρτωση
+                     ('overload_power', 'f8'),     # Μέρος της από δείγματα με υπερφόρτωση
+                     ('overload_fraction', 'f8')]) # Ποσοστό δειγμάτων με υπερφόρτωση
+
+def dm_sweep(signal_samples, E_values, fs=0.0, keep_staircase=False):
+    """
+    DM του ίδιου σήματος για όλα τα E_values σε ένα πέρασμα.
+
+    Επιστρέφει δομημένο πίνακα (βλ. dm_sweep_dtype) με τη σειρά των E_values
+    και, αν keep_staircase=True, και τις σκάλες σε πίνακα (len(E_values), N),
+    ίδιες bit προς bit με το simulate_dm για κάθε E.
+    """
+    x = np.ascontiguousarray(signal_samples, dtype=np.float64)
+    E = np.ascontiguousarray(E_values, dtype=np.float64).reshape(-1)
+    N, P = len(x), len(E)
+    granular = np.zeros(P)
+    overload = np.zeros(P)
+    n_over = np.zeros(P, dtype=np.int64)
+    stairs = np.empty((P, N if keep_staircase else 0))
+    if N:
+        q = np.full(P, x[0])
+        if keep_staircase:
+            stairs[:, 0] = x[0]
+        _sweep_kernel(x, E, q, granular, overload, n_over, stairs)
+
+    result = np.zeros(P, dtype=dm_sweep_dtype())
+    result['fs'] = fs
+    result['E'] = E
+    n = max(N, 1)
+    result['granular_power'] = granular / n
+    result['overload_power'] = overload / n
+    result['noise_power'] = (granular + overload) / n
+    result['overload_fraction'] = n_over / n
+    with np.errstate(divide='ignore'):
+        result['snr_db'] = 10 * np.log10(np.sum(x**2) / n / result['noise_power'])
+    if keep_staircase:
+        return result, stairs
+    return result
+
+def dm_grid(fs_values, E_values, T_duration, signal_fn, keep_staircase=False):
+    """
+    Σάρωση (fs, E): για κάθε fs δειγματοληψία του signal_fn στο [0, T_duration)
+    και dm_sweep για όλα τα E. Επιστρέφει τον δομημένο πίνακα (γραμμές ανά fs
+    και μέσα σε κάθε fs ανά E) και, αν keep_staircase=True, λεξικό {fs: σκάλες}.
+    """
+    results = []
+    stairs = {}
+    for fs in fs_values:
+        samples = signal_fn(np.arange(0, T_duration, 1/fs))
+        out = dm_sweep(samples, E_values, fs, keep_staircase)
+        if keep_staircase:
+            out, stairs[fs] = out
+        results.append(out)
+    result = np.concatenate(results)
+    if keep_staircase:
+        return result, stairs
+    return result
+
+# --- Έλεγχος ισοδυναμίας και benchmark ---
+if __name__ == "__main__":
+    from dsp import m
+
+    def simulate_dm_loop(signal_samples, E_step):
+        # Ο αρχικός βρόχος (αναφορά)
+        N = len(signal_samples)
+        m_quantized = np.zeros(N)
+        m_quantized[0] = signal_samples[0]
+        for n in range(1, N):
+            error = signal_samples[n] - m_quantized[n-1]
+            step = E_step * np.sign(error)
+            m_quantized[n] = m_quantized[n-1] + step
+        return m_quantized
+
+    print(f"numba: {'ναι' if HAVE_NUMBA else 'όχι (βρόχος Python)'}")
+    for fs, E in [(9600, 0.2), (9600, 1.0), (9600, 0.05), (9600, 3.5), (200000, 0.2)]:
+        x = m(np.arange(0, 0.02, 1/fs))
+        for dtype in [np.float64, np.float32]:
+            xs = x.astype(dtype)
+            same = np.array_equal(simulate_dm_fast(xs, E), simulate_dm_loop(xs, E))
+            print(f"fs={fs:>6}, E={E:<4}, {np.dtype(dtype).name}: ίδια bit προς bit: {same}")
+    # Είσοδος με ισότητες (error == 0): κβαντισμένο σήμα στο πλέγμα του E
+    x = np.round(m(np.arange(0, 0.02, 1/200000)) / 0.25) * 0.25
+    print(f"Είσοδος στο πλέγμα του E: ίδια bit προς bit: "
+          f"{np.array_equal(simulate_dm_fast(x, 0.25), simulate_dm_loop(x, 0.25))}")
+
+    # Throughput: 10 s στα 2 MHz (2e7 δείγματα)
+    fs = 2 * 10**6
+    x = m(np.arange(10 * fs) / fs)
+    n_ref = 10**5
+    t0 = time.perf_counter()
+    simulate_dm_loop(x[:n_ref], 0.05)
+    t_loop = (time.perf_counter() - t0) / n_ref
+    simulate_dm_fast(x[:1000], 0.05)  # μεταγλώττιση / cache του numba
+    t0 = time.perf_counter()
+    d, q_last = dm_encode(x, 0.05)
+    t_enc = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    dm_decode(d, 0.05, x[0])
+    t_dec = time.perf_counter() - t0
+    print(f"\n{len(x):.1e} δείγματα: βρόχος {1 / t_loop / 1e6:.2f} M/s, "
+          f"κωδικοποίηση {len(x) / t_enc / 1e6:.1f} M/s, "
+          f"αποκωδικοποίηση {len(x) / t_dec / 1e6:.1f} M/s")
+
+    # Σάρωση E: ένα πέρασμα για όλα τα E έναντι ενός simulate_dm_fast ανά E
+    x = m(np.arange(0, 0.02, 1/200000))
+    E_values = np.array([0.2, 1.0, 0.05, 3.5])
+    _, stairs = dm_sweep(x, E_values, keep_staircase=True)
+    same = all(np.array_equal(stairs[p], simulate_dm_fast(x, E)) for p, E in enumerate(E_values))
+    print(f"\nΣάρωση E: σκάλες ίδιες bit προς bit με simulate_dm: {same}")
+    E_values = np.logspace(-2, 1, 1000)
+    x = m(np.arange(0, 0.1, 1/200000))
+    t0 = time.perf_counter()
+    for E in E_values:
+        simulate_dm_fast(x, E)
+    t_each = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    stats = dm_sweep(x, E_values, 200000)
+    t_sweep = time.perf_counter() - t0
+    best = stats[np.argmax(stats['snr_db'])]
+    print(f"{len(E_values)} τιμές E x {len(x)} δείγματα: ένα-ένα {t_each:.2f} s, "
+          f"dm_sweep {t_sweep:.2f} s ({len(E_values) * len(x) / t_sweep / 1e6:.0f} M ενημερώσεις/s)")
+    print(f"Βέλτιστο E = {best['E']:.3f}: SNR {best['snr_db']:.1f} dB, "
+          f"υπερφόρτωση {best['overload_fraction']:.1%}")
@@ -0,0 +1,174 @@
+import os
+import time
+
+import numpy as np
+
+from dm import HAVE_NUMBA
+from filters import StreamingSOSFilter
+from spectrum_stream import read_chunks
+
+# --- DM σε ροή: πακεταρισμένα bits (8 αποφάσεις ανά byte) ---
+#
+# Ο κωδικοποιητής κρατά την τιμή της σκάλας q μεταξύ κομματιών και τα bits
+# που δεν συμπλήρωσαν byte. Ο αποκωδικοποιητής κρατά το q και την κατάσταση
+# (zi) του LPF ανάκτησης (SOS, filters.py), οπότε ένα οσοδήποτε μεγάλο σήμα κωδικοποιείται,
+# αποθηκεύεται και ανακτάται με σταθερή μνήμη: 1 bit ανά δείγμα αντί για
+# 64 (float64).
+#
+# Το bit είναι 1 αν x[n] >= q[n-1] (βήμα +E), αλλιώς 0 (βήμα -E). Σε
+# αντίθεση με το simulate_dm δεν υπάρχει μηδενικό βήμα όταν x[n] == q[n-1],
+# αφού κάθε απόφαση είναι ένα bit.
+
+def _encode_bits_kernel(x, E, q, bits):
+    for n in range(len(x)):
+        if x[n] >= q:
+            bits[n] = 1
+            q += E
+        else:
+            bits[n] = 0
+            q -= E
+    return q
+
+if HAVE_NUMBA:
+    from numba import njit
+    _encode_bits_kernel = njit(cache=True, nogil=True)(_encode_bits_kernel)
+
+class DMStreamEncoder:
+    """
+    Κωδικοποιητής DM σε ροή. encode(κομμάτι) -> bytes (np.uint8) έτοιμα για
+    αποθήκευση· flush() στο τέλος δίνει το τελευταίο, συμπληρωμένο με μηδενικά,
+    byte. n_bits μετράει τις αποφάσεις που έχουν κωδικοποιηθεί.
+    """
+
+    def __init__(self, E_step, q0=0.0):
+        self.E = float(E_step)
+        self.q = float(q0)
+        self.n_bits = 0
+        self._pending = np.zeros(0, dtype=np.uint8)
+
+    def encode(self, chunk):
+        x = np.ascontiguousarray(chunk, dtype=np.float64)
+        if HAVE_NUMBA:
+            bits = np.empty(len(x), dtype=np.uint8)
+            self.q = _encode_bits_kernel(x, self.E, self.q, bits)
+        else:
+            bit_list = [0] * len(x)
+            self.q = _encode_bits_kernel(x.tolist(), self.E, self.q, bit_list)
+            bits = np.array(bit_list, dtype=np.uint8)
+        self.n_bits += len(bits)
+        if len(self._pending):
+            bits = np.concatenate([self._pending, bits])
+        n_whole = len(bits) // 8 * 8
+        self._pending = bits[n_whole:]
+        return np.packbits(bits[:n_whole])
+
+    def flush(self):
+        packed = np.packbits(self._pending)
+        self._pending = np.zeros(0, dtype=np.uint8)
+        return packed
+
+class DMStreamDecoder:
+    """
+    Αποκωδικοποιητής DM σε ροή με ανάκτηση από Butterworth LPF (όπως το
+    recover_lpf του g2.py). decode(bytes) -> ανακτημένο κομμάτι (8 δείγματα
+    ανά byte)· με n_bits αγνοούνται τα bits συμπλήρωσης του τελευταίου byte.
+    Με keep_staircase=True επιστρέφεται (ανακτημένο, σκάλα).
+    """
+
+    def __init__(self, E_step, fs, q0=0.0, B_lpf=2000, order=5, keep_staircase=False):
+        self.E = float(E_step)
+        self.q = float(q0)
+        self.lpf = StreamingSOSFilter('butter', order, B_lpf, fs)
+        self.keep_staircase = keep_staircase
+        self.reset_filter(q0)
+
+    def reset_filter(self, level=0.0):
+        """
+        Κατάσταση LPF σαν να προηγούνταν σταθερό σήμα 'level' (0: όπως sosfilt χωρίς zi).
+        """
+        self.lpf.reset(level)
+
+    def decode(self, packed, n_bits=None):
+        bits = np.unpackbits(np.asarray(packed, dtype=np.uint8), count=n_bits)
+        steps = bits * (2 * self.E) - self.E
+        if len(steps):
+            steps[0] += self.q
+        staircase = np.cumsum(steps, out=steps)
+        if len(staircase):
+            self.q = staircase[-1]
+        recovered = self.lpf.process(staircase)
+        if self.keep_staircase:
+            return recovered, staircase
+        return recovered
+
+def dm_encode_to_file(sample_blocks, path, E_step, q0=0.0):
+    """
+    Κωδικοποιεί τα κομμάτια σε πακεταρισμένα bits στο αρχείο 'path'.
+    Επιστρέφει το πλήθος των bits (δειγμάτων).
+    """
+    encoder = DMStreamEncoder(E_step, q0)
+    with open(path, 'wb') as f:
+        for block in sample_blocks:
+            f.write(encoder.encode(block).tobytes())
+        f.write(encoder.flush().tobytes())
+    return encoder.n_bits
+
+def dm_decode_file(path, E_step, fs, n_bits=None, q0=0.0, chunk_bytes=1 << 16, **kwargs):
+    """
+    Ροή ανακτημένων κομματιών (8 * chunk_bytes δείγματα) από αρχείο του dm_encode_to_file.
+    n_bits: πλήθος δειγμάτων (για να αγνοηθεί η συμπλήρωση του τελευταίου byte).
+    """
+    decoder = DMStreamDecoder(E_step, fs, q0, **kwargs)
+    remaining = n_bits
+    for chunk in read_chunks(path, chunk_bytes, dtype=np.uint8):
+        count = None if remaining is None else min(remaining, 8 * len(chunk))
+        if count == 0:
+            break
+        yield decoder.decode(chunk, count)
+        if remaining is not None:
+            remaining -= count
+
+# --- Έλεγχος με LPF σε όλο το σήμα και throughput ---
+if __name__ == "__main__":
+    import tempfile
+    from dsp import m
+    from filters import lowpass
+    from tonebank import ToneBank, m_tones
+
+    fs, E = 200000, 0.2
+    x = m(np.arange(0, 0.02, 1/fs))
+    blocks = [x[i:i + 1234] for i in range(0, len(x), 1234)]
+    encoder = DMStreamEncoder(E)
+    packed = np.concatenate([encoder.encode(b) for b in blocks] + [encoder.flush()])
+    # Αναφορά: ίδια αναδρομή σε ένα κομμάτι και LPF σε όλο το σήμα
+    bits_ref = np.unpackbits(packed, count=len(x))
+    staircase_ref = np.cumsum(bits_ref * (2 * E) - E)
+    decoder = DMStreamDecoder(E, fs, keep_staircase=True)
+    parts = [decoder.decode(packed[i:i + 100], min(800, len(x) - 8 * i))
+             for i in range(0, len(packed), 100)]
+    recovered = np.concatenate([p[0] for p in parts])
+    staircase = np.concatenate([p[1] for p in parts])
+    print(f"{len(x)} δείγματα -> {len(packed)} bytes "
+          f"(float64: {x.nbytes} bytes, λόγος 1/{x.nbytes / len(packed):.0f})")
+    print(f"max |σκάλα ροής - cumsum| = {np.max(np.abs(staircase - staircase_ref)):.1e}, "
+          f"max |LPF ροής - LPF| = {np.max(np.abs(recovered - lowpass(staircase_ref, 2000, fs))):.1e}")
+
+    # 60 s στα 2 MHz (1.2e8 δείγματα, 0.96 GB σε float64) -> αρχείο 15 MB
+    fs = 2 * 10**6
+    n_total = 60 * fs
+    bank = ToneBank(*m_tones(), fs, block_size=1 << 16)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "m.dm")
+        t0 = time.perf_counter()
+        n_bits = dm_encode_to_file(bank.blocks(n_total, reuse_buffer=True), path, 0.02)
+        t_enc = time.perf_counter() - t0
+        size = os.path.getsize(path)
+        t0 = time.perf_counter()
+        energy = 0.0
+        for chunk in dm_decode_file(path, 0.02, fs, n_bits):
+            energy += np.dot(chunk, chunk)
+        t_dec = time.perf_counter() - t0
+    print(f"{n_bits:.1e} δείγματα: αρχείο {size / 2**20:.1f} MB, "
+          f"σύνθεση + κωδικοποίηση {n_bits / t_enc / 1e6:.1f} M/s, "
+          f"αποκωδικοποίηση + LPF {n_bits / t_dec / 1e6:.1f} M/s, "
+          f"ισχύς ανακτημένου {energy / n_bits:.2f} (m(t): 7.00)")
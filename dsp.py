@@ -0,0 +1,186 @@
+import functools
+import numpy as np
+from scipy.fft import fft, ifft, rfft, fftshift, fftfreq, rfftfreq
+from scipy.signal import get_window
+
+from dm import simulate_dm_fast
+from reconstruct_stream import stream_lpf_reconstruct
+
+# --- Κοινές συναρτήσεις DSP για τις ασκήσεις 5.8-x (g1.py, g2.py, g3.py) ---
+
+# Παράμετροι σήματος
+f1 = 400   # Hz
+f2 = 800   # Hz
+f3 = 1200  # Hz
+f_max = 1200 # Hz
+
+# Συνάρτηση ορισμού σήματος
+def m(t):
+    return 2 * np.cos(2 * np.pi * f1 * t) + \
+           np.cos(2 * np.pi * f2 * t) - \
+           3 * np.sin(2 * np.pi * f3 * t)
+
+@functools.lru_cache(maxsize=128)
+def spectrum_axes(N, fs, window=None, onesided=False, dtype=np.float64):
+    """
+    Άξονας συχνοτήτων και παράθυρο για FFT μήκους N, με cache ανά
+    (N, fs, window). Οι πίνακες είναι μόνο για ανάγνωση γιατί μοιράζονται.
+    """
+    dtype = np.dtype(dtype)
+    if onesided:
+        freq_axis = rfftfreq(N, 1/fs)
+    else:
+        freq_axis = fftshift(fftfreq(N, 1/fs))
+    freq_axis = freq_axis.astype(dtype)
+    freq_axis.setflags(write=False)
+    win = None
+    if window is not None:
+        win = get_window(window, N).astype(dtype)
+        win.setflags(write=False)
+    return freq_axis, win
+
+# Συνάρτηση για υπολογισμό FFT
+def get_spectrum(signal, fs, onesided=False, window=None):
+    """
+    Φάσμα πλάτους κατά τον τελευταίο άξονα (δέχεται και 2-D πίνακα, ίδιο fs).
+
+    Προεπιλογή: δίπλευρο φάσμα κεντραρισμένο στο 0 (fft + fftshift).
+    Με onesided=True χρησιμοποιείται rfft και επιστρέφονται μόνο οι
+    συχνότητες f >= 0 (ίδιες τιμές με το δίπλευρο, μισή μνήμη και χρόνος).
+    Το window είναι όνομα για το scipy.signal.get_window (π.χ. 'hann').
+    Είσοδος float32 δίνει float32 άξονα και μέτρο.
+    """
+    signal = np.asarray(signal)
+    N = signal.shape[-1]
+    dtype = np.float32 if signal.dtype == np.float32 else np.float64
+    freq_axis, win = spectrum_axes(N, float(fs), window, onesided, dtype)
+    if win is not None:
+        signal = signal * win
+    # Χρησιμοποιούμε norm='ortho' για να διατηρείται η ισχύς
+    if onesided:
+        M_f = rfft(signal, n=N, axis=-1, norm='ortho')
+    else:
+        M_f = fftshift(fft(signal, n=N, axis=-1, norm='ortho'), axes=-1)
+    return freq_axis, np.abs(M_f)
+
+# Συνάρτηση για ιδανική ανακατασκευή LPF
+def ideal_lpf_reconstruct(signal_samples, t_samples, t_target, fs_sample, block_size=None):
+    """
+    Ιδανική ανακατασκευή (LPF στο fs_sample/2) με παρεμβολή στο πεδίο της
+    συχνότητας: το φάσμα των N δειγμάτων τοποθετείται σε φάσμα μήκους
+    len(t_target) με μηδενικά στις υψηλές συχνότητες (zero-insertion).
+    Το t_target θεωρείται ομοιόμορφο πλέγμα στην ίδια διάρκεια N/fs_sample
+    με τα δείγματα. Δέχεται και 2-D πίνακα (ένα σήμα ανά γραμμή).
+
+    Με block_size η ανακατασκευή γίνεται σε ροή (reconstruct_stream.py,
+    windowed-sinc με overlap-save): απαιτεί ακέραιο λόγο len(t_target) / N
+    και διαφέρει από την FFT μόνο κοντά στις άκρες. Σε 2-D πίνακα κάθε
+    γραμμή ανακατασκευάζεται χωριστά.
+    """
+    N = np.shape(signal_samples)[-1]
+    N_pad = len(t_target)
+    if block_size is not None:
+        fs_out = fs_sample * N_pad / N
+
+        def stream(row):
+            blocks = (row[i:i + block_size] for i in range(0, N, block_size))
+            return np.concatenate(list(stream_lpf_reconstruct(blocks, fs_sample, fs_out,
+                                                              block_size=block_size)))
+
+        signal_samples = np.asarray(signal_samples)
+        if signal_samples.ndim == 1:
+            return stream(signal_samples)
+        # Η ροή είναι μονοδιάστατη: κάθε γραμμή χωριστά κατά τον τελευταίο άξονα
+        rows = [stream(row) for row in signal_samples.reshape(-1, N)]
+        return np.stack(rows).reshape(signal_samples.shape[:-1] + (-1,))
+    if N_pad < N:
+        raise ValueError("Το t_target πρέπει να έχει τουλάχιστον όσα σημεία και τα δείγματα")
+
+    # Μετασχηματισμός Fourier των δειγμάτων (μία περίοδος του fs_sample)
+    M_f = fft(signal_samples, axis=-1)
+
+    # Εφαρμογή Ιδανικού LPF: οι N συχνότητες |f| <= fs_sample/2 κρατιούνται,
+    # οι υπόλοιπες N_pad - N θέσεις μένουν μηδέν
+    n_pos = (N + 1) // 2  # DC και θετικές συχνότητες
+    M_pad = np.zeros(np.shape(M_f)[:-1] + (N_pad,), dtype=M_f.dtype)
+    M_pad[..., :n_pos] = M_f[..., :n_pos]
+    M_pad[..., N_pad - (N - n_pos):] = M_f[..., n_pos:]
+    if N % 2 == 0 and N_pad > N:
+        # Η συχνότητα Nyquist μοιράζεται εξίσου στα +fs/2 και -fs/2
+        M_pad[..., N // 2] = M_f[..., N // 2] / 2
+        M_pad[..., N_pad - N // 2] = M_f[..., N // 2] / 2
+
+    # Αντίστροφος FFT για ανακατασκευή
+    # Πολλαπλασιάζουμε με N_pad / N για σωστή κλιμάκωση
+    scaling_factor = N_pad / N
+    m_recon = ifft(M_pad, axis=-1) * scaling_factor
+
+    # Επιστροφή μόνο του πραγματικού μέρους
+    return np.real(m_recon)
+
+# Συνάρτηση Ομοιόμορφου Κβαντιστή (5.8-2)
+def quantize_uniform(signal, L, v_min, v_max, out=None):
+    """
+    Κβαντίζει ένα σήμα 'signal' σε L επίπεδα,
+    στη δυναμική περιοχή [v_min, v_max].
+
+    Όλα τα βήματα γίνονται μέσα στο 'out' (χωρίς ενδιάμεσους πίνακες)· το
+    out μπορεί να είναι και το ίδιο το signal (κβάντιση επί τόπου).
+    Για τους ακέραιους κωδικούς βλ. quantizer.UniformQuantizer.
+    """
+    delta = (v_max - v_min) / L
+    if out is None:
+        out = np.empty(np.shape(signal), dtype=np.result_type(np.asarray(signal).dtype, 1.0))
+
+    # 1. Μετατόπιση στην περιοχή [0, L*delta]
+    np.subtract(signal, v_min, out=out)
+
+    # 2. Εύρεση του "δείκτη" επιπέδου (0 έως L-1)
+    np.divide(out, delta, out=out)
+    np.floor(out, out=out)
+
+    # 3. Περιορισμός (clipping) στις άκρες [0, L-1]
+    np.clip(out, 0, L - 1, out=out)
+
+    # 4. Υπολογισμός κβαντισμένης τιμής (κέντρο του επιπέδου)
+    out += 0.5
+    out *= delta
+    out += v_min
+    return out
+
+# Delta Modulation (5.8-3)
+def simulate_dm(signal_samples, E_step):
+    """
+    Προσομοιώνει τον αλγόριθμο Delta Modulation (DM).
+    q[0] = x[0], q[n] = q[n-1] + E * sign(x[n] - q[n-1]).
+    Ο βρόχος ανά δείγμα τρέχει στο dm.py (numba αν υπάρχει).
+    """
+    return simulate_dm_fast(signal_samples, E_step)
+
+# --- Micro-benchmark: δίπλευρο fft vs rfft με cache αξόνων ---
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+
+    def measure(fn, repeats):
+        fn()  # ζέσταμα (γεμίζει και την cache)
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        for _ in range(repeats):
+            fn()
+        dt = (time.perf_counter() - t0) / repeats
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return dt, peak
+
+    fs = 50 * f_max
+    print(f"{'N':>10} {'dtype':>8} {'fft (ms)':>10} {'rfft (ms)':>10} {'x':>6} "
+          f"{'fft (MB)':>9} {'rfft (MB)':>10}")
+    for N in [10**3, 10**4, 10**5, 10**6, 10**7]:
+        repeats = max(1, 10**6 // N)
+        for dtype in [np.float64, np.float32]:
+            x = m(np.arange(N) / fs).astype(dtype)
+            t_full, mem_full = measure(lambda: get_spectrum(x, fs), repeats)
+            t_half, mem_half = measure(lambda: get_spectrum(x, fs, onesided=True), repeats)
+            print(f"{N:>10} {np.dtype(dtype).name:>8} {t_full * 1e3:>10.3f} {t_half * 1e3:>10.3f} "
+                  f"{t_full / t_half:>6.1f} {mem_full / 2**20:>9.1f} {mem_half / 2**20:>10.1f}")
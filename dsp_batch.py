@@ -0,0 +1,106 @@
+import matplotlib
+matplotlib.use('Agg')  # Χωρίς παράθυρα: πρέπει να προηγείται κάθε import του pyplot
+
+import argparse
+import contextlib
+import importlib
+import io
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib.pyplot as plt
+
+# --- Μαζική (headless) εκτέλεση των g1.py, g2.py, g3.py ---
+#
+# Κάθε script ορίζει PARTS = {όνομα: συνάρτηση} και κάθε συνάρτηση επιστρέφει
+# τα σχήματά της. Εδώ κάθε μέρος είναι ανεξάρτητη εργασία σε process pool.
+
+SCRIPTS = ('g1', 'g2', 'g3')
+
+def list_jobs(scripts=SCRIPTS):
+    """
+    Όλες οι εργασίες (script, μέρος) με τη σειρά εμφάνισης.
+    """
+    jobs = []
+    for script in scripts:
+        module = importlib.import_module(script)
+        jobs.extend((script, part) for part in module.PARTS)
+    return jobs
+
+def run_job(job, output_dir, dpi=150):
+    """
+    Εκτελεί ένα μέρος και αποθηκεύει τα σχήματά του.
+    Επιστρέφει (job, αρχεία, χρόνος, έξοδος print, σφάλμα ή None).
+    """
+    script, part = job
+    log = io.StringIO()
+    paths = []
+    error = None
+    t0 = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(log):
+            module = importlib.import_module(script)
+            figures = module.PARTS[part]()
+        for i, fig in enumerate(figures):
+            suffix = f"_{i + 1}" if len(figures) > 1 else ""
+            path = os.path.join(output_dir, f"{script}_{part}{suffix}.png")
+            fig.savefig(path, dpi=dpi)
+            plt.close(fig)
+            paths.append(path)
+    except Exception:
+        error = traceback.format_exc()
+    return job, paths, time.perf_counter() - t0, log.getvalue(), error
+
+def run_batch(jobs, output_dir="dsp_figures", workers=None, dpi=150):
+    """
+    Εκτελεί τις εργασίες σε process pool (workers=1: σειριακά, στην ίδια διεργασία).
+    Επιστρέφει τα αποτελέσματα του run_job με τη σειρά των jobs.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if workers == 1:
+        return [run_job(job, output_dir, dpi) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_job, job, output_dir, dpi) for job in jobs]
+        return [f.result() for f in futures]
+
+def main():
+    parser = argparse.ArgumentParser(description="Παραγωγή όλων των σχημάτων DSP (g1/g2/g3) σε αρχεία.")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="πλήθος διεργασιών (προεπιλογή: όλοι οι πυρήνες)")
+    parser.add_argument('--output-dir', default="dsp_figures")
+    parser.add_argument('--dpi', type=int, default=150)
+    parser.add_argument('--only', nargs='*', default=None,
+                        help="π.χ. g1 ή g1:c (script ή script:μέρος)")
+    parser.add_argument('--verbose', action='store_true', help="εμφάνιση της εξόδου κάθε μέρους")
+    args = parser.parse_args()
+
+    jobs = list_jobs()
+    if args.only:
+        jobs = [(s, p) for s, p in jobs if s in args.only or f"{s}:{p}" in args.only]
+
+    t0 = time.perf_counter()
+    results = run_batch(jobs, args.output_dir, args.workers, args.dpi)
+    total = time.perf_counter() - t0
+
+    print(f"{'Εργασία':<16} {'Χρόνος (s)':>10}  Αρχεία")
+    n_failed = 0
+    for (script, part), paths, wall, log, error in results:
+        status = ", ".join(os.path.basename(p) for p in paths)
+        if error:
+            n_failed += 1
+            status = "ΣΦΑΛΜΑ"
+        print(f"{script + ':' + part:<16} {wall:>10.2f}  {status}")
+        if args.verbose and log.strip():
+            print(log.rstrip())
+        if error:
+            print(error.rstrip())
+    cpu = sum(r[2] for r in results)
+    print(f"\nΣύνολο: {total:.2f} s (άθροισμα εργασιών {cpu:.2f} s), "
+          f"{len(results) - n_failed}/{len(results)} επιτυχείς")
+    print(f"Τα σχήματα βρίσκονται στον φάκελο '{os.path.abspath(args.output_dir)}'")
+    return 1 if n_failed else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,152 @@
+import functools
+import time
+
+import numpy as np
+from scipy.fft import rfft, irfft, rfftfreq, fftshift, fftfreq
+from scipy.signal import firwin2, lfilter
+
+# --- Equalizer για ανακατασκευή με ZOH / FOH (και holds ανώτερης τάξης) ---
+
+def hold_response(freqs, fs_sample, fs_cont, order=0):
+    """
+    Απόκριση συχνότητας του hold τάξης 'order' (0 = ZOH, 1 = FOH, ...) όπως
+    εμφανίζεται στο σήμα fs_cont σε σχέση με το αρχικό.
+
+    Για ακέραιο λόγο L = fs_cont / fs_sample χρησιμοποιείται η ακριβής
+    διακριτή μορφή (L σταθερά δείγματα ανά περίοδο): sinc(f*Ts) / sinc(f/fs_cont),
+    αλλιώς η συνεχής sinc(f*Ts). Οι άρτιες τάξεις (ZOH) έχουν καθυστέρηση μισής
+    περιόδου, οι περιττές (FOH = γραμμική παρεμβολή) είναι κεντραρισμένες.
+    """
+    Ts = 1 / fs_sample
+    ratio = fs_cont / fs_sample
+    exact = abs(ratio - round(ratio)) < 1e-9 * ratio
+    dt = 1 / fs_cont if exact else 0.0
+    H = np.sinc(freqs * Ts)
+    if exact:
+        H = H / np.sinc(freqs * dt)
+    H = H**(order + 1)
+    if order % 2 == 0:
+        H = H * np.exp(-1j * np.pi * freqs * (Ts - dt))
+    return H
+
+class HoldEqualizer:
+    """
+    Equalizer (inverse sinc + ιδανικό LPF στο fs_sample/2) για σήματα
+    ZOH/FOH μήκους N στο fs_cont. Σχεδιάζεται μία φορά (βλ. get_equalizer)
+    και εφαρμόζεται με rfft/irfft χωρίς fftshift, και σε 2-D πίνακα.
+    """
+
+    def __init__(self, fs_sample, fs_cont, N, order=0):
+        self.fs_sample = fs_sample
+        self.fs_cont = fs_cont
+        self.N = N
+        self.order = order
+        self.freqs = rfftfreq(N, 1/fs_cont)
+        self.H_hold = hold_response(self.freqs, fs_sample, fs_cont, order)
+        H_lpf = np.abs(self.freqs) <= fs_sample / 2
+        # Μέσα στη ζώνη |f| <= fs/2 το |H_hold| >= (2/pi)^(order+1), δεν χρειάζεται epsilon
+        self.H_eq = np.zeros_like(self.H_hold)
+        self.H_eq[H_lpf] = 1 / self.H_hold[H_lpf]
+        self.H_eq.setflags(write=False)
+
+    def apply(self, signals):
+        """
+        Εξισορρόπηση ενός σήματος ή πίνακα σημάτων (ένα ανά γραμμή) με ένα πέρασμα FFT.
+        """
+        M_f = rfft(signals, n=self.N, axis=-1)
+        return irfft(M_f * self.H_eq, n=self.N, axis=-1)
+
+    def two_sided(self):
+        """
+        Άξονας συχνοτήτων και αποκρίσεις σε δίπλευρη μορφή (για γραφικές).
+        """
+        freqs = fftshift(fftfreq(self.N, 1/self.fs_cont))
+        H_hold = hold_response(freqs, self.fs_sample, self.fs_cont, self.order)
+        H_eq = np.where(np.abs(freqs) <= self.fs_sample / 2, 1 / H_hold, 0)
+        return freqs, H_hold, H_eq
+
+    def fir(self, numtaps=101, transition=0.3):
+        """
+        Ισοδύναμο σύντομο FIR (γραμμικής φάσης) για χρήση σε ροή.
+
+        Διορθώνει μόνο το μέτρο (1 / |H_hold|) έως fs_sample/2 και αποκόπτει
+        μετά από fs_sample/2 * (1 + transition). Επιστρέφει (taps, delay), όπου
+        delay η συνολική καθυστέρηση σε δείγματα fs_cont (FIR + hold).
+        """
+        f_pass = self.fs_sample / 2
+        f_stop = min(f_pass * (1 + transition), self.fs_cont / 2)
+        grid = np.linspace(0, f_pass, 64)
+        gains = 1 / np.abs(hold_response(grid, self.fs_sample, self.fs_cont, self.order))
+        freq_pts = np.concatenate([grid, [f_stop, self.fs_cont / 2]])
+        gain_pts = np.concatenate([gains, [0, 0]])
+        taps = firwin2(numtaps, freq_pts, gain_pts, fs=self.fs_cont)
+        delay = (numtaps - 1) / 2
+        if self.order % 2 == 0:
+            delay += (self.fs_cont / self.fs_sample - 1) / 2
+        return taps, delay
+
+class StreamingFIR:
+    """
+    Εφαρμογή FIR σε κομμάτια με μεταφορά της κατάστασης (zi) του lfilter.
+    """
+
+    def __init__(self, taps):
+        self.taps = np.asarray(taps)
+        self.zi = np.zeros(len(self.taps) - 1)
+
+    def process(self, chunk):
+        out, self.zi = lfilter(self.taps, 1.0, chunk, zi=self.zi)
+        return out
+
+@functools.lru_cache(maxsize=32)
+def get_equalizer(fs_sample, fs_cont, N, order=0):
+    """
+    Επιστρέφει (από cache) τον HoldEqualizer για (fs_sample, fs_cont, N, order).
+    """
+    return HoldEqualizer(fs_sample, fs_cont, N, order)
+
+# --- Σύγκριση: ένας equalizer για πολλά κβαντισμένα σήματα ---
+if __name__ == "__main__":
+    from scipy.interpolate import interp1d
+    from dsp import m, f_max
+
+    T_duration = 0.02
+    fs_cont = 50 * f_max
+    fs1 = 4000
+    t_cont = np.linspace(0, T_duration, int(fs_cont * T_duration), endpoint=False)
+    t_samp1 = np.arange(0, T_duration, 1/fs1)
+    m_cont = m(t_cont)
+
+    # Το σήμα είναι περιοδικό στα T_duration: κλείνουμε την περίοδο με το
+    # πρώτο δείγμα ώστε η FOH να μη χρειάζεται παρέκταση στο τέλος
+    t_wrap = np.append(t_samp1, T_duration)
+    m_wrap = m(t_wrap)
+    for order, kind in [(0, 'previous'), (1, 'linear')]:
+        hold = interp1d(t_wrap, m_wrap, kind=kind)(t_cont)
+        eq = get_equalizer(fs1, fs_cont, len(t_cont), order)
+        mse_fft = np.mean((eq.apply(hold) - m_cont)**2)
+
+        taps, delay = eq.fir(numtaps=151)
+        fir = StreamingFIR(taps)
+        # Περιοδικό σήμα: επαναλαμβάνουμε την περίοδο ώστε να φύγει το μεταβατικό
+        out = np.concatenate([fir.process(c) for c in np.split(np.tile(hold, 4), 8)])
+        shift = int(round(delay))
+        mse_fir = np.mean((out[len(hold) + shift:2 * len(hold) + shift] - m_cont)**2)
+        print(f"order={order}: MSE FFT = {mse_fft:.2e}, MSE FIR ({len(taps)} taps) = {mse_fir:.2e}")
+
+    # Πολλά σήματα με τον ίδιο σχεδιασμό: επανασχεδιασμός ανά σήμα vs cache + 2-D
+    n_signals = 2000
+    rng = np.random.default_rng(0)
+    batch = np.repeat(interp1d(t_samp1, m(t_samp1), kind='previous',
+                               fill_value='extrapolate')(t_cont)[None, :], n_signals, axis=0)
+    batch += rng.uniform(-0.375, 0.375, batch.shape)
+
+    t0 = time.perf_counter()
+    for row in batch:
+        HoldEqualizer(fs1, fs_cont, len(t_cont), 0).apply(row)
+    t_loop = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    get_equalizer(fs1, fs_cont, len(t_cont), 0).apply(batch)
+    t_batch = time.perf_counter() - t0
+    print(f"{n_signals} σήματα: σχεδιασμός ανά σήμα {t_loop:.3f} s, "
+          f"cache + 2-D {t_batch:.3f} s (x{t_loop / t_batch:.0f})")
@@ -0,0 +1,107 @@
+import functools
+import time
+
+import numpy as np
+from scipy.signal import iirfilter, sosfilt, sosfilt_zi, sosfiltfilt
+
+# --- Φίλτρα IIR σε μορφή SOS με cache σχεδιασμών ---
+#
+# Η μορφή (b, a) ενός Butterworth 5ης τάξης στα 2000 Hz με fs = 200 kHz έχει
+# πόλους πολύ κοντά στο 1 και οι συντελεστές του χάνουν ακρίβεια· σε
+# μεγαλύτερους λόγους fs / cutoff ή τάξεις το lfilter γίνεται ασταθές.
+# Τα δεύτερης τάξης τμήματα (SOS) δεν έχουν αυτό το πρόβλημα. Ο σχεδιασμός
+# γίνεται μία φορά ανά (οικογένεια, τάξη, αποκοπή, fs) και ξαναχρησιμοποιείται.
+
+FAMILIES = ('butter', 'cheby1', 'cheby2', 'ellip', 'bessel')
+
+@functools.lru_cache(maxsize=64)
+def get_sos(family, order, cutoff, fs, btype='low', rp=1.0, rs=60.0):
+    """
+    Συντελεστές SOS για το φίλτρο 'family' τάξης 'order'
+    με αποκοπή 'cutoff' Hz (ή (f1, f2) για ζωνοπερατά) σε ρυθμό fs.
+    rp / rs: κυμάτωση ζώνης διέλευσης / εξασθένηση αποκοπής σε dB (cheby, ellip).
+    Ο πίνακας είναι κοινός για όλες τις κλήσεις και δεν πρέπει να τροποποιείται
+    (το sosfilt θέλει εγγράψιμο buffer, οπότε δεν σημαίνεται read-only).
+    """
+    if family not in FAMILIES:
+        raise ValueError(f"Άγνωστη οικογένεια '{family}', επιλογές: {FAMILIES}")
+    return iirfilter(order, cutoff, rp=rp, rs=rs, btype=btype, ftype=family, fs=fs, output='sos')
+
+def lowpass(signal, cutoff, fs, order=5, family='butter', zero_phase=False, axis=-1):
+    """
+    Χαμηλοπερατό φιλτράρισμα με cached SOS. Με zero_phase=True μπρος-πίσω
+    (sosfiltfilt, χωρίς καθυστέρηση φάσης). Δέχεται πολλά σήματα μαζί
+    (π.χ. σκάλες DM σε γραμμές ενός 2-D πίνακα).
+    """
+    sos = get_sos(family, order, cutoff, fs)
+    if zero_phase:
+        return sosfiltfilt(sos, signal, axis=axis)
+    return sosfilt(sos, signal, axis=axis)
+
+class StreamingSOSFilter:
+    """
+    Αιτιατό φίλτρο SOS σε ροή: process(κομμάτι) κρατά την κατάσταση (zi)
+    μεταξύ κομματιών, οπότε η έξοδος είναι ίδια με ένα sosfilt σε όλο το σήμα.
+    Με n_channels > 0 φιλτράρει πίνακες (n_channels, N) κατά γραμμές.
+    """
+
+    def __init__(self, family, order, cutoff, fs, btype='low', n_channels=0, **kwargs):
+        self.sos = get_sos(family, order, cutoff, fs, btype, **kwargs)
+        self.n_channels = n_channels
+        self.reset()
+
+    def reset(self, level=0.0):
+        """
+        Κατάσταση σαν να προηγούνταν σταθερό σήμα 'level' (0: όπως sosfilt χωρίς zi).
+        """
+        zi = sosfilt_zi(self.sos)
+        if self.n_channels:
+            zi = np.repeat(zi[:, None, :], self.n_channels, axis=1)
+            level = np.reshape(level, (1, -1, 1)) if np.ndim(level) else level
+        else:
+            level = np.reshape(level, (1, 1)) if np.ndim(level) else level
+        self.zi = zi * level
+
+    def process(self, chunk):
+        out, self.zi = sosfilt(self.sos, chunk, axis=-1, zi=self.zi)
+        return out
+
+# --- Σύγκριση (b, a) / SOS και χρόνος σχεδιασμού ---
+if __name__ == "__main__":
+    from scipy.signal import butter, lfilter
+    from dm import dm_sweep
+    from dsp import m
+
+    fs = 200000
+    t = np.arange(0, 0.02, 1/fs)
+    x = m(t)
+    print(f"{'τάξη':>5} {'fs / fc':>8} {'max|lfilter - sosfilt|':>24}")
+    for order, cutoff in [(5, 2000), (8, 2000), (10, 500)]:
+        b, a = butter(order, cutoff / (fs / 2))
+        y_ba = lfilter(b, a, x)
+        y_sos = lowpass(x, cutoff, fs, order)
+        print(f"{order:>5} {fs / cutoff:>8.0f} {np.max(np.abs(y_ba - y_sos)):>24.1e}")
+
+    # Πολλές ανακτήσεις DM με τον ίδιο σχεδιασμό: σχεδιασμός ανά κλήση έναντι cache
+    E_values = np.linspace(0.1, 0.3, 200)
+    _, stairs = dm_sweep(x, E_values, keep_staircase=True)
+    t0 = time.perf_counter()
+    for s in stairs:
+        b, a = butter(5, 2000 / (fs / 2))
+        lfilter(b, a, s)
+    t_ba = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for s in stairs:
+        lowpass(s, 2000, fs)
+    t_each = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    lowpass(stairs, 2000, fs)
+    t_batch = time.perf_counter() - t0
+    print(f"\n{len(stairs)} σκάλες DM: butter + lfilter {t_ba * 1e3:.1f} ms, "
+          f"cached SOS ανά σκάλα {t_each * 1e3:.1f} ms, cached SOS σε 2-D {t_batch * 1e3:.1f} ms")
+
+    # Ροή: ίδια έξοδος με ένα sosfilt
+    filt = StreamingSOSFilter('butter', 5, 2000, fs, n_channels=len(stairs))
+    y_stream = np.concatenate([filt.process(stairs[:, i:i + 333])
+                               for i in range(0, stairs.shape[1], 333)], axis=1)
+    print(f"Ροή σε κομμάτια: max |διαφορά| = {np.max(np.abs(y_stream - lowpass(stairs, 2000, fs))):.1e}")
@@ -1,35 +1,14 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-# --- 1. Ορισμός Σήματος και Συναρτήσης DM ---
+from adm import DEFAULT_PARAMS, adm_sweep, snr_vs_bitrate
+from dm import dm_grid
+from dsp import m, simulate_dm
+from filters import lowpass
 
-f1 = 400; f2 = 800; f3 = 1200;
-def m(t):
-    return 2 * np.cos(2 * np.pi * f1 * t) + \
-           np.cos(2 * np.pi * f2 * t) - \
-           3 * np.sin(2 * np.pi * f3 * t)
+# --- 1. Ορισμός Σήματος και Συναρτήσης DM ---
 
-def simulate_dm(signal_samples, E_step):
-    """
-    Προσομοιώνει τον αλγόριθμο Delta Modulation (DM).
-    """
-    N = len(signal_samples)
-    m_quantized = np.zeros(N) # Η έξοδος "σκάλα"
-    
-    # Αρχικοποίηση (μπορεί να είναι 0 ή η πρώτη τιμή)
-    m_quantized[0] = signal_samples[0] 
-    
-    for n in range(1, N):
-        # 1. Βρίσκουμε τη διαφορά
-        error = signal_samples[n] - m_quantized[n-1]
-        
-        # 2. Κβάντιση 1-bit
-        step = E_step * np.sign(error)
-        
-        # 3. Συσσώρευση
-        m_quantized[n] = m_quantized[n-1] + step
-        
-    return m_quantized
+# (Τα m(t) και simulate_dm ορίζονται στο dsp.py)
 
 # --- 2. Δημιουργία Δειγμάτων για DM ---
 # Η DM απαιτεί τα δικά της δείγματα, δεν χρησιμοποιεί τα m_samp1
@@ -41,114 +20,211 @@ Ts_a = 1/fs_a
 t_dm_a = np.arange(0, T_duration, Ts_a)
 m_dm_a = m(t_dm_a) # Αρχικό σήμα δειγματοληπτημένο στα 9600 Hz
 
+# (c) Στρατηγική 2: Oversampling στα 200 kHz
+fs_c2 = 200000
+Ts_c2 = 1/fs_c2
+t_dm_c2 = np.arange(0, T_duration, Ts_c2)
+m_dm_c2 = m(t_dm_c2) # Νέα δειγματοληψία
+E_c2 = 0.2
+
 # --- (a) fs = 9600 Hz, E = 0.2 (Slope Overload) ---
 
-print("\n--- Άσκηση 5.8-3: Delta Modulation ---")
-E_a = 0.2
-m_q_a = simulate_dm(m_dm_a, E_a)
-max_slope_signal = 32671
-max_slope_dm_a = E_a * fs_a
-print(f"(a) fs={fs_a} Hz, E={E_a}")
-print(f"Max Signal Slope: ~{max_slope_signal:.0f} V/s")
-print(f"Max DM Slope: {max_slope_dm_a:.0f} V/s")
-print("-> Slope Overload: YES")
-
-plt.figure(figsize=(14, 6))
-plt.plot(t_dm_a, m_dm_a, 'b-', label='Αρχικό $m(t)$ @ 9600 Hz')
-plt.plot(t_dm_a, m_q_a, 'r-', label=f'DM Έξοδος $m_q[n]$ (E={E_a})')
-plt.title('(a) DM με Σοβαρή Υπερφόρτωση Κλίσης (Slope Overload)')
-plt.xlabel('Χρόνος (s)')
-plt.ylabel('Πλάτος')
-plt.legend()
-plt.grid(True)
-plt.show()
+def part_a():
+    """
+    DM με E = 0.2 στα 9600 Hz (υπερφόρτωση κλίσης).
+    """
+    print("\n--- Άσκηση 5.8-3: Delta Modulation ---")
+    E_a = 0.2
+    m_q_a = simulate_dm(m_dm_a, E_a)
+    max_slope_signal = 32671
+    max_slope_dm_a = E_a * fs_a
+    print(f"(a) fs={fs_a} Hz, E={E_a}")
+    print(f"Max Signal Slope: ~{max_slope_signal:.0f} V/s")
+    print(f"Max DM Slope: {max_slope_dm_a:.0f} V/s")
+    print("-> Slope Overload: YES")
+
+    fig = plt.figure(figsize=(14, 6))
+    plt.plot(t_dm_a, m_dm_a, 'b-', label='Αρχικό $m(t)$ @ 9600 Hz')
+    plt.plot(t_dm_a, m_q_a, 'r-', label=f'DM Έξοδος $m_q[n]$ (E={E_a})')
+    plt.title('(a) DM με Σοβαρή Υπερφόρτωση Κλίσης (Slope Overload)')
+    plt.xlabel('Χρόνος (s)')
+    plt.ylabel('Πλάτος')
+    plt.legend()
+    plt.grid(True)
+    return [fig]
 
 # --- (b) fs = 9600 Hz, Μεταβολή E ---
 
-# Αύξηση E (Μείωση Overload, Αύξηση Granular Noise)
-E_b1 = 1.0 
-m_q_b1 = simulate_dm(m_dm_a, E_b1)
-print(f"(b) Max DM Slope (E={E_b1}): {E_b1 * fs_a:.0f} V/s")
-
-# Μείωση E (Αύξηση Overload, Μείωση Granular Noise)
-E_b2 = 0.05
-m_q_b2 = simulate_dm(m_dm_a, E_b2)
-print(f"(b) Max DM Slope (E={E_b2}): {E_b2 * fs_a:.0f} V/s")
-
-plt.figure(figsize=(14, 12))
-plt.subplot(2, 1, 1)
-plt.plot(t_dm_a, m_dm_a, 'b-', label='Αρχικό $m(t)$')
-plt.plot(t_dm_a, m_q_b1, 'g-', label=f'DM (E={E_b1}) - Λιγότερο Overload')
-plt.title(f'(b) Αύξηση E: Μείωση Overload, Αύξηση Granular Noise')
-plt.legend()
-plt.grid(True)
-
-plt.subplot(2, 1, 2)
-plt.plot(t_dm_a, m_dm_a, 'b-', label='Αρχικό $m(t)$')
-plt.plot(t_dm_a, m_q_b2, 'm-', label=f'DM (E={E_b2}) - Περισσότερο Overload')
-plt.title(f'(b) Μείωση E: Αύξηση Overload, Μείωση Granular Noise')
-plt.xlabel('Χρόνος (s)')
-plt.ylabel('Πλάτος')
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
+def part_b():
+    """
+    Μεταβολή του E στα 9600 Hz (overload vs granular noise).
+    """
+    # Αύξηση E (Μείωση Overload, Αύξηση Granular Noise)
+    E_b1 = 1.0
+    m_q_b1 = simulate_dm(m_dm_a, E_b1)
+    print(f"(b) Max DM Slope (E={E_b1}): {E_b1 * fs_a:.0f} V/s")
+
+    # Μείωση E (Αύξηση Overload, Μείωση Granular Noise)
+    E_b2 = 0.05
+    m_q_b2 = simulate_dm(m_dm_a, E_b2)
+    print(f"(b) Max DM Slope (E={E_b2}): {E_b2 * fs_a:.0f} V/s")
+
+    fig = plt.figure(figsize=(14, 12))
+    plt.subplot(2, 1, 1)
+    plt.plot(t_dm_a, m_dm_a, 'b-', label='Αρχικό $m(t)$')
+    plt.plot(t_dm_a, m_q_b1, 'g-', label=f'DM (E={E_b1}) - Λιγότερο Overload')
+    plt.title(f'(b) Αύξηση E: Μείωση Overload, Αύξηση Granular Noise')
+    plt.legend()
+    plt.grid(True)
+
+    plt.subplot(2, 1, 2)
+    plt.plot(t_dm_a, m_dm_a, 'b-', label='Αρχικό $m(t)$')
+    plt.plot(t_dm_a, m_q_b2, 'm-', label=f'DM (E={E_b2}) - Περισσότερο Overload')
+    plt.title(f'(b) Μείωση E: Αύξηση Overload, Μείωση Granular Noise')
+    plt.xlabel('Χρόνος (s)')
+    plt.ylabel('Πλάτος')
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+    return [fig]
 
 # --- (c) Βελτίωση Παραμέτρων DM ---
 
-# Στρατηγική 1 (Κακή): fs = 9600 Hz, E = 3.5
-E_c1 = 3.5
-m_q_c1 = simulate_dm(m_dm_a, E_c1)
-print(f"(c.1) Max DM Slope (E={E_c1}): {E_c1 * fs_a:.0f} V/s (OK)")
+def part_c():
+    """
+    Δύο στρατηγικές βελτίωσης: μεγάλο E ή oversampling.
+    """
+    # Στρατηγική 1 (Κακή): fs = 9600 Hz, E = 3.5
+    E_c1 = 3.5
+    m_q_c1 = simulate_dm(m_dm_a, E_c1)
+    print(f"(c.1) Max DM Slope (E={E_c1}): {E_c1 * fs_a:.0f} V/s (OK)")
+
+    # Στρατηγική 2 (Καλή): fs = 200 kHz, E = 0.2
+    m_q_c2 = simulate_dm(m_dm_c2, E_c2)
+    print(f"(c.2) Max DM Slope (fs={fs_c2}, E={E_c2}): {E_c2 * fs_c2:.0f} V/s (OK)")
+
+
+    fig = plt.figure(figsize=(14, 12))
+    plt.subplot(2, 1, 1)
+    plt.plot(t_dm_a, m_dm_a, 'b-', label='Αρχικό $m(t)$')
+    plt.plot(t_dm_a, m_q_c1, 'r-', label=f'DM (fs=9600, E={E_c1})')
+    plt.title('(c) Στρατηγική 1: Τεράστιος Κοκκώδης Θόρυβος')
+    plt.legend()
+    plt.grid(True)
+
+    plt.subplot(2, 1, 2)
+    plt.plot(t_dm_c2, m_dm_c2, 'b-', label='Αρχικό $m(t)$ @ 200kHz')
+    plt.plot(t_dm_c2, m_q_c2, 'g-', label=f'DM (fs=200k, E={E_c2})')
+    plt.title('(c) Στρατηγική 2: Καλή Παρακολούθηση (Oversampling)')
+    plt.xlabel('Χρόνος (s)')
+    plt.ylabel('Πλάτος')
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+    return [fig]
 
-# Στρατηγική 2 (Καλή): fs = 200 kHz, E = 0.2
-fs_c2 = 200000
-Ts_c2 = 1/fs_c2
-t_dm_c2 = np.arange(0, T_duration, Ts_c2)
-m_dm_c2 = m(t_dm_c2) # Νέα δειγματοληψία
+# --- Ανάκτηση Σήματος (DM Recovery) ---
 
-E_c2 = 0.2
-m_q_c2 = simulate_dm(m_dm_c2, E_c2)
-print(f"(c.2) Max DM Slope (fs={fs_c2}, E={E_c2}): {E_c2 * fs_c2:.0f} V/s (OK)")
-
-
-plt.figure(figsize=(14, 12))
-plt.subplot(2, 1, 1)
-plt.plot(t_dm_a, m_dm_a, 'b-', label='Αρχικό $m(t)$')
-plt.plot(t_dm_a, m_q_c1, 'r-', label=f'DM (fs=9600, E={E_c1})')
-plt.title('(c) Στρατηγική 1: Τεράστιος Κοκκώδης Θόρυβος')
-plt.legend()
-plt.grid(True)
-
-plt.subplot(2, 1, 2)
-plt.plot(t_dm_c2, m_dm_c2, 'b-', label='Αρχικό $m(t)$ @ 200kHz')
-plt.plot(t_dm_c2, m_q_c2, 'g-', label=f'DM (fs=200k, E={E_c2})')
-plt.title('(c) Στρατηγική 2: Καλή Παρακολούθηση (Oversampling)')
-plt.xlabel('Χρόνος (s)')
-plt.ylabel('Πλάτος')
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
+def recover_lpf(staircase, fs, B_lpf=2000):
+    """
+    Ανάκτηση από τη "σκάλα" (DM ή ADM) με Butterworth LPF 5ης τάξης στα B_lpf Hz
+    (cached SOS, βλ. filters.py). Δέχεται και πολλές σκάλες σε γραμμές 2-D πίνακα.
+    """
+    return lowpass(staircase, B_lpf, fs, order=5)
 
-# --- Ανάκτηση Σήματος (DM Recovery) ---
-# Η ανάκτηση γίνεται με LPF. Ας χρησιμοποιήσουμε την 'καλή' DM
-from scipy.signal import butter, lfilter
-
-# Σχεδιασμός LPF (π.χ., 2000 Hz)
-B_lpf = 2000
-nyquist = fs_c2 / 2
-b, a = butter(5, B_lpf / nyquist, btype='low')
-
-# Φιλτράρισμα της "σκάλας" DM
-m_recovered_dm = lfilter(b, a, m_q_c2)
-
-plt.figure(figsize=(14, 6))
-plt.plot(t_dm_c2, m_dm_c2, 'b-', label='Αρχικό $m(t)$ @ 200kHz')
-plt.plot(t_dm_c2, m_recovered_dm, 'g--', label='Ανακτημένο Σήμα (μετά LPF)')
-plt.title('(c) Ανάκτηση Σήματος DM με Χαμηλοπερατό Φίλτρο (LPF)')
-plt.xlabel('Χρόνος (s)')
-plt.ylabel('Πλάτος')
-plt.legend()
-plt.grid(True)
-plt.show()
+def part_recovery():
+    """
+    Ανάκτηση με LPF από την 'καλή' DM της (c) (200 kHz, E = 0.2).
+    """
+    m_q_c2 = simulate_dm(m_dm_c2, E_c2)
+    m_recovered_dm = recover_lpf(m_q_c2, fs_c2)
+
+    fig = plt.figure(figsize=(14, 6))
+    plt.plot(t_dm_c2, m_dm_c2, 'b-', label='Αρχικό $m(t)$ @ 200kHz')
+    plt.plot(t_dm_c2, m_recovered_dm, 'g--', label='Ανακτημένο Σήμα (μετά LPF)')
+    plt.title('(c) Ανάκτηση Σήματος DM με Χαμηλοπερατό Φίλτρο (LPF)')
+    plt.xlabel('Χρόνος (s)')
+    plt.ylabel('Πλάτος')
+    plt.legend()
+    plt.grid(True)
+    return [fig]
+
+# --- Σάρωση E: υπερφόρτωση κλίσης έναντι κοκκώδους θορύβου ---
+
+def part_sweep():
+    """
+    SNR και ποσοστό υπερφόρτωσης συναρτήσει του E για fs = 9600 Hz και 200 kHz.
+    """
+    E_values = np.logspace(-2, 1, 300)
+    stats = dm_grid([fs_a, fs_c2], E_values, T_duration, m)
+
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10), sharex=True)
+    for fs, color in [(fs_a, 'r'), (fs_c2, 'g')]:
+        rows = stats[stats['fs'] == fs]
+        best = rows[np.argmax(rows['snr_db'])]
+        print(f"(sweep) fs={fs} Hz: βέλτιστο E = {best['E']:.3f}, SNR = {best['snr_db']:.1f} dB")
+        ax1.semilogx(rows['E'], rows['snr_db'], color + '-', label=f'fs = {fs} Hz')
+        ax1.plot(best['E'], best['snr_db'], color + 'o')
+        ax2.semilogx(rows['E'], 100 * rows['overload_fraction'], color + '-', label=f'fs = {fs} Hz')
+    ax1.set_title('SNR της DM συναρτήσει του βήματος E')
+    ax1.set_ylabel('SNR (dB)')
+    ax1.legend()
+    ax1.grid(True)
+    ax2.set_title('Ποσοστό δειγμάτων με υπερφόρτωση κλίσης')
+    ax2.set_xlabel('Βήμα E')
+    ax2.set_ylabel('Υπερφόρτωση (%)')
+    ax2.legend()
+    ax2.grid(True)
+    plt.tight_layout()
+    return [fig]
+
+# --- Προσαρμοστική DM (Jayant, Song, CVSD) ---
+
+def part_adm():
+    """
+    Καμπύλες SNR - bitrate για DM και ADM και ανάκτηση της καλύτερης ADM στα 200 kHz.
+    """
+    fs_values = np.array([8000, 16000, 32000, 64000, 128000, 256000])
+    curves = snr_vs_bitrate(m, fs_values, T_duration)
+    E_values = np.logspace(-2, 1, 200)
+    dm_stats = dm_grid(fs_values, E_values, T_duration, m)
+    snr_dm = dm_stats['snr_db'].reshape(len(fs_values), -1).max(axis=1)
+
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 12))
+    ax1.semilogx(fs_values, snr_dm, 'ko-', label='DM (βέλτιστο E ανά bitrate)')
+    for mode, style in [('jayant', 'rs-'), ('song', 'm^-'), ('cvsd', 'gd-')]:
+        ax1.semilogx(fs_values, curves[mode][0], style, label=f'ADM {mode}')
+    ax1.set_title('SNR συναρτήσει του bitrate (1 bit ανά δείγμα)')
+    ax1.set_xlabel('Bitrate (bit/s)')
+    ax1.set_ylabel('SNR (dB)')
+    ax1.legend()
+    ax1.grid(True)
+
+    # Jayant στα 200 kHz με το καλύτερο P, μέσα από το ίδιο LPF με το part_recovery
+    stats, stairs = adm_sweep(m_dm_c2, 'jayant', DEFAULT_PARAMS['jayant'], fs_c2,
+                              keep_staircase=True)
+    best = np.argmax(stats['snr_db'])
+    print(f"(adm) Jayant @ {fs_c2} Hz: P = {stats['param'][best]:.2f}, "
+          f"SNR σκάλας = {stats['snr_db'][best]:.1f} dB")
+    ax2.plot(t_dm_c2, m_dm_c2, 'b-', label='Αρχικό $m(t)$ @ 200kHz')
+    ax2.plot(t_dm_c2, stairs[best], 'r-', alpha=0.4, label='Σκάλα ADM (Jayant)')
+    ax2.plot(t_dm_c2, recover_lpf(stairs[best], fs_c2), 'g--', label='Ανακτημένο Σήμα (μετά LPF)')
+    ax2.set_title(f"ADM Jayant (P = {stats['param'][best]:.2f}) και ανάκτηση με LPF")
+    ax2.set_xlabel('Χρόνος (s)')
+    ax2.set_ylabel('Πλάτος')
+    ax2.legend()
+    ax2.grid(True)
+    plt.tight_layout()
+    return [fig]
+
+# Κάθε μέρος είναι ανεξάρτητη εργασία (βλ. dsp_batch.py)
+PARTS = {'a': part_a, 'b': part_b, 'c': part_c, 'recovery': part_recovery,
+         'sweep': part_sweep, 'adm': part_adm}
+
+def main():
+    for part in PARTS.values():
+        part()
+        plt.show()
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.fft import fft, ifft, fftshift, fftfreq
-from scipy.interpolate import interp1d
+
+from dsp import m, ideal_lpf_reconstruct, quantize_uniform
+from equalizer import get_equalizer
+from hold import hold_reconstruct
+from lloyd_max import lloyd_max
+from quantizer import sqnr_sweep
 
 # --- 1. Ορισμός Σήματος και Σταθερών (από 5.8-1) ---
 
@@ -14,36 +18,10 @@ Ts1 = 1/fs1
 t_cont = np.linspace(0, T_duration, int(fs_cont * T_duration), endpoint=False)
 t_samp1 = np.arange(0, T_duration, Ts1)
 
-def m(t):
-    return 2 * np.cos(2 * np.pi * f1 * t) + \
-           np.cos(2 * np.pi * f2 * t) - \
-           3 * np.sin(2 * np.pi * f3 * t)
-
 m_cont = m(t_cont)
 m_samp1 = m(t_samp1)
 
-# --- 2. Συνάρτηση Ομοιόμορφου Κβαντιστή ---
-
-def quantize_uniform(signal, L, v_min, v_max):
-    """
-    Κβαντίζει ένα σήμα 'signal' σε L επίπεδα,
-    στη δυναμική περιοχή [v_min, v_max].
-    """
-    delta = (v_max - v_min) / L
-    
-    # 1. Μετατόπιση στην περιοχή [0, L*delta]
-    signal_shifted = signal - v_min
-    
-    # 2. Εύρεση του "δείκτη" επιπέδου (0 έως L-1)
-    indices = np.floor(signal_shifted / delta)
-    
-    # 3. Περιορισμός (clipping) στις άκρες [0, L-1]
-    indices = np.clip(indices, 0, L - 1)
-    
-    # 4. Υπολογισμός κβαντισμένης τιμής (κέντρο του επιπέδου)
-    quantized_values = v_min + (indices + 0.5) * delta
-    
-    return quantized_values
+# --- 2. Συνάρτηση Ομοιόμορφου Κβαντιστή (quantize_uniform, βλ. dsp.py) ---
 
 # --- 3. Κβάντιση Σήματος ---
 
@@ -51,122 +29,179 @@ L_quant = 16
 V_max = 6.0
 V_min = -6.0
 
-# Κβάντιση των δειγμάτων
+# Κβάντιση των δειγμάτων (κοινή για όλα τα μέρη)
 m_quantized = quantize_uniform(m_samp1, L_quant, V_min, V_max)
 
-# Σφάλμα Κβάντισης (στο πεδίο των δειγμάτων)
-quantization_error = m_quantized - m_samp1
-
-print(f"\n--- Άσκηση 5.8-2: Κβάντιση (L={L_quant}) ---")
-print(f"Δυναμική Περιοχή: [{V_min}, {V_max}]")
-print(f"Βήμα Κβάντισης (Delta): {(V_max - V_min) / L_quant:.2f}")
-
-plt.figure(figsize=(14, 6))
-plt.plot(t_samp1, m_samp1, 'bo-', label='Αρχικά Δείγματα $m[n]$', markersize=4)
-plt.stem(t_samp1, m_quantized, 'r', markerfmt='rs', basefmt='r-', 
-         label=f'Κβαντισμένα Δείγματα $m_q[n]$ (L={L_quant})')
-plt.title('Σύγκριση Αρχικών και Κβαντισμένων Δειγμάτων')
-plt.xlabel('Χρόνος (s)')
-plt.ylabel('Πλάτος')
-plt.legend()
-plt.grid(True)
-plt.show()
+def part_quantization():
+    """
+    Σύγκριση αρχικών και κβαντισμένων δειγμάτων.
+    """
+    # Σφάλμα Κβάντισης (στο πεδίο των δειγμάτων)
+    quantization_error = m_quantized - m_samp1
+
+    print(f"\n--- Άσκηση 5.8-2: Κβάντιση (L={L_quant}) ---")
+    print(f"Δυναμική Περιοχή: [{V_min}, {V_max}]")
+    print(f"Βήμα Κβάντισης (Delta): {(V_max - V_min) / L_quant:.2f}")
+
+    fig = plt.figure(figsize=(14, 6))
+    plt.plot(t_samp1, m_samp1, 'bo-', label='Αρχικά Δείγματα $m[n]$', markersize=4)
+    plt.stem(t_samp1, m_quantized, 'r', markerfmt='rs', basefmt='r-', 
+             label=f'Κβαντισμένα Δείγματα $m_q[n]$ (L={L_quant})')
+    plt.title('Σύγκριση Αρχικών και Κβαντισμένων Δειγμάτων')
+    plt.xlabel('Χρόνος (s)')
+    plt.ylabel('Πλάτος')
+    plt.legend()
+    plt.grid(True)
+    return [fig]
 
 # --- (a) Ιδανική Ανακατασκευή LPF ---
 
-# (Χρήση της συνάρτησης από την 5.8-1)
-def ideal_lpf_reconstruct(signal_samples, t_samples, t_target, fs_sample):
-    N_pad = len(t_target)
-    M_f = fft(signal_samples, n=N_pad)
-    freq_axis = fftfreq(N_pad, 1/fs_sample)
-    B_lpf = fs_sample / 2
-    M_f[np.abs(freq_axis) > B_lpf] = 0
-    scaling_factor = N_pad / len(signal_samples)
-    m_recon = np.real(ifft(M_f, n=N_pad) * scaling_factor)
-    return m_recon
-
-# Ανακατασκευή από κβαντισμένα δείγματα
-m_recon_quant = ideal_lpf_reconstruct(m_quantized, t_samp1, t_cont, fs1)
-
-# Σφάλμα: Διαφορά από το *αρχικό* συνεχές σήμα
-error_quant = m_recon_quant - m_cont
-
-plt.figure(figsize=(14, 8))
-plt.subplot(2, 1, 1)
-plt.plot(t_cont, m_cont, 'b-', label='Αρχικό $m(t)$')
-plt.plot(t_cont, m_recon_quant, 'r--', label='Ανακατασκευή (μετά Κβάντιση)')
-plt.title('(a) Ιδανική Ανακατασκευή LPF από Κβαντισμένα Δείγματα')
-plt.legend()
-plt.grid(True)
-
-plt.subplot(2, 1, 2)
-plt.plot(t_cont, error_quant, 'r-')
-plt.title('Διαφορά (Σφάλμα) από το Αρχικό Σήμα (Θόρυβος Κβάντισης)')
-plt.xlabel('Χρόνος (s)')
-plt.ylabel('Σφάλμα')
-plt.grid(True)
-plt.tight_layout()
-plt.show()
-
-# --- (b) Ανακατασκευή ZOH + Equalizer ---
-
-print("\n--- Μέρος (b): ZOH & Equalizer (σε κβαντισμένα) ---")
-f_zoh_q = interp1d(t_samp1, m_quantized, kind='previous', fill_value='extrapolate')
-m_recon_zoh_q = f_zoh_q(t_cont)
-
-# Ο Equalizer είναι ο ίδιος με το 5.8-1c
-N_cont = len(t_cont)
-freq_axis_cont = fftshift(fftfreq(N_cont, 1/fs_cont))
-epsilon = 1e-9
-H_zoh = Ts1 * np.sinc(freq_axis_cont * Ts1) * np.exp(-1j * np.pi * freq_axis_cont * Ts1)
-H_lpf = np.where(np.abs(freq_axis_cont) <= fs1 / 2, 1, 0)
-H_eq_zoh = H_lpf / (H_zoh + epsilon)
-
-# Εφαρμογή του ZOH Equalizer
-M_recon_zoh_q_f = fftshift(fft(m_recon_zoh_q))
-M_eq_zoh_f = M_recon_zoh_q_f * H_eq_zoh
-m_eq_zoh = np.real(ifft(ifftshift(M_eq_zoh_f)))
-error_zoh = m_eq_zoh - m_cont
-
-# --- (c) Ανακατασκευή FOH + Equalizer ---
-
-print("--- Μέρος (c): FOH & Equalizer (σε κβαντισμένα) ---")
-# FOH = Γραμμική Παρεμβολή
-f_foh_q = interp1d(t_samp1, m_quantized, kind='linear', fill_value='extrapolate')
-m_recon_foh_q = f_foh_q(t_cont)
-
-# Σχεδιασμός FOH Equalizer (H ~ sinc^2)
-H_foh = Ts1 * (np.sinc(freq_axis_cont * Ts1))**2 * \
-        np.exp(-1j * 2 * np.pi * freq_axis_cont * Ts1) # FOH delay = Ts
-H_eq_foh = H_lpf / (H_foh + epsilon)
-
-# Εφαρμογή του FOH Equalizer
-M_recon_foh_q_f = fftshift(fft(m_recon_foh_q))
-M_eq_foh_f = M_recon_foh_q_f * H_eq_foh
-m_eq_foh = np.real(ifft(ifftshift(M_eq_foh_f)))
-error_foh = m_eq_foh - m_cont
-
-# --- Σύγκριση Σφαλμάτων (b) και (c) ---
-
-plt.figure(figsize=(14, 10))
-plt.subplot(2, 1, 1)
-plt.plot(t_cont, error_zoh, 'r-', label='Σφάλμα: ZOH + EQ')
-plt.title('(c) Σύγκριση Σφαλμάτων Ανακατασκευής (από Κβαντισμένα Δείγματα)')
-plt.legend()
-plt.grid(True)
-
-plt.subplot(2, 1, 2)
-plt.plot(t_cont, error_foh, 'g-', label='Σφάλμα: FOH + EQ')
-plt.legend()
-plt.xlabel('Χρόνος (s)')
-plt.ylabel('Σφάλμα')
-plt.grid(True)
-plt.tight_layout()
-plt.show()
-
-# Υπολογισμός Ισχύος Σφάλματος (MSE)
-mse_zoh = np.mean(error_zoh**2)
-mse_foh = np.mean(error_foh**2)
-print(f"Mean Squared Error (ZOH + EQ): {mse_zoh:.4e}")
-print(f"Mean Squared Error (FOH + EQ): {mse_foh:.4e}")
-print("-> Η FOH (Γραμμική Παρεμβολή) είναι σαφώς ανώτερη.")
+def part_a():
+    """
+    Ιδανική ανακατασκευή LPF από τα κβαντισμένα δείγματα.
+    """
+    # (Χρήση της ideal_lpf_reconstruct από την 5.8-1, βλ. dsp.py)
+
+    # Ανακατασκευή από κβαντισμένα δείγματα
+    m_recon_quant = ideal_lpf_reconstruct(m_quantized, t_samp1, t_cont, fs1)
+
+    # Σφάλμα: Διαφορά από το *αρχικό* συνεχές σήμα
+    error_quant = m_recon_quant - m_cont
+
+    fig = plt.figure(figsize=(14, 8))
+    plt.subplot(2, 1, 1)
+    plt.plot(t_cont, m_cont, 'b-', label='Αρχικό $m(t)$')
+    plt.plot(t_cont, m_recon_quant, 'r--', label='Ανακατασκευή (μετά Κβάντιση)')
+    plt.title('(a) Ιδανική Ανακατασκευή LPF από Κβαντισμένα Δείγματα')
+    plt.legend()
+    plt.grid(True)
+
+    plt.subplot(2, 1, 2)
+    plt.plot(t_cont, error_quant, 'r-')
+    plt.title('Διαφορά (Σφάλμα) από το Αρχικό Σήμα (Θόρυβος Κβάντισης)')
+    plt.xlabel('Χρόνος (s)')
+    plt.ylabel('Σφάλμα')
+    plt.grid(True)
+    plt.tight_layout()
+    return [fig]
+
+# --- (b) και (c) Ανακατασκευή ZOH / FOH + Equalizer ---
+
+def part_c():
+    """
+    ZOH + EQ (b) και FOH + EQ (c) σε κβαντισμένα δείγματα, με σύγκριση σφαλμάτων.
+    """
+    print("\n--- Μέρος (b): ZOH & Equalizer (σε κβαντισμένα) ---")
+    m_recon_zoh_q = hold_reconstruct(m_quantized, fs1, fs_cont, len(t_cont), order=0)
+
+    # Ο Equalizer είναι ο ίδιος με το 5.8-1c (από cache, βλ. equalizer.py)
+    N_cont = len(t_cont)
+    m_eq_zoh = get_equalizer(fs1, fs_cont, N_cont, order=0).apply(m_recon_zoh_q)
+    error_zoh = m_eq_zoh - m_cont
+
+    print("--- Μέρος (c): FOH & Equalizer (σε κβαντισμένα) ---")
+    # FOH = Γραμμική Παρεμβολή
+    m_recon_foh_q = hold_reconstruct(m_quantized, fs1, fs_cont, len(t_cont), order=1)
+
+    # FOH Equalizer (H ~ sinc^2, κεντραρισμένη γραμμική παρεμβολή)
+    m_eq_foh = get_equalizer(fs1, fs_cont, N_cont, order=1).apply(m_recon_foh_q)
+    error_foh = m_eq_foh - m_cont
+
+    # --- Σύγκριση Σφαλμάτων (b) και (c) ---
+
+    fig = plt.figure(figsize=(14, 10))
+    plt.subplot(2, 1, 1)
+    plt.plot(t_cont, error_zoh, 'r-', label='Σφάλμα: ZOH + EQ')
+    plt.title('(c) Σύγκριση Σφαλμάτων Ανακατασκευής (από Κβαντισμένα Δείγματα)')
+    plt.legend()
+    plt.grid(True)
+
+    plt.subplot(2, 1, 2)
+    plt.plot(t_cont, error_foh, 'g-', label='Σφάλμα: FOH + EQ')
+    plt.legend()
+    plt.xlabel('Χρόνος (s)')
+    plt.ylabel('Σφάλμα')
+    plt.grid(True)
+    plt.tight_layout()
+
+    # Υπολογισμός Ισχύος Σφάλματος (MSE)
+    mse_zoh = np.mean(error_zoh**2)
+    mse_foh = np.mean(error_foh**2)
+    print(f"Mean Squared Error (ZOH + EQ): {mse_zoh:.4e}")
+    print(f"Mean Squared Error (FOH + EQ): {mse_foh:.4e}")
+    better = "FOH (Γραμμική Παρεμβολή)" if mse_foh < mse_zoh else "ZOH"
+    print(f"-> Μικρότερο σφάλμα μετά την εξισορρόπηση: {better}")
+    return [fig]
+
+# --- SQNR συναρτήσει των bits (L = 2**n) ---
+
+def part_sqnr():
+    """
+    SQNR του ομοιόμορφου κβαντιστή στο [V_min, V_max] για n = 1..24 bits
+    (ένα πέρασμα με το sqnr_sweep) και η θεωρητική ευθεία ~6.02 dB/bit.
+    """
+    sweep = sqnr_sweep(m_cont, V_min, V_max, n_max=24)
+    n_bits = sweep['n_bits']
+    # Θόρυβος delta^2 / 12 για delta = (V_max - V_min) / 2**n
+    delta = (V_max - V_min) / 2.0**n_bits
+    sqnr_theory = 10 * np.log10(np.mean(m_cont**2) / (delta**2 / 12))
+    n_quant = int(np.log2(L_quant))
+    print(f"(sqnr) n = {n_quant} bits (L = {L_quant}): SQNR = {sweep['sqnr_db'][n_quant - 1]:.1f} dB")
+
+    fig = plt.figure(figsize=(14, 6))
+    plt.plot(n_bits, sweep['sqnr_db'], 'bo-', label='Μετρημένο SQNR')
+    plt.plot(n_bits, sqnr_theory, 'r--', label=r'$P_m / (\Delta^2/12)$ (6.02 dB/bit)')
+    plt.title(f'SQNR Ομοιόμορφου Κβαντιστή στο [{V_min}, {V_max}]')
+    plt.xlabel('Bits ανά δείγμα n (L = $2^n$)')
+    plt.ylabel('SQNR (dB)')
+    plt.legend()
+    plt.grid(True)
+    return [fig]
+
+# --- Κβαντιστής Lloyd-Max (ελάχιστο MSE για την κατανομή του m(t)) ---
+
+def part_lloyd():
+    """
+    Lloyd-Max L_quant επιπέδων εκπαιδευμένος στο m(t), έναντι του ομοιόμορφου.
+    """
+    q_lm = lloyd_max(m_cont, L_quant, V_min, V_max)
+    m_quantized_lm = q_lm(m_samp1)
+    mse_uniform = np.mean((m_quantized - m_samp1)**2)
+    mse_lm = np.mean((m_quantized_lm - m_samp1)**2)
+    print(f"(lloyd) MSE ομοιόμορφου: {mse_uniform:.4e}, Lloyd-Max: {mse_lm:.4e} "
+          f"({q_lm.iterations} επαναλήψεις)")
+
+    fig = plt.figure(figsize=(14, 10))
+    plt.subplot(2, 1, 1)
+    v = np.linspace(V_min, V_max, 2000)
+    plt.plot(v, quantize_uniform(v, L_quant, V_min, V_max), 'r-', label='Ομοιόμορφος')
+    plt.plot(v, q_lm(v), 'g-', label='Lloyd-Max')
+    plt.title(f'Χαρακτηριστικές Κβαντιστών (L = {L_quant})')
+    plt.xlabel('Είσοδος')
+    plt.ylabel('Έξοδος')
+    plt.legend()
+    plt.grid(True)
+
+    plt.subplot(2, 1, 2)
+    plt.plot(t_cont, m_cont, 'b-', alpha=0.5, label='Αρχικό $m(t)$')
+    plt.step(t_samp1, m_quantized, 'r-', where='post', label=f'Ομοιόμορφος (MSE {mse_uniform:.3f})')
+    plt.step(t_samp1, m_quantized_lm, 'g-', where='post', label=f'Lloyd-Max (MSE {mse_lm:.3f})')
+    plt.title('Κβαντισμένα Δείγματα: Ομοιόμορφος έναντι Lloyd-Max')
+    plt.xlabel('Χρόνος (s)')
+    plt.ylabel('Πλάτος')
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+    return [fig]
+
+# Κάθε μέρος είναι ανεξάρτητη εργασία (βλ. dsp_batch.py)
+PARTS = {'quantization': part_quantization, 'a': part_a, 'c': part_c, 'sqnr': part_sqnr,
+         'lloyd': part_lloyd}
+
+def main():
+    for part in PARTS.values():
+        part()
+        plt.show()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+import time
+from math import comb, factorial
+
+import numpy as np
+
+# --- Ανακατασκευή με hold (ZOH, FOH, ανώτερης τάξης) χωρίς interp1d ---
+#
+# Τα δείγματα x[n] βρίσκονται στα n / fs_sample και η έξοδος στα m / fs_out.
+# Τάξη 0 = ZOH (interp1d kind='previous'), τάξη 1 = FOH (kind='linear'),
+# τάξη k >= 2 = B-spline βαθμού k (k+1 διαδοχικά ZOH), με την ίδια σύμβαση
+# φάσης με το equalizer.hold_response: οι άρτιες τάξεις καθυστερούν κατά
+# μισή περίοδο, οι περιττές είναι κεντραρισμένες στα δείγματα.
+
+EDGE_MODES = ('extrapolate', 'hold', 'wrap')
+
+def _extend(x, n_left, n_right, edge):
+    """
+    Επέκταση του x αριστερά / δεξιά σύμφωνα με το edge.
+    'extrapolate' = γραμμική παρέκταση από τα δύο τελευταία δείγματα (όπως το interp1d).
+    """
+    N = len(x)
+    idx = np.arange(-n_left, N + n_right)
+    if edge == 'wrap':
+        return x[idx % N]
+    ext = x[np.clip(idx, 0, N - 1)]
+    if edge == 'extrapolate' and N > 1:
+        ext[:n_left] += (idx[:n_left]) * (x[1] - x[0])
+        ext[n_left + N:] += (idx[n_left + N:] - (N - 1)) * (x[-1] - x[-2])
+    return ext
+
+def _bspline(t, k):
+    """
+    Κεντραρισμένη καρδινάλια B-spline βαθμού k.
+    """
+    t = np.asarray(t, dtype=float) + (k + 1) / 2
+    result = np.zeros_like(t)
+    for j in range(k + 2):
+        result += (-1)**j * comb(k + 1, j) * np.maximum(t - j, 0)**k
+    return result / factorial(k)
+
+def _hold_kernel(L, order):
+    """
+    Διακριτός πυρήνας hold για ακέραιο λόγο L: (order+1) διαδοχικά κουτιά L
+    δειγμάτων, κανονικοποιημένα σε κέρδος DC = L. Επιστρέφει (h, shift).
+    """
+    h = np.ones(L)
+    for _ in range(order):
+        h = np.convolve(h, np.ones(L)) / L
+    shift = ((order + 1) // 2) * (L - 1)
+    return h, shift
+
+def _hold_integer(x, L, n_out, order, edge, out):
+    q, r = divmod(n_out, L)
+    rows = q + (r > 0)
+    if order == 0:
+        x_ext = _extend(x, 0, max(rows - len(x), 0), 'wrap' if edge == 'wrap' else 'hold')
+        out[:q * L].reshape(q, L)[...] = x_ext[:q, None]
+        out[q * L:] = x_ext[q] if r else 0
+        return out
+    if order == 1:
+        x_ext = _extend(x, 0, max(rows + 1 - len(x), 0), edge)
+        frac = np.arange(L) / L
+        d = np.diff(x_ext[:rows + 1])
+        view = out[:q * L].reshape(q, L)
+        np.multiply(d[:q, None], frac, out=view)
+        view += x_ext[:q, None]
+        if r:
+            out[q * L:] = x_ext[q] + d[q] * frac[:r]
+        return out
+
+    # Τάξη >= 2: πολυφασική μορφή του πυρήνα, y[qL + p] = sum_j taps[p, j] x[q - j]
+    h, shift = _hold_kernel(L, order)
+    j_min = -((shift + L - 1) // L) - 1
+    j_max = (len(h) - 1) // L + 1
+    js = np.arange(j_min, j_max + 1)
+    pos = js[None, :] * L + np.arange(L)[:, None] + shift
+    valid = (pos >= 0) & (pos < len(h))
+    taps = np.where(valid, h[np.clip(pos, 0, len(h) - 1)], 0.0)
+    pad_edge = 'wrap' if edge == 'wrap' else 'hold'
+    x_pad = _extend(x, j_max, max(rows - len(x), 0) - j_min, pad_edge)
+    full = np.zeros((rows, L), dtype=out.dtype)
+    for col, j in enumerate(js):
+        if np.any(taps[:, col]):
+            full += x_pad[j_max - j:j_max - j + rows, None] * taps[None, :, col]
+    out[:] = full.reshape(-1)[:n_out]
+    return out
+
+def _hold_fractional(x, step, n_out, order, edge, out, block):
+    N = len(x)
+    pad_edge = edge if order <= 1 else ('wrap' if edge == 'wrap' else 'hold')
+    n_right = int(np.ceil(n_out * step)) - N + order + 3
+    n_left = order + 2
+    x_pad = _extend(x, n_left, max(n_right, 1), pad_edge)
+    for start in range(0, n_out, block):
+        m_idx = np.arange(start, min(start + block, n_out))
+        # Μικρή ανοχή ώστε οι χρόνοι των δειγμάτων να μην πέφτουν στο προηγούμενο διάστημα
+        pos = m_idx * step + 1e-9
+        if order == 0:
+            idx = np.floor(pos).astype(np.int64)
+            if edge != 'wrap':
+                idx = np.minimum(idx, N - 1)
+            out[m_idx] = x_pad[idx + n_left]
+        elif order == 1:
+            idx = np.floor(pos).astype(np.int64)
+            if edge == 'extrapolate':
+                idx = np.minimum(idx, N - 2)
+            frac = m_idx * step - idx
+            a = x_pad[idx + n_left]
+            out[m_idx] = a + (x_pad[idx + n_left + 1] - a) * frac
+        else:
+            u = m_idx * step - (0.5 if order % 2 == 0 else 0.0)
+            base = np.floor(u - (order + 1) / 2).astype(np.int64) + 1
+            acc = np.zeros(len(m_idx))
+            for i in range(order + 1):
+                n = base + i
+                acc += x_pad[n + n_left] * _bspline(u - n, order)
+            out[m_idx] = acc
+    return out
+
+def hold_reconstruct(samples, fs_sample, fs_out, n_out=None, order=0,
+                     edge='extrapolate', out=None, dtype=None, block=1 << 20):
+    """
+    Ανακατασκευή με hold τάξης 'order' από fs_sample σε fs_out.
+
+    Για ακέραιο λόγο fs_out / fs_sample (π.χ. 60000 / 4000 = 15) η έξοδος
+    γράφεται ως επανάληψη / γραμμικός συνδυασμός γραμμών σε πίνακα (n, L),
+    χωρίς αναζήτηση ανά δείγμα. Για μη ακέραιο λόγο υπολογίζεται η θέση
+    κάθε δείγματος εξόδου σε μπλοκ των 'block' δειγμάτων.
+
+    n_out:  πλήθος δειγμάτων εξόδου (προεπιλογή len(samples) * fs_out / fs_sample)
+    edge:   'extrapolate' (όπως interp1d με fill_value='extrapolate'), 'hold' ή 'wrap'
+    out:    προδεσμευμένος πίνακας εξόδου (π.χ. float32)
+    """
+    if edge not in EDGE_MODES:
+        raise ValueError(f"Άγνωστο edge '{edge}', επιλογές: {EDGE_MODES}")
+    x = np.asarray(samples, dtype=float)
+    ratio = fs_out / fs_sample
+    if n_out is None:
+        n_out = int(round(len(x) * ratio))
+    if out is None:
+        out = np.empty(n_out, dtype=dtype or np.float64)
+    elif len(out) != n_out:
+        raise ValueError("Το out πρέπει να έχει μήκος n_out")
+    if order == 1 and len(x) < 2:
+        raise ValueError("Η FOH χρειάζεται τουλάχιστον 2 δείγματα")
+
+    L = int(round(ratio))
+    if L >= 1 and abs(ratio - L) < 1e-9 * ratio:
+        return _hold_integer(x, L, n_out, order, edge, out)
+    return _hold_fractional(x, fs_sample / fs_out, n_out, order, edge, out, block)
+
+# --- Benchmark έναντι του interp1d ---
+if __name__ == "__main__":
+    import sys
+    from scipy.interpolate import interp1d
+    from dsp import m
+
+    fs_sample = 4000
+    # Έλεγχος ισοδυναμίας με interp1d (ακέραιος και μη ακέραιος λόγος)
+    t_samp = np.arange(0, 0.02, 1/fs_sample)
+    x = m(t_samp)
+    for fs_out in [60000, 14100]:
+        t_out = np.linspace(0, 0.02, int(0.02 * fs_out), endpoint=False)
+        for order, kind in [(0, 'previous'), (1, 'linear')]:
+            ref = interp1d(t_samp, x, kind=kind, fill_value='extrapolate')(t_out)
+            y = hold_reconstruct(x, fs_sample, fs_out, len(t_out), order)
+            print(f"fs_out={fs_out}, order={order}: max |hold - interp1d| = "
+                  f"{np.max(np.abs(y - ref)):.1e}")
+
+    # Με '--large' προστίθεται και το 1e8 (χωρίς interp1d, ~0.4 GB σε float32)
+    sizes = [10**6, 10**7] + ([10**8] if '--large' in sys.argv else [])
+    print(f"\n{'n_out':>10} {'order':>5} {'interp1d (s)':>13} {'hold (s)':>9} "
+          f"{'hold f32 (s)':>13} {'x':>6}")
+    for n_out in sizes:
+        L = 15
+        n_in = n_out // L
+        x = m(np.arange(n_in) / fs_sample)
+        t_in = np.arange(n_in) / fs_sample
+        t_out = np.arange(n_out) / (fs_sample * L)
+        for order, kind in [(0, 'previous'), (1, 'linear')]:
+            t_ref = float('nan')
+            if n_out <= 10**7:
+                t0 = time.perf_counter()
+                interp1d(t_in, x, kind=kind, fill_value='extrapolate')(t_out)
+                t_ref = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            hold_reconstruct(x, fs_sample, fs_sample * L, n_out, order)
+            t_hold = time.perf_counter() - t0
+            buf = np.empty(n_out, dtype=np.float32)
+            t0 = time.perf_counter()
+            hold_reconstruct(x, fs_sample, fs_sample * L, n_out, order, out=buf)
+            t_f32 = time.perf_counter() - t0
+            print(f"{n_out:>10} {order:>5} {t_ref:>13.3f} {t_hold:>9.3f} "
+                  f"{t_f32:>13.3f} {t_ref / t_hold:>6.1f}")
@@ -0,0 +1,293 @@
+import functools
+import time
+
+import numpy as np
+from matplotlib.backends.backend_agg import RendererAgg
+from matplotlib.collections import LineCollection
+from matplotlib.colors import is_color_like
+from matplotlib.font_manager import FontProperties, findfont, get_font
+
+from pointlabels import point_labels
+
+# --- Τοποθέτηση ετικετών σημείων χωρίς επικαλύψεις ---
+#
+# Αντί για επαναληπτική «απώθηση» των ετικετών (adjustText, O(N^2) ανά
+# επανάληψη) κάθε ετικέτα δοκιμάζει με τη σειρά λίγες υποψήφιες θέσεις
+# γύρω από το σημείο της: πάνω, κάτω, δεξιά, αριστερά και διαγώνια, σε
+# 'rings' αποστάσεις. Κρατιέται η πρώτη θέση που είναι μέσα στους άξονες
+# και δεν επικαλύπτει σημείο ή ήδη τοποθετημένη ετικέτα. Οι επικαλύψεις με
+# σημεία ελέγχονται για όλες τις θέσεις μαζί (πίνακας αθροισμάτων σε
+# raster)· οι επικαλύψεις με ετικέτες σε ομοιόμορφο πλέγμα (LabelGrid) πάνω
+# από τα ορθογώνια σε pixels, όπου κάθε έλεγχος κοιτά μόνο τα γειτονικά
+# κελιά. Ο συνολικός χρόνος είναι σχεδόν γραμμικός στο πλήθος των ετικετών.
+#
+# Ετικέτα που απομακρύνθηκε από το σημείο της (ring > 0) παίρνει γραμμή
+# οδηγό. Ετικέτα χωρίς ελεύθερη θέση παραλείπεται· η σειρά είναι η σειρά
+# των σημείων (ή κατά φθίνουσα 'priority'), άρα σε πυκνές περιοχές τα
+# αποτελέσματα αραιώνουν πάντα με τον ίδιο τρόπο.
+
+# Κατευθύνσεις των υποψήφιων θέσεων, με σειρά προτίμησης
+DIRECTIONS = np.array([(0, 1), (0, -1), (1, 0), (-1, 0),
+                       (1, 1), (-1, 1), (1, -1), (-1, -1)], dtype=float)
+
+class LabelGrid:
+    """
+    Ομοιόμορφο πλέγμα κελιών 'cell' pixels με τα ορθογώνια (x0, y0, x1, y1)
+    που έχουν καταχωρηθεί. Κάθε ορθογώνιο γράφεται σε όλα τα κελιά που καλύπτει.
+    """
+
+    def __init__(self, cell):
+        self.cell = float(cell)
+        self.cells = {}
+        self.boxes = []
+
+    def _keys(self, box):
+        c = self.cell
+        for i in range(int(box[0] // c), int(box[2] // c) + 1):
+            for j in range(int(box[1] // c), int(box[3] // c) + 1):
+                yield i, j
+
+    def insert(self, box):
+        index = len(self.boxes)
+        self.boxes.append(box)
+        for key in self._keys(box):
+            self.cells.setdefault(key, []).append(index)
+
+    def collides(self, box):
+        x0, y0, x1, y1 = box
+        c, cells, boxes = self.cell, self.cells, self.boxes
+        j0, j1 = int(y0 // c), int(y1 // c) + 1
+        for i in range(int(x0 // c), int(x1 // c) + 1):
+            for j in range(j0, j1):
+                for index in cells.get((i, j), ()):
+                    b = boxes[index]
+                    if b[0] < x1 and x0 < b[2] and b[1] < y1 and y0 < b[3]:
+                        return True
+        return False
+
+def place_labels(anchors, sizes, bounds, gap=2.0, rings=3, marker=6.0, priority=None,
+                 obstacles=(), avoid=None):
+    """
+    Θέσεις για ετικέτες μεγέθους sizes (N, 2) (πλάτος, ύψος) γύρω από τα
+    σημεία anchors (N, 2), όλα σε pixels, μέσα στο bounds (x0, y0, x1, y1).
+    marker: πλευρά του τετραγώνου κάθε σημείου, που δεν καλύπτεται από ετικέτες.
+    obstacles: επιπλέον ορθογώνια προς αποφυγή (π.χ. infobox).
+    avoid: επιπλέον σημεία (M, 2) με το ίδιο περιθώριο (π.χ. γραμμές σε πυκνά δείγματα).
+
+    Επιστρέφει (κέντρα (N, 2), placed (N,) bool, leader (N,) bool).
+    """
+    anchors = np.asarray(anchors, dtype=float).reshape(-1, 2)
+    sizes = np.broadcast_to(np.asarray(sizes, dtype=float), anchors.shape)
+    n = len(anchors)
+    centers = np.full((n, 2), np.nan)
+    placed = np.zeros(n, dtype=bool)
+    leader = np.zeros(n, dtype=bool)
+    if n == 0:
+        return centers, placed, leader
+
+    # Όλες οι υποψήφιες θέσεις μαζί: (N, rings * 8, 4)
+    half = sizes / 2
+    steps = gap + marker / 2 + np.arange(rings)[:, None] * (sizes[:, 1].max() + gap)
+    offsets = DIRECTIONS[None, :, None, :] * (half[None, None] + steps[:, None, None, None])
+    candidates = anchors[None, None] + offsets              # (rings, 8, N, 2)
+    candidates = candidates.reshape(-1, n, 2).transpose(1, 0, 2)
+    boxes = np.concatenate([candidates - half[:, None], candidates + half[:, None]], axis=2)
+    x0, y0, x1, y1 = bounds
+    free = ((boxes[..., 0] >= x0) & (boxes[..., 1] >= y0)
+              & (boxes[..., 2] <= x1) & (boxes[..., 3] <= y1))
+
+    # Τα σημεία είναι σταθερά εμπόδια: όσα πέφτουν μέσα σε κάθε υποψήφιο
+    # ορθογώνιο (διευρυμένο κατά marker / 2) μετρώνται όλα μαζί από έναν
+    # πίνακα αθροισμάτων (summed-area table) πάνω σε raster 1 pixel
+    points = anchors if avoid is None else np.concatenate([anchors, np.reshape(avoid, (-1, 2))])
+    free &= _point_counts(points, boxes + marker / 2 * np.array([-1, -1, 1, 1]), bounds) == 0
+
+    grid = LabelGrid(max(np.median(sizes[:, 1]), 1.0))
+    for box in obstacles:
+        grid.insert(tuple(box))
+    order = np.arange(n) if priority is None else np.argsort(-np.asarray(priority), kind='stable')
+    per_ring = len(DIRECTIONS)
+    for i in order:
+        row = boxes[i].tolist()
+        for k in np.flatnonzero(free[i]).tolist():
+            box = row[k]
+            if not grid.collides(box):
+                grid.insert(box)
+                centers[i] = candidates[i, k]
+                placed[i] = True
+                leader[i] = k >= per_ring
+                break
+    return centers, placed, leader
+
+def _point_counts(points, boxes, bounds):
+    # Πλήθος σημείων μέσα σε κάθε ορθογώνιο (..., 4), με ακρίβεια pixel
+    x0, y0, x1, y1 = bounds
+    w, h = int(np.ceil(x1 - x0)) + 1, int(np.ceil(y1 - y0)) + 1
+    points = points[np.all(np.isfinite(points), axis=1)]
+    ix = np.floor(points[:, 0] - x0).astype(np.int64)
+    iy = np.floor(points[:, 1] - y0).astype(np.int64)
+    keep = (ix >= 0) & (ix < w) & (iy >= 0) & (iy < h)
+    table = np.zeros((h + 1, w + 1), dtype=np.int32)
+    np.add.at(table, (iy[keep] + 1, ix[keep] + 1), 1)
+    table = table.cumsum(axis=0).cumsum(axis=1)
+    lo_x = np.clip(np.floor(boxes[..., 0] - x0).astype(np.int64) + 1, 0, w)
+    hi_x = np.clip(np.floor(boxes[..., 2] - x0).astype(np.int64) + 1, 0, w)
+    lo_y = np.clip(np.floor(boxes[..., 1] - y0).astype(np.int64) + 1, 0, h)
+    hi_y = np.clip(np.floor(boxes[..., 3] - y0).astype(np.int64) + 1, 0, h)
+    return table[hi_y, hi_x] - table[lo_y, hi_x] - table[hi_y, lo_x] + table[lo_y, lo_x]
+
+def leader_segments(anchors, centers, sizes):
+    """
+    Τμήματα από κάθε σημείο ως το πλησιέστερο άκρο της ετικέτας του
+    (στην ευθεία προς το κέντρο της). Επιστρέφει πίνακα (N, 2, 2).
+    """
+    anchors, centers = np.asarray(anchors, float), np.asarray(centers, float)
+    half = np.broadcast_to(np.asarray(sizes, float), centers.shape) / 2
+    d = centers - anchors
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.min(np.where(d != 0, half / np.abs(d), np.inf), axis=1)
+    edge = centers - d * np.minimum(s, 1.0)[:, None]
+    return np.stack([anchors, edge], axis=1)
+
+# --- Μεγέθη ετικετών ---
+#
+# Η μέτρηση κάθε κειμένου με τον renderer κοστίζει ~0.5 ms, δηλαδή
+# δευτερόλεπτα για χιλιάδες ετικέτες. Το πλάτος εκτιμάται ως άθροισμα των
+# πλατών (advance) των χαρακτήρων, που μετρώνται μία φορά ανά γραμματοσειρά.
+# Η εκτίμηση είναι λίγο μεγαλύτερη από το πραγματικό πλάτος (χωρίς kerning),
+# άρα οι ετικέτες δεν επικαλύπτονται.
+
+@functools.lru_cache(maxsize=16)
+def _font_metrics(fontsize, dpi):
+    prop = FontProperties(size=fontsize)
+    font = get_font(findfont(prop))
+    _, height, _ = RendererAgg(1, 1, dpi).get_text_width_height_descent("(0g|", prop, ismath=False)
+    return font, {}, float(height)
+
+def text_sizes(texts, fontsize=7.5, dpi=100):
+    """
+    (πλάτος, ύψος) σε pixels για κάθε κείμενο μίας γραμμής.
+    """
+    font, widths, height = _font_metrics(fontsize, dpi)
+    sizes = np.empty((len(texts), 2))
+    sizes[:, 1] = height
+    for i, text in enumerate(texts):
+        w = 0.0
+        for ch in text:
+            if ch not in widths:
+                font.set_size(fontsize, dpi)
+                widths[ch] = font.load_char(ord(ch)).linearHoriAdvance / 65536
+            w += widths[ch]
+        sizes[i, 0] = w
+    return sizes
+
+def line_samples(ax, step=2.0):
+    """
+    Σημεία (σε pixels) κάθε 'step' pixels πάνω στις γραμμές του ax, ώστε οι
+    ετικέτες να μην τις καλύπτουν.
+    """
+    samples = []
+    for line in ax.lines:
+        if line.get_linestyle() in ('None', '', ' ', 'none'):
+            continue
+        xy = line.get_transform().transform(np.asarray(line.get_xydata(), dtype=float))
+        xy = xy[np.all(np.isfinite(xy), axis=1)]
+        for a, b in zip(xy[:-1], xy[1:]):
+            n = max(int(np.hypot(*(b - a)) // step), 1)
+            samples.append(a + (b - a) * (np.arange(n) / n)[:, None])
+        samples.append(xy[-1:])
+    return np.concatenate(samples) if samples else np.zeros((0, 2))
+
+def label_points(ax, x, y, texts, colors=None, fontsize=7.5, alpha=0.7, gap=2.0, rings=3,
+                 marker=None, priority=None, obstacles=(), avoid_lines=True, leader_kw=None):
+    """
+    Ετικέτες texts στα σημεία (x, y) του ax χωρίς επικαλύψεις, με γραμμές
+    οδηγούς όπου χρειάζεται. Οι θέσεις υπολογίζονται με τον τρέχοντα
+    μετασχηματισμό, άρα η κλήση γίνεται αφού οριστούν κλίμακες, όρια και
+    διάταξη (tight_layout). Οι ετικέτες απέχουν από τα σημεία σε points
+    (offset points), οπότε δεν μετακινούνται με το dpi του savefig.
+
+    marker=None: το μεγαλύτερο markersize των γραμμών του ax (συν 2 pixels).
+    Με avoid_lines=True οι ετικέτες αποφεύγουν και τις γραμμές του ax.
+
+    Επιστρέφει (PointLabels, LineCollection ή None, πλήθος που παραλείφθηκαν).
+    """
+    fig = ax.figure
+    if marker is None:
+        sizes_pt = [line.get_markersize() for line in ax.lines
+                    if line.get_marker() not in ('None', '', None)]
+        marker = max(sizes_pt, default=0.0) * fig.dpi / 72 + 2.0
+    avoid = line_samples(ax) if avoid_lines else None
+    anchors = ax.transData.transform(np.column_stack([np.ravel(x), np.ravel(y)]).astype(float))
+    sizes = text_sizes(texts, fontsize, fig.dpi) + 2.0
+    centers, placed, leader = place_labels(anchors, sizes, ax.bbox.extents, gap, rings,
+                                           marker, priority, obstacles, avoid)
+    if colors is None or is_color_like(colors):
+        colors = [colors] * len(texts)
+    points = (centers - anchors) * 72 / fig.dpi
+    keep = np.flatnonzero(placed)
+    labels = point_labels(ax, np.ravel(x)[keep], np.ravel(y)[keep], [texts[i] for i in keep],
+                          offsets=points[keep], ha='center', va='center', fontsize=fontsize,
+                          alpha=alpha, color=[colors[i] for i in keep])
+    lines = None
+    if leader.any():
+        segments = leader_segments(anchors[leader], centers[leader], sizes[leader])
+        kw = dict(colors='gray', linewidths=0.5, alpha=0.5)
+        kw.update(leader_kw or {})
+        lines = LineCollection(ax.transData.inverted().transform(segments.reshape(-1, 2))
+                               .reshape(-1, 2, 2), **kw)
+        ax.add_collection(lines, autolim=False)
+    return labels, lines, int(len(texts) - placed.sum())
+
+# --- Χρόνος τοποθέτησης για 30, 1000 και 10000 ετικέτες ---
+if __name__ == "__main__":
+    import matplotlib
+    matplotlib.use("Agg")
+    import os
+    import tempfile
+    import matplotlib.pyplot as plt
+
+    rng = np.random.default_rng(0)
+    try:
+        from adjustText import adjust_text
+    except ImportError:
+        adjust_text = None
+
+    print(f"{'ετικέτες':>9} {'τοποθέτηση':>11} {'σύνολο':>9} {'τοποθετήθηκαν':>14} "
+          f"{'οδηγοί':>7} {'adjustText':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (30, 1000, 10000):
+            if n == 30:
+                x = np.linspace(-1.5, 1.5, n)
+                y = 10 * np.tanh(2 * x)
+            else:
+                x = rng.uniform(0, 10, n)
+                y = np.sin(x) + rng.normal(0, 0.3, n)
+            texts = [f"({a:.2f}, {b:.2f})" for a, b in zip(x, y)]
+
+            fig, ax = plt.subplots(figsize=(11, 7))
+            ax.plot(x, y, 'o', markersize=3)
+            fig.tight_layout()
+            t0 = time.perf_counter()
+            anchors = ax.transData.transform(np.column_stack([x, y]))
+            sizes = text_sizes(texts, 7.5, fig.dpi) + 2.0
+            _, placed, leader = place_labels(anchors, sizes, ax.bbox.extents)
+            t_place = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            label_points(ax, x, y, texts)
+            fig.savefig(os.path.join(tmp, f"labelplace_{n}.png"), dpi=100)
+            t_total = time.perf_counter() - t0
+            plt.close(fig)
+
+            t_adjust = "-"
+            if adjust_text is not None and n <= 1000:
+                fig, ax = plt.subplots(figsize=(11, 7))
+                ax.plot(x, y, 'o', markersize=3)
+                t0 = time.perf_counter()
+                adjust_text([ax.text(a, b, s, fontsize=7.5) for a, b, s in zip(x, y, texts)], ax=ax)
+                t_adjust = f"{(time.perf_counter() - t0) * 1e3:.0f} ms"
+                plt.close(fig)
+            print(f"{n:>9} {t_place * 1e3:>8.1f} ms {t_total * 1e3:>6.0f} ms "
+                  f"{placed.sum():>14} {leader.sum():>7} {t_adjust:>11}")
+    if adjust_text is None:
+        print("(το adjustText δεν είναι εγκατεστημένο)")
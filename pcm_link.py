@@ -0,0 +1,226 @@
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from dsp import f_max
+from quantizer import UniformQuantizer
+from reconstruct_stream import StreamingLPFReconstructor
+from tonebank import ToneBank, m_tones
+
+# --- Ζεύξη PCM σε ροή: πηγή -> δειγματολήπτης -> κβαντιστής -> bits ->
+#     κανάλι -> αποκωδικοποιητής -> ανακατασκευή LPF ---
+#
+# Κάθε στάδιο είναι αντικείμενο με κατάσταση που δέχεται ένα κομμάτι και
+# επιστρέφει το επόμενο, οπότε η μνήμη εξαρτάται μόνο από το μέγεθος του
+# κομματιού. Ο χρόνος και το πλήθος εξόδου κάθε σταδίου μετρώνται χωριστά.
+
+class Sampler:
+    """
+    Κρατά ένα δείγμα ανά K του «συνεχούς» σήματος (fs_cont = K * fs_sample),
+    με σωστή φάση από κομμάτι σε κομμάτι.
+    """
+
+    def __init__(self, K):
+        self.K = K
+        self.position = 0
+
+    def __call__(self, block):
+        start = -self.position % self.K
+        self.position += len(block)
+        return block[start::self.K]
+
+class BitPacker:
+    """
+    Κωδικοί n_bits (MSB πρώτο) -> bytes· τα bits που δεν συμπληρώνουν byte
+    περιμένουν το επόμενο κομμάτι.
+    """
+
+    def __init__(self, n_bits):
+        self.n_bits = n_bits
+        self._pending = np.zeros(0, dtype=np.uint8)
+
+    def __call__(self, codes):
+        # Κάθε κωδικός ως big-endian bytes, από τα οποία κρατάμε τα n_bits χαμηλότερα bits
+        width = (self.n_bits + 7) // 8
+        as_bytes = codes.astype(f'>u{width}' if width > 1 else np.uint8).view(np.uint8)
+        bits = np.unpackbits(as_bytes.reshape(-1, width), axis=1)[:, 8 * width - self.n_bits:]
+        bits = np.concatenate([self._pending, bits.reshape(-1)])
+        n_whole = len(bits) // 8 * 8
+        self._pending = bits[n_whole:]
+        return np.packbits(bits[:n_whole])
+
+class BitUnpacker:
+    """
+    Bytes -> κωδικοί n_bits· τα bits που δεν συμπληρώνουν κωδικό περιμένουν.
+    """
+
+    def __init__(self, n_bits):
+        self.n_bits = n_bits
+        self._weights = 1 << np.arange(n_bits - 1, -1, -1, dtype=np.int64)
+        self._pending = np.zeros(0, dtype=np.uint8)
+
+    def __call__(self, packed):
+        bits = np.concatenate([self._pending, np.unpackbits(packed)])
+        n_codes = len(bits) // self.n_bits
+        self._pending = bits[n_codes * self.n_bits:]
+        return bits[:n_codes * self.n_bits].reshape(n_codes, self.n_bits) @ self._weights
+
+class BSCChannel:
+    """
+    Δυαδικό συμμετρικό κανάλι: κάθε bit αντιστρέφεται με πιθανότητα p (XOR στα bytes).
+    """
+
+    def __init__(self, p, rng):
+        self.p = p
+        self.rng = rng
+        self.bit_errors = 0
+
+    def __call__(self, packed):
+        flips = np.packbits(self.rng.random(8 * len(packed)) < self.p)
+        self.bit_errors += int(np.unpackbits(flips).sum())
+        return packed ^ flips
+
+class AWGNChannel:
+    """
+    BPSK (+1/-1) σε AWGN με Eb/N0 σε dB και απόφαση με κατώφλι στο 0.
+    """
+
+    def __init__(self, ebn0_db, rng):
+        self.sigma = np.sqrt(1 / (2 * 10 ** (ebn0_db / 10)))
+        self.rng = rng
+        self.bit_errors = 0
+
+    def __call__(self, packed):
+        bits = np.unpackbits(packed)
+        symbols = 1.0 - 2.0 * bits
+        symbols += self.sigma * self.rng.standard_normal(len(bits))
+        received = (symbols < 0).astype(np.uint8)
+        self.bit_errors += int(np.count_nonzero(received != bits))
+        return np.packbits(received)
+
+def pcm_link(duration, n_bits=8, channel='awgn', snr=10.0, fs_cont=50 * f_max, K=15,
+             v_min=-6, v_max=6, block_size=1 << 16, half_taps=32, seed=0, counters=None):
+    """
+    Γεννήτρια: ροή κομματιών (ανακατασκευή, αναφορά) στο fs_cont για
+    'duration' δευτερόλεπτα του m(t). channel: 'awgn' (snr = Eb/N0 σε dB),
+    'bsc' (snr = πιθανότητα σφάλματος bit) ή None (χωρίς κανάλι).
+
+    counters: λεξικό που γεμίζει με {στάδιο: [χρόνος σε s, πλήθος εξόδου]},
+    'bit_errors' / 'bits' για το κανάλι και 'warmup': τα half_taps * K
+    πρώτα δείγματα εξόδου, στα οποία το φίλτρο ανακατασκευής δεν έχει
+    ακόμη ιστορικό (η πηγή αρχίζει στο t = 0).
+    """
+    counters = {} if counters is None else counters
+    rng = np.random.default_rng(seed)
+    quantizer = UniformQuantizer(1 << n_bits, v_min, v_max)
+    chan = {'awgn': lambda: AWGNChannel(snr, rng), 'bsc': lambda: BSCChannel(snr, rng),
+            None: lambda: (lambda packed: packed)}[channel]()
+    unpacker = BitUnpacker(n_bits)
+    stages = [('sampler', Sampler(K)),
+              ('quantizer', quantizer.encode),
+              ('packer', BitPacker(n_bits)),
+              ('channel', chan),
+              ('unpacker', unpacker),
+              ('decoder', quantizer.decode),
+              ('reconstruct', StreamingLPFReconstructor(fs_cont / K, fs_cont,
+                                                        half_taps=half_taps).process)]
+    for name in ['source'] + [name for name, _ in stages]:
+        counters.setdefault(name, [0.0, 0])
+    counters['warmup'] = half_taps * K
+
+    source = ToneBank(*m_tones(), fs_cont, block_size=block_size)
+    reference = ToneBank(*m_tones(), fs_cont, block_size=block_size)
+    n_total = int(round(duration * fs_cont))
+    produced = 0
+    while produced < n_total:
+        t0 = time.perf_counter()
+        data = source.synthesize(min(block_size, n_total - produced))
+        counters['source'][0] += time.perf_counter() - t0
+        counters['source'][1] += len(data)
+        produced += len(data)
+        for name, stage in stages:
+            t0 = time.perf_counter()
+            data = stage(data)
+            counters[name][0] += time.perf_counter() - t0
+            counters[name][1] += len(data)
+        if len(data):
+            yield data, reference.synthesize(len(data))
+    counters['bit_errors'] = getattr(chan, 'bit_errors', 0)
+    counters['bits'] = counters['packer'][1] * 8
+
+def run_link(duration, n_bits=8, channel='awgn', snr=10.0, seed=0, warmup=None, **kwargs):
+    """
+    Εκτελεί τη ζεύξη και επιστρέφει λεξικό με BER, SNR ανακατασκευής (dB)
+    και τους μετρητές των σταδίων. Κατάλληλο για ProcessPoolExecutor.
+
+    warmup: δείγματα εξόδου που δεν μετράνε στο SNR (ούτε στο σφάλμα ούτε
+    στην ισχύ του σήματος). Προεπιλογή τα half_taps * K της ζεύξης: πριν
+    από το t = 0 το φίλτρο ανακατασκευής βλέπει μηδενικά, και το μεταβατικό
+    αυτό κυριαρχεί στο SNR σε σύντομες διάρκειες.
+    """
+    counters = {}
+    err = sig = 0.0
+    for recon, ref in pcm_link(duration, n_bits, channel, snr, seed=seed,
+                               counters=counters, **kwargs):
+        # Παράλειψη της προθέρμανσης, που μπορεί να απλώνεται σε πολλά κομμάτια
+        if warmup is None:
+            warmup = counters['warmup']
+        skip = min(warmup, len(recon))
+        warmup -= skip
+        recon, ref = recon[skip:], ref[skip:]
+        err += np.sum((recon - ref) ** 2)
+        sig += np.dot(ref, ref)
+    return dict(channel=channel, snr=snr, n_bits=n_bits,
+                ber=counters['bit_errors'] / max(counters['bits'], 1),
+                snr_out_db=10 * np.log10(sig / err) if err else np.inf,
+                counters=counters)
+
+def sweep_link(snr_values, workers=None, **kwargs):
+    """
+    run_link για κάθε σημείο του καναλιού, παράλληλα (workers=1: σειριακά).
+    Κάθε σημείο παίρνει δικό του seed, οπότε τα αποτελέσματα δεν εξαρτώνται
+    από το πλήθος των διεργασιών.
+    """
+    seeds = np.random.SeedSequence(kwargs.pop('seed', 0)).generate_state(len(snr_values))
+    jobs = [dict(kwargs, snr=snr, seed=int(seed)) for snr, seed in zip(snr_values, seeds)]
+    if workers == 1:
+        return [run_link(**job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_job, jobs))
+
+def _run_job(job):
+    return run_link(**job)
+
+def main():
+    parser = argparse.ArgumentParser(description="Ζεύξη PCM σε ροή για το m(t).")
+    parser.add_argument('--duration', type=float, default=10.0, help="διάρκεια σήματος (s)")
+    parser.add_argument('--bits', type=int, default=8)
+    parser.add_argument('--channel', choices=['awgn', 'bsc'], default='awgn')
+    parser.add_argument('--snr', type=float, nargs='*', default=[0, 2, 4, 6, 8, 10],
+                        help="Eb/N0 σε dB (awgn) ή πιθανότητες σφάλματος (bsc)")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    results = sweep_link(args.snr, args.workers, duration=args.duration,
+                         n_bits=args.bits, channel=args.channel)
+    total = time.perf_counter() - t0
+
+    label = 'Eb/N0 (dB)' if args.channel == 'awgn' else 'p'
+    print(f"{label:>10} {'BER':>10} {'SNR εξόδου (dB)':>16}")
+    for r in results:
+        print(f"{r['snr']:>10g} {r['ber']:>10.2e} {r['snr_out_db']:>16.1f}")
+
+    print(f"\nΣτάδια (πρώτο σημείο, {args.duration:g} s σήματος):")
+    counters = results[0]['counters']
+    for name in ['source', 'sampler', 'quantizer', 'packer', 'channel',
+                 'unpacker', 'decoder', 'reconstruct']:
+        seconds, items = counters[name]
+        print(f"  {name:<12} {items:>12} στοιχεία εξόδου {seconds:>7.2f} s "
+              f"{items / max(seconds, 1e-12) / 1e6:>9.1f} M/s")
+    print(f"\n{len(results)} σημεία σε {total:.1f} s")
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,8 @@ import numpy as np
 from matplotlib.lines import Line2D
 from scipy.interpolate import make_interp_spline
 
+from pointlabels import point_labels
+
 # ==========================================
 # 1. ΕΙΣΑΓΩΓΗ ΚΑΙ ΠΡΟΕΤΟΙΜΑΣΙΑ ΔΕΔΟΜΕΝΩΝ
 # ==========================================
@@ -85,13 +87,12 @@ sns.scatterplot(
     s=120, edgecolor='black', zorder=10, ax=ax, legend=False 
 )
 
-# Ετικέτες Τιμών
-for i, row in df.iterrows():
-    ax.text(
-        row['Thesi_mm'], row['Tasi_Final'] + 0.04, 
-        f"({int(row['Thesi_mm'])}, {row['Tasi_Final']:.2f})",
-        color='black', fontsize=8, ha='center', fontweight='bold', zorder=15
-    )
+# Ετικέτες Τιμών (όλες ως ένα artist)
+point_labels(
+    ax, df['Thesi_mm'], df['Tasi_Final'] + 0.04,
+    [f"({int(x)}, {y:.2f})" for x, y in zip(df['Thesi_mm'], df['Tasi_Final'])],
+    color='black', fontsize=8, ha='center', fontweight='bold', zorder=15
+)
 
 # ==========================================
 # 4. ΟΠΤΙΚΟΠΟΙΗΣΗ ΜΕΤΡΗΣΕΩΝ (ΒΕΛΗ)
@@ -0,0 +1,203 @@
+import functools
+import time
+
+import numpy as np
+import matplotlib as mpl
+from matplotlib.collections import PathCollection
+from matplotlib.colors import is_color_like, to_rgba
+from matplotlib.font_manager import FontProperties, findfont, get_font
+from matplotlib.patches import BoxStyle
+from matplotlib.path import Path
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Bbox, IdentityTransform
+
+# --- Ετικέτες τιμών σε σημεία ως ένα artist ανά σειρά ---
+#
+# Ένα ax.annotate / ax.text ανά σημείο σημαίνει ένα Text (και ένα
+# FancyBboxPatch αν έχει bbox) ανά σημείο, που κάνει layout και draw
+# ξεχωριστά. Εδώ όλες οι ετικέτες μιας σειράς είναι ένα PathCollection:
+# κάθε ετικέτα είναι το περίγραμμα (path) του κειμένου της, σε points,
+# μετατοπισμένο στο σημείο της (offsets σε συντεταγμένες δεδομένων). Τα
+# πλαίσια και τα κείμενα σχεδιάζονται σε μία κλήση draw_path_collection,
+# με κοινές ιδιότητες (γραμματοσειρά, στοίχιση, χρώματα).
+#
+# Τα περιγράμματα των χαρακτήρων υπολογίζονται μία φορά ανά γραμματοσειρά
+# και το path κάθε κειμένου (μαζί με στοίχιση και πλαίσιο) μία φορά ανά
+# διαφορετικό κείμενο, οπότε ετικέτες που επαναλαμβάνονται δεν κοστίζουν
+# νέο layout. Τα paths είναι σε points και κλιμακώνονται με το dpi στη
+# σχεδίαση, άρα το savefig σε άλλο dpi δίνει το ίδιο γράφημα.
+#
+# Το αποτέλεσμα δεν είναι ίδιο pixel προς pixel με το ax.annotate: τα
+# κείμενα σχεδιάζονται ως περιγράμματα χαρακτήρων, χωρίς hinting και
+# χωρίς kerning, οπότε οι ετικέτες διαφέρουν ελαφρά στην απόσταση των
+# χαρακτήρων και στην εξομάλυνση.
+
+def _font_key(fontsize, fontweight, family):
+    if family is None:
+        family = tuple(mpl.rcParams['font.family'])
+    return float(fontsize), fontweight, tuple(np.atleast_1d(family).tolist())
+
+@functools.lru_cache(maxsize=16)
+def _font(key):
+    fontsize, fontweight, family = key
+    prop = FontProperties(size=fontsize, weight=fontweight, family=list(family))
+    font = get_font(findfont(prop))
+    # Κατακόρυφα όρια της γραμμής (όπως το Text, από τα "lp")
+    extents = TextPath((0, 0), "lp", prop=prop).get_extents()
+    return prop, font, extents.y0, extents.y1
+
+@functools.lru_cache(maxsize=4096)
+def _glyph(key, ch):
+    # Περίγραμμα και πλάτος (advance) ενός χαρακτήρα, σε points
+    prop, font, _, _ = _font(key)
+    font.set_size(key[0], 72)
+    advance = font.load_char(ord(ch)).linearHoriAdvance / 65536
+    if ch.isspace():
+        return np.zeros((0, 2)), np.zeros(0, dtype=Path.code_type), advance
+    path = TextPath((0, 0), ch, prop=prop)
+    return path.vertices, path.codes, advance
+
+@functools.lru_cache(maxsize=65536)
+def _text_path(key, text, ha, va, boxstyle):
+    """
+    (path κειμένου, path πλαισίου ή None) για ετικέτα μίας γραμμής,
+    στοιχισμένα στο (0, 0) κατά ha / va, σε points.
+    """
+    prop, _, y0, y1 = _font(key)
+    if '$' in text:
+        path = TextPath((0, 0), text, prop=prop)
+        width = path.get_extents().x1
+        vertices, codes = path.vertices, path.codes
+    else:
+        pieces, x = [], 0.0
+        for ch in text:
+            v, c, advance = _glyph(key, ch)
+            pieces.append((v + (x, 0.0), c))
+            x += advance
+        width = x
+        vertices = np.concatenate([v for v, _ in pieces] or [np.zeros((0, 2))])
+        codes = np.concatenate([c for _, c in pieces] or [np.zeros(0, dtype=Path.code_type)])
+    dx = {'left': 0.0, 'center': -width / 2, 'right': -width}[ha]
+    dy = {'baseline': 0.0, 'bottom': -y0, 'top': -y1, 'center': -(y0 + y1) / 2,
+          'center_baseline': -(y0 + y1) / 2}[va]
+    text_path = Path(vertices + (dx, dy), codes) if len(codes) else Path(np.zeros((1, 2)), None)
+    box_path = None
+    if boxstyle is not None:
+        box_path = BoxStyle(boxstyle)(dx, y0 + dy, width, y1 - y0, key[0])
+    return text_path, box_path
+
+def _per_label(value, n):
+    # Κοινή τιμή ή μία ανά ετικέτα
+    if isinstance(value, str) or np.ndim(value) == 0:
+        return [value] * n
+    return list(value)
+
+class PointLabels(PathCollection):
+    """
+    Ετικέτες texts στα σημεία (x, y) (συντεταγμένες δεδομένων) ως ένα artist.
+
+    offsets: μετατόπιση (dx, dy) σε points, κοινή ή (N, 2) ανά ετικέτα.
+    ha / va: στοίχιση όπως στο Text, κοινή ή ανά ετικέτα.
+    color: χρώμα κειμένου, κοινό ή ανά ετικέτα· alpha: διαφάνεια κειμένου.
+    bbox: όπως στο annotate, π.χ. dict(boxstyle="round,pad=0.3", fc="white",
+    ec="gray", alpha=0.7)· τα πλαίσια σχεδιάζονται κάτω από όλα τα κείμενα.
+    """
+
+    def __init__(self, x, y, texts, offsets=(0.0, 0.0), ha='center', va='baseline',
+                 fontsize=None, fontweight='normal', family=None, color=None, alpha=None,
+                 bbox=None, **kwargs):
+        texts = [str(t) for t in texts]
+        n = len(texts)
+        fontsize = mpl.rcParams['font.size'] if fontsize is None else fontsize
+        key = _font_key(fontsize, fontweight, family)
+        shifts = np.broadcast_to(np.asarray(offsets, dtype=float), (n, 2))
+        colors = [color] * n if color is None or is_color_like(color) else list(color)
+        text_rgba = [to_rgba(mpl.rcParams['text.color'] if c is None else c, alpha) for c in colors]
+
+        bbox = dict(bbox) if bbox else None
+        boxstyle = bbox.pop('boxstyle', 'square') if bbox else None
+        text_paths, box_paths, extents = [], [], np.empty((n, 4))
+        for i, (text, shift, h, v) in enumerate(zip(texts, shifts, _per_label(ha, n),
+                                                    _per_label(va, n))):
+            text_path, box_path = _text_path(key, text, h, v, boxstyle)
+            text_paths.append(Path(text_path.vertices + shift, text_path.codes))
+            if box_path is not None:
+                box_paths.append(Path(box_path.vertices + shift, box_path.codes))
+            outline = text_path if box_path is None else box_path
+            extents[i] = outline.get_extents().extents + np.tile(shift, 2)
+
+        facecolors, edgecolors, linewidths = [], [], []
+        if box_paths:
+            box_alpha = bbox.get('alpha')
+            facecolors += [to_rgba(bbox.get('fc', bbox.get('facecolor', 'white')), box_alpha)] * n
+            edgecolors += [to_rgba(bbox.get('ec', bbox.get('edgecolor', 'black')), box_alpha)] * n
+            linewidths += [bbox.get('lw', bbox.get('linewidth', 1.0))] * n
+        facecolors += text_rgba
+        edgecolors += [(0, 0, 0, 0)] * n
+        linewidths += [0.0] * n
+
+        # Τα paths είναι σε points (κλίμακα dpi / 72 από τα sizes), όπως στο scatter
+        kwargs.setdefault('transform', IdentityTransform())
+        kwargs.setdefault('zorder', 3)
+        kwargs.setdefault('clip_on', False)
+        super().__init__(box_paths + text_paths, sizes=[1.0],
+                         offsets=np.tile(np.column_stack([x, y]), (2 if box_paths else 1, 1)),
+                         facecolors=facecolors, edgecolors=edgecolors, linewidths=linewidths,
+                         **kwargs)
+        self.texts = texts
+        self._label_extents = extents
+
+    def get_window_extent(self, renderer=None):
+        # Το PathCollection δίνει κενό πλαίσιο όταν τα paths δεν είναι σε
+        # συντεταγμένες δεδομένων· εδώ υπολογίζεται όπως στα Text, ώστε οι
+        # ετικέτες να μετράνε στο tight_layout και στο bbox_inches='tight'
+        if not len(self.texts):
+            return Bbox.null()
+        anchors = self.get_offset_transform().transform(self.get_offsets()[:len(self.texts)])
+        boxes = self._label_extents * self.figure.dpi / 72 + np.tile(anchors, 2)
+        boxes = boxes[np.all(np.isfinite(boxes), axis=1)]
+        if not len(boxes):
+            return Bbox.null()
+        return Bbox.from_extents(*boxes[:, :2].min(axis=0), *boxes[:, 2:].max(axis=0))
+
+def point_labels(ax, x, y, texts, **kwargs):
+    """
+    PointLabels στο ax (offsets στις συντεταγμένες δεδομένων του ax).
+    Δεν αλλάζει τα όρια των αξόνων, όπως και τα annotate.
+    """
+    labels = PointLabels(np.ravel(x), np.ravel(y), texts, offset_transform=ax.transData,
+                         **kwargs)
+    ax.add_collection(labels, autolim=False)
+    return labels
+
+# --- Χρόνος σχεδίασης: ένα annotate ανά σημείο έναντι PointLabels ---
+if __name__ == "__main__":
+    mpl.use("Agg")
+    import os
+    import tempfile
+    import matplotlib.pyplot as plt
+
+    bbox = dict(boxstyle="round,pad=0.3", fc="white", ec="gray", alpha=0.7)
+    print(f"{'σημεία':>7} {'annotate':>10} {'PointLabels':>12} {'ανά σημείο':>22}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (30, 300, 3000):
+            x = np.linspace(0, 100, n)
+            y = np.round(np.sin(x / 10), 1)
+            texts = [f"({xi:.0f}, {yi:.2f})" for xi, yi in zip(x, y)]
+            times = []
+            for batched in (False, True):
+                fig, ax = plt.subplots(figsize=(11, 7))
+                ax.plot(x, y, 'o-')
+                t0 = time.perf_counter()
+                if batched:
+                    point_labels(ax, x, y, texts, offsets=(0, 8), fontsize=9, fontweight='bold',
+                                 alpha=0.9, bbox=bbox)
+                else:
+                    for xi, yi, s in zip(x, y, texts):
+                        ax.annotate(s, (xi, yi), xytext=(0, 8), textcoords='offset points',
+                                    ha='center', fontsize=9, fontweight='bold', alpha=0.9, bbox=bbox)
+                fig.savefig(os.path.join(tmp, f"pointlabels_{batched}_{n}.png"), dpi=100)
+                times.append(time.perf_counter() - t0)
+                plt.close(fig)
+            print(f"{n:>7} {times[0] * 1e3:>7.0f} ms {times[1] * 1e3:>9.0f} ms "
+                  f"{times[0] / n * 1e6:>8.0f} / {times[1] / n * 1e6:.0f} μs")
@@ -0,0 +1,357 @@
+import time
+
+import numpy as np
+
+# --- Κβαντιστές με ακέραιους κωδικούς και αποκβάντιση με πίνακα (LUT) ---
+#
+# encode: σήμα -> κωδικοί 0..L-1 στον μικρότερο unsigned τύπο που χωρά το L
+# decode: κωδικοί -> τιμές ανακατασκευής μέσω np.take από τον πίνακα 'levels'
+#
+# Η κωδικοποίηση γίνεται σε μπλοκ με έναν βοηθητικό πίνακα float64 μήκους
+# block, οπότε η μνήμη πέρα από την έξοδο είναι σταθερή. Ο ομοιόμορφος
+# κβαντιστής δίνει ίδιες τιμές με το dsp.quantize_uniform (για είσοδο
+# float64)· οι mu-law / A-law συμπιέζουν πρώτα το σήμα στο [-1, 1] και
+# κβαντίζουν ομοιόμορφα εκεί.
+
+def code_dtype(L):
+    """
+    Ο μικρότερος unsigned ακέραιος τύπος για κωδικούς 0..L-1.
+    """
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+        if L - 1 <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    raise ValueError(f"L = {L} δεν χωρά σε uint64")
+
+class _LUTQuantizer:
+    """
+    Κοινή υλοποίηση: οι υποκλάσεις ορίζουν το _position(x, out), τη συνεχή
+    θέση του x στην κλίμακα των κωδικών (ο κωδικός είναι το floor της,
+    περιορισμένο στο [0, L-1]), και τον πίνακα levels.
+    """
+    block = 1 << 16
+
+    def __init__(self, L):
+        self.L = int(L)
+        self.dtype = code_dtype(self.L)
+
+    def encode(self, signal, out=None):
+        """
+        Κωδικοί (self.dtype) του σήματος· με out γράφονται σε αυτόν.
+        """
+        x = np.asarray(signal)
+        if out is None:
+            out = np.empty(x.shape, dtype=self.dtype)
+        elif out.shape != x.shape:
+            raise ValueError("Το out πρέπει να έχει το σχήμα του σήματος")
+        x_flat = x.reshape(-1)
+        out_flat = out.reshape(-1)  # view (σφάλμα αν το out δεν είναι συνεχές)
+        tmp = np.empty(min(self.block, x_flat.size), dtype=np.float64)
+        for start in range(0, x_flat.size, self.block):
+            t = tmp[:min(self.block, x_flat.size - start)]
+            self._position(x_flat[start:start + len(t)], t)
+            np.floor(t, out=t)
+            np.clip(t, 0, self.L - 1, out=t)
+            out_flat[start:start + len(t)] = t
+        return out
+
+    def decode(self, codes, out=None):
+        """
+        Τιμές ανακατασκευής από τον πίνακα levels (out: προαιρετικός float πίνακας).
+        """
+        codes = np.asarray(codes)
+        if out is None:
+            out = np.empty(codes.shape, dtype=self.levels.dtype)
+        codes_flat = codes.reshape(-1)
+        out_flat = out.reshape(-1)
+        # Σε μπλοκ: το np.take μετατρέπει τους δείκτες σε intp (8 bytes ανά κωδικό)
+        for start in range(0, codes_flat.size, self.block):
+            stop = start + self.block
+            np.take(self.levels, codes_flat[start:stop], out=out_flat[start:stop], mode='clip')
+        return out
+
+    def __call__(self, signal, out=None):
+        """
+        Κβάντιση: encode και decode (out: πίνακας για τις τιμές ανακατασκευής).
+        """
+        return self.decode(self.encode(signal), out=out)
+
+class UniformQuantizer(_LUTQuantizer):
+    """
+    Ομοιόμορφος κβαντιστής L επιπέδων στο [v_min, v_max] (όπως το quantize_uniform).
+    """
+
+    def __init__(self, L, v_min, v_max):
+        super().__init__(L)
+        self.v_min = v_min
+        self.v_max = v_max
+        self.delta = (v_max - v_min) / L
+        self.levels = v_min + (np.arange(self.L) + 0.5) * self.delta
+
+    def _position(self, x, out):
+        np.subtract(x, self.v_min, out=out)
+        np.divide(out, self.delta, out=out)
+
+class _CompandingQuantizer(_LUTQuantizer):
+    """
+    Συμπίεση στο [-1, 1], ομοιόμορφη κβάντιση L επιπέδων εκεί και
+    ανακατασκευή στο επεκταμένο κέντρο κάθε επιπέδου.
+    """
+
+    def __init__(self, L, v_max):
+        super().__init__(L)
+        self.v_max = v_max
+        centers = -1 + (np.arange(self.L) + 0.5) * (2 / self.L)
+        self.levels = self.expand(centers)
+
+    def _position(self, x, out):
+        np.divide(x, self.v_max, out=out)
+        np.clip(out, -1, 1, out=out)
+        self._compress(out)
+        out += 1
+        out *= self.L / 2
+
+class MuLawQuantizer(_CompandingQuantizer):
+    """
+    Κβαντιστής mu-law: y = sgn(x) ln(1 + mu |x| / V) / ln(1 + mu).
+    """
+
+    def __init__(self, L, v_max, mu=255.0):
+        self.mu = float(mu)
+        super().__init__(L, v_max)
+
+    def _compress(self, u):
+        # Επί τόπου στο u = x / V
+        sign = np.sign(u)
+        np.abs(u, out=u)
+        u *= self.mu
+        np.log1p(u, out=u)
+        u *= sign / np.log1p(self.mu)
+
+    def expand(self, y):
+        y = np.asarray(y, dtype=float)
+        return self.v_max * np.sign(y) * np.expm1(np.abs(y) * np.log1p(self.mu)) / self.mu
+
+class ALawQuantizer(_CompandingQuantizer):
+    """
+    Κβαντιστής A-law: y = sgn(x) A|u| / (1 + ln A) για |u| < 1/A,
+    αλλιώς sgn(x) (1 + ln(A|u|)) / (1 + ln A), u = x / V.
+    """
+
+    def __init__(self, L, v_max, A=87.6):
+        self.A = float(A)
+        super().__init__(L, v_max)
+
+    def _compress(self, u):
+        sign = np.sign(u)
+        np.abs(u, out=u)
+        u *= self.A
+        # A|u| < 1: γραμμικό τμήμα, αλλιώς 1 + ln(A|u|)
+        log_part = u >= 1
+        np.log(u, out=u, where=log_part)
+        u += log_part
+        u *= sign / (1 + np.log(self.A))
+
+    def expand(self, y):
+        y = np.asarray(y, dtype=float)
+        a = np.abs(y) * (1 + np.log(self.A))
+        u = np.where(a < 1, a, np.exp(a - 1)) / self.A
+        return self.v_max * np.sign(y) * u
+
+class CodebookQuantizer(_LUTQuantizer):
+    """
+    Μη ομοιόμορφος κβαντιστής από κατώφλια και codebook (π.χ. Lloyd-Max):
+    κωδικός k όταν thresholds[k-1] <= x < thresholds[k], τιμή codebook[k].
+    """
+
+    def __init__(self, thresholds, codebook):
+        codebook = np.asarray(codebook, dtype=np.float64)
+        super().__init__(len(codebook))
+        self.thresholds = np.asarray(thresholds, dtype=np.float64)
+        if len(self.thresholds) != self.L - 1:
+            raise ValueError("Χρειάζονται L - 1 κατώφλια για L τιμές")
+        self.levels = codebook
+
+    def encode(self, signal, out=None):
+        x = np.asarray(signal)
+        if out is None:
+            out = np.empty(x.shape, dtype=self.dtype)
+        x_flat = x.reshape(-1)
+        out_flat = out.reshape(-1)
+        for start in range(0, x_flat.size, self.block):
+            stop = start + self.block
+            out_flat[start:stop] = np.searchsorted(self.thresholds, x_flat[start:stop], side='right')
+        return out
+
+# --- SQNR για όλες τις αναλύσεις n bits (L = 2**n) με ένα πέρασμα ---
+#
+# Με L = 2**n στο ίδιο [v_min, v_max] το βήμα είναι delta_n = (v_max - v_min) / 2**n,
+# δηλαδή το λεπτότερο βήμα επί δύναμη του 2 (ακριβές σε float). Άρα ο κωδικός
+# σε n bits είναι ακριβώς ο κωδικός στα n_max bits μετατοπισμένος κατά
+# n_max - n θέσεις: κάθε διάστημα είναι ένωση δύο διαστημάτων του επόμενου
+# επιπέδου. Αρκεί ένα ιστόγραμμα στα n_max bits με (πλήθος, sum r, sum r^2),
+# r = x - κέντρο διαστήματος, και συγχώνευση ανά ζεύγη προς τα πάνω:
+# r_γονέα = r_παιδιού + (κέντρο παιδιού - κέντρο γονέα).
+
+def sqnr_dtype():
+    return np.dtype([('n_bits', 'i8'),          # Bits ανά δείγμα
+                     ('L', 'i8'),               # Επίπεδα = 2**n_bits
+                     ('noise_power', 'f8'),     # Μέση ισχύς σφάλματος κβάντισης
+                     ('sqnr_db', 'f8')])        # 10 log10(ισχύς σήματος / ισχύς σφάλματος)
+
+def _reduce_bins(codes, count, R1, R2):
+    # Άθροιση (πλήθος, sum r, sum r^2) ανά κωδικό· επιστρέφει ταξινομημένους κωδικούς
+    codes, inverse = np.unique(codes, return_inverse=True)
+    return (codes, np.bincount(inverse, weights=count), np.bincount(inverse, weights=R1),
+            np.bincount(inverse, weights=R2))
+
+def _chunk_bins(codes, r, L):
+    # Ιστόγραμμα ενός κομματιού μόνο στους κωδικούς που εμφανίζονται. Όταν το
+    # κομμάτι είναι συγκρίσιμο με το L, το πυκνό bincount (μνήμη O(L) = O(κομματιού))
+    # είναι φθηνότερο από την ταξινόμηση του np.unique
+    if L > 4 * len(codes):
+        return _reduce_bins(codes, np.ones(len(codes)), r, r * r)
+    count = np.bincount(codes, minlength=L)
+    occupied = np.flatnonzero(count)
+    return (occupied, count[occupied].astype(np.float64),
+            np.bincount(codes, weights=r, minlength=L)[occupied],
+            np.bincount(codes, weights=r * r, minlength=L)[occupied])
+
+def _merge_bins(parts):
+    if len(parts) == 1:
+        return parts[0]
+    return _reduce_bins(*map(np.concatenate, zip(*parts)))
+
+def sqnr_sweep(signal_chunks, v_min, v_max, n_max=24, n_min=1):
+    """
+    Ισχύς σφάλματος του quantize_uniform(x, 2**n, v_min, v_max) για κάθε
+    n = n_min..n_max με ένα πέρασμα στα δείγματα (πίνακας ή ροή κομματιών,
+    π.χ. spectrum_stream.read_chunks). Κάθε επιπλέον ανάλυση κοστίζει μόνο
+    τη συγχώνευση των μη κενών διαστημάτων (το πολύ min(2**n, δείγματα)).
+    Το ιστόγραμμα κρατά μόνο τους κωδικούς που εμφανίστηκαν, οπότε η μνήμη
+    δεν εξαρτάται από το 2**n_max.
+
+    Επιστρέφει δομημένο πίνακα (βλ. sqnr_dtype) με αύξουσα σειρά n.
+    """
+    if isinstance(signal_chunks, np.ndarray):
+        signal_chunks = [signal_chunks]
+
+    def centers(k, n):
+        # Ίδια έκφραση με το quantize_uniform για L = 2**n
+        return v_min + (k + 0.5) * ((v_max - v_min) / (1 << n))
+
+    L = 1 << n_max
+    delta = (v_max - v_min) / L
+    # Αραιό ιστόγραμμα στα n_max bits (κωδικός, πλήθος, sum r, sum r^2). Τα
+    # ιστογράμματα των κομματιών συγχωνεύονται όταν το μέγεθός τους φτάσει
+    # αυτό του συνόλου, άρα κάθε διάστημα συγχωνεύεται O(log κομματιών) φορές
+    total = (np.zeros(0, dtype=np.int64),) + (np.zeros(0),) * 3
+    pending, pending_size = [], 0
+    n_total = 0
+    power = 0.0
+    for chunk in signal_chunks:
+        x = np.asarray(chunk, dtype=np.float64).reshape(-1)
+        # Ίδιος κωδικός με το UniformQuantizer(L, v_min, v_max).encode
+        codes = np.floor((x - v_min) / delta)
+        np.clip(codes, 0, L - 1, out=codes)
+        codes = codes.astype(np.int64)
+        r = x - centers(codes, n_max)
+        pending.append(_chunk_bins(codes, r, L))
+        pending_size += len(pending[-1][0])
+        if pending_size >= len(total[0]):
+            total = _merge_bins([total] * bool(len(total[0])) + pending)
+            pending, pending_size = [], 0
+        n_total += len(x)
+        power += np.dot(x, x)
+    codes, count, R1, R2 = _merge_bins([total] + pending)
+
+    result = np.zeros(n_max - n_min + 1, dtype=sqnr_dtype())
+    for n in range(n_max, n_min - 1, -1):
+        row = result[n - n_min]
+        row['n_bits'] = n
+        row['L'] = 1 << n
+        row['noise_power'] = np.sum(R2) / max(n_total, 1)
+        if n == n_min:
+            break
+        parent = codes >> 1
+        d = centers(codes, n) - centers(parent, n - 1)
+        R2 = R2 + 2 * d * R1 + count * d * d
+        R1 = R1 + count * d
+        starts = np.flatnonzero(np.diff(parent, prepend=-1))
+        count = np.add.reduceat(count, starts)
+        R1 = np.add.reduceat(R1, starts)
+        R2 = np.add.reduceat(R2, starts)
+        codes = parent[starts]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result['sqnr_db'] = 10 * np.log10(power / max(n_total, 1) / result['noise_power'])
+    return result
+
+# --- Throughput και μνήμη έναντι του αρχικού quantize_uniform ---
+if __name__ == "__main__":
+    import tracemalloc
+    from dsp import m, quantize_uniform
+
+    def quantize_uniform_orig(signal, L, v_min, v_max):
+        # Η αρχική υλοποίηση (τέσσερις ενδιάμεσοι πίνακες)
+        delta = (v_max - v_min) / L
+        signal_shifted = signal - v_min
+        indices = np.floor(signal_shifted / delta)
+        indices = np.clip(indices, 0, L - 1)
+        return v_min + (indices + 0.5) * delta
+
+    x = m(np.arange(10**7) / 60000)
+    for L in [16, 256, 65536]:
+        q = UniformQuantizer(L, -6, 6)
+        assert np.array_equal(q(x), quantize_uniform_orig(x, L, -6, 6))
+    for q in [MuLawQuantizer(256, 6), ALawQuantizer(256, 6)]:
+        err = q(x) - x
+        print(f"{type(q).__name__}: SQNR {10 * np.log10(np.mean(x**2) / np.mean(err**2)):.1f} dB "
+              f"(ομοιόμορφος 256: {10 * np.log10(np.mean(x**2) / np.mean((UniformQuantizer(256, -6, 6)(x) - x)**2)):.1f} dB)")
+
+    def measure(fn, repeats=3):
+        fn()
+        t0 = time.perf_counter()
+        for _ in range(repeats):
+            fn()
+        dt = (time.perf_counter() - t0) / repeats
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return dt, peak
+
+    # SQNR για n = 1..24 bits: ένα πέρασμα έναντι quantize_uniform ανά n
+    # (με λίγο θόρυβο, ώστε να γεμίζουν πολλά διαστήματα και στα 24 bits)
+    x_sweep = x + np.random.default_rng(0).normal(0, 0.01, len(x))
+    t0 = time.perf_counter()
+    sweep = sqnr_sweep(x_sweep, -6, 6, n_max=24)
+    t_sweep = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    brute = np.array([np.mean((quantize_uniform(x_sweep, 2**n, -6, 6) - x_sweep)**2)
+                      for n in sweep['n_bits']])
+    t_brute = time.perf_counter() - t0
+    rel = np.max(np.abs(sweep['noise_power'] - brute) / brute)
+    print(f"\nSQNR n = 1..24 σε {len(x_sweep):.0e} δείγματα: sqnr_sweep {t_sweep:.2f} s, "
+          f"quantize_uniform ανά n {t_brute:.2f} s, max σχετική διαφορά {rel:.1e}")
+    for n in [1, 4, 8, 16, 24]:
+        print(f"  n = {n:>2}: SQNR {sweep['sqnr_db'][n - 1]:6.1f} dB")
+
+    L = 16
+    q = UniformQuantizer(L, -6, 6)
+    codes = q.encode(x)
+    buf = np.empty_like(x)
+    cases = [
+        ("αρχικό quantize_uniform", lambda: quantize_uniform_orig(x, L, -6, 6)),
+        ("quantize_uniform", lambda: quantize_uniform(x, L, -6, 6)),
+        ("quantize_uniform(out=)", lambda: quantize_uniform(x, L, -6, 6, out=buf)),
+        (f"encode -> {q.dtype.name}", lambda: q.encode(x)),
+        ("encode(out=)", lambda: q.encode(x, out=codes)),
+        ("decode (LUT)", lambda: q.decode(codes)),
+        ("decode (LUT, out=)", lambda: q.decode(codes, out=buf)),
+        ("mu-law encode", lambda: MuLawQuantizer(L, 6).encode(x, out=codes)),
+        ("A-law encode", lambda: ALawQuantizer(L, 6).encode(x, out=codes)),
+    ]
+    print(f"\n{len(x):.0e} δείγματα, L = {L}")
+    print(f"{'':<26} {'M δείγματα/s':>13} {'μέγιστη μνήμη (MB)':>19}")
+    for name, fn in cases:
+        dt, peak = measure(fn)
+        print(f"{name:<26} {len(x) / dt / 1e6:>13.0f} {peak / 2**20:>19.1f}")
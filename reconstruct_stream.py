@@ -0,0 +1,123 @@
+import numpy as np
+from scipy.fft import rfft, irfft, next_fast_len
+
+# --- Ανακατασκευή LPF σε ροή (overlap-save, πολυφασικό windowed-sinc) ---
+
+def sinc_interp_kernel(L, half_taps=32, beta=8.0):
+    """
+    Πυρήνας παρεμβολής windowed-sinc (παράθυρο Kaiser) για λόγο L,
+    με αποκοπή στο fs_sample/2. Επιστρέφεται σε πολυφασική μορφή (L, 2K+1):
+    η γραμμή p δίνει τα δείγματα εξόδου στη θέση m*L + p.
+    """
+    K = half_taps
+    n = np.arange(2 * K * L + 1)
+    h = np.sinc((n - K * L) / L) * np.kaiser(len(n), beta)
+    # Συμπλήρωση ώστε κάθε φάση να έχει 2K+1 συντελεστές
+    h = np.concatenate([h, np.zeros(L - 1)])
+    return h.reshape(2 * K + 1, L).T
+
+class StreamingLPFReconstructor:
+    """
+    Ζωνοπερατή ανακατασκευή από fs_sample σε fs_out = L * fs_sample, μπλοκ
+    προς μπλοκ. Κάθε μπλοκ φιλτράρεται με overlap-save (FFT) και όλες οι L
+    φάσεις υπολογίζονται μαζί, οπότε η μνήμη εξαρτάται μόνο από το block_size
+    και η έξοδος αρχίζει με το πρώτο μπλοκ (καθυστέρηση half_taps δείγματα).
+    """
+
+    def __init__(self, fs_sample, fs_out, half_taps=32, block_size=4096, beta=8.0):
+        ratio = fs_out / fs_sample
+        L = int(round(ratio))
+        if L < 1 or abs(ratio - L) > 1e-9 * ratio:
+            raise ValueError("Το fs_out / fs_sample πρέπει να είναι ακέραιος")
+        self.L = L
+        self.half_taps = half_taps
+        self.block_size = block_size
+        self.h_poly = sinc_interp_kernel(L, half_taps, beta)
+        self._H_cache = {}
+        self.reset()
+
+    def reset(self):
+        # Ιστορικό 2K δειγμάτων (overlap) και δείγματα εξόδου προς απόρριψη
+        # ώστε η έξοδος να ευθυγραμμίζεται με t = 0
+        self._history = np.zeros(2 * self.half_taps)
+        self._skip = self.half_taps * self.L
+
+    def _filter_block(self, block):
+        n_hist = len(self._history)
+        buf = np.concatenate([self._history, block])
+        F = next_fast_len(len(buf), real=True)
+        H = self._H_cache.get(F)
+        if H is None:
+            H = self._H_cache[F] = rfft(self.h_poly, F, axis=1)
+        # Overlap-save: κρατάμε μόνο τα δείγματα χωρίς κυκλική αναδίπλωση
+        Y = irfft(rfft(buf, F) * H, F, axis=1)[:, n_hist:len(buf)]
+        self._history = buf[len(buf) - n_hist:]
+        # Διαπλοκή των φάσεων: (L, B) -> B*L δείγματα εξόδου
+        return Y.T.reshape(-1)
+
+    def process(self, chunk):
+        """
+        Επεξεργάζεται ένα κομμάτι δειγμάτων και επιστρέφει όση έξοδο είναι έτοιμη.
+        """
+        chunk = np.asarray(chunk, dtype=float)
+        out = [self._filter_block(chunk[i:i + self.block_size])
+               for i in range(0, len(chunk), self.block_size)]
+        out = np.concatenate(out) if out else np.zeros(0)
+        if self._skip:
+            n_drop = min(self._skip, len(out))
+            out = out[n_drop:]
+            self._skip -= n_drop
+        return out
+
+    def flush(self):
+        """
+        Εκκενώνει το φίλτρο (μηδενικά στο τέλος) και επιστρέφει την υπόλοιπη έξοδο.
+        """
+        return self.process(np.zeros(self.half_taps))
+
+def stream_lpf_reconstruct(sample_blocks, fs_sample, fs_out, **kwargs):
+    """
+    Γεννήτρια: δέχεται επαναλήψιμο από μπλοκ δειγμάτων και δίνει μπλοκ
+    ανακατασκευασμένου σήματος στο fs_out, μόλις είναι διαθέσιμα.
+    """
+    recon = StreamingLPFReconstructor(fs_sample, fs_out, **kwargs)
+    for block in sample_blocks:
+        out = recon.process(block)
+        if len(out):
+            yield out
+    yield recon.flush()
+
+# --- Έλεγχος ισοδυναμίας με την ανακατασκευή FFT (dsp.ideal_lpf_reconstruct) ---
+if __name__ == "__main__":
+    import time
+    from dsp import m, f_max, ideal_lpf_reconstruct
+
+    fs_cont = 50 * f_max
+    # Το 1500 Hz έχει alias στα 700 Hz, κοντά στο fs/2: χρειάζεται μακρύτερος πυρήνας
+    for fs_sample, T_duration, K in [(4000, 0.02, 32), (4000, 2.0, 32), (1500, 2.0, 64)]:
+        t_samp = np.arange(0, T_duration, 1/fs_sample)
+        t_cont = np.linspace(0, T_duration, int(fs_cont * T_duration), endpoint=False)
+        samples = m(t_samp)
+
+        m_fft = ideal_lpf_reconstruct(samples, t_samp, t_cont, fs_sample)
+        blocks = (samples[i:i + 1000] for i in range(0, len(samples), 1000))
+        m_stream = np.concatenate(list(stream_lpf_reconstruct(blocks, fs_sample, fs_cont,
+                                                                  half_taps=K)))
+
+        # Οι άκρες διαφέρουν: η FFT θεωρεί το σήμα περιοδικό, η ροή όχι
+        edge = K * (fs_cont // fs_sample)
+        diff = np.max(np.abs(m_fft - m_stream)[edge:-edge])
+        print(f"fs={fs_sample} Hz, T={T_duration} s: "
+              f"max |FFT - ροή| (εσωτερικό) = {diff:.2e}")
+        assert len(m_stream) == len(m_fft)
+        assert diff < 1e-3 * np.max(np.abs(m_fft))
+
+    # Χρόνος για 10 s σήματος στα 60 kHz
+    T_long = 10.0
+    samples = m(np.arange(0, T_long, 1/4000))
+    t0 = time.perf_counter()
+    n_out = 0
+    for out in stream_lpf_reconstruct(np.array_split(samples, 40), 4000, fs_cont):
+        n_out += len(out)
+    dt = time.perf_counter() - t0
+    print(f"Ροή: {n_out} δείγματα εξόδου σε {dt:.3f} s ({n_out / dt / 1e6:.1f} MS/s)")
@@ -4,6 +4,8 @@ import seaborn as sns
 from matplotlib.ticker import MaxNLocator
 import matplotlib.font_manager as fm
 
+from pointlabels import point_labels
+
 # Ρύθμιση για εμφάνιση ελληνικών χαρακτήρων
 plt.rcParams['font.family'] = 'DejaVu Sans'  # Ή άλλη γραμματοσειρά που υποστηρίζει ελληνικούς χαρακτήρες
 plt.rcParams.update({
@@ -86,22 +88,15 @@ ax.plot([0, FSI_single], [0, FSO_single], color='#9467bd', linestyle='--', linew
 ax.axvline(x=FSI_single, color='#ff7f0e', linestyle=':', linewidth=1.5, alpha=0.7, zorder=1)
 ax.axhline(y=FSO_single, color='#ff7f0e', linestyle=':', linewidth=1.5, alpha=0.7, zorder=1)
 
-# Προσθήκη ετικετών για ΚΑΘΕ σημείο με τις συντεταγμένες (x,y)
-for i, (x, y) in enumerate(zip(strain_single, voltage_single)):
-    # Προσαρμογή θέσης ετικέτας για αποφυγή επικάλυψης
-    offset_x = 0
-    offset_y = 8 if i % 2 == 0 else -15
-    
-    ax.annotate(f'({x}, {y:.2f})', 
-               (x, y), 
-               xytext=(offset_x, offset_y), 
-               textcoords='offset points',
-               ha='center', 
-               va='bottom' if i % 2 == 0 else 'top',
-               fontsize=9,
-               alpha=0.9,
-               bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="gray", alpha=0.7),
-               fontweight='bold')
+# Προσθήκη ετικετών για ΚΑΘΕ σημείο με τις συντεταγμένες (x,y), όλες ως ένα artist.
+# Για αποφυγή επικάλυψης οι ζυγές ετικέτες μπαίνουν πάνω και οι μονές κάτω από το σημείο
+even = np.arange(len(strain_single)) % 2 == 0
+point_labels(ax, strain_single, voltage_single,
+             [f'({x}, {y:.2f})' for x, y in zip(strain_single, voltage_single)],
+             offsets=np.column_stack([np.zeros(len(even)), np.where(even, 8, -15)]),
+             ha='center', va=np.where(even, 'bottom', 'top'), fontsize=9, alpha=0.9,
+             bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="gray", alpha=0.7),
+             fontweight='bold')
 
 # Ονομασίες αξόνων και τίτλος
 ax.set_xlabel('Μηχανική Παραμόρφωση (\u03BC\u03B5)', fontsize=14, fontweight='bold')
@@ -192,33 +187,20 @@ ax.plot([max_hysteresis_strain, max_hysteresis_strain],
         [voltage_loading[max_hysteresis_idx], voltage_unloading[max_hysteresis_idx]],
         color='#8c564b', linewidth=4, alpha=0.8, label='Μέγιστη Υστέρηση')
 
-# Ετικέτες για ΚΑΘΕ σημείο φόρτωσης
-for i, (x, y) in enumerate(zip(strain_dual, voltage_loading)):
-    offset_y = 8 if i % 2 == 0 else -15
-    ax.annotate(f'Φ({x}, {y:.2f})', 
-               (x, y), 
-               xytext=(0, offset_y), 
-               textcoords='offset points',
-               ha='center', 
-               va='bottom' if i % 2 == 0 else 'top',
-               fontsize=8,
-               alpha=0.9,
-               bbox=dict(boxstyle="round,pad=0.2", fc="white", ec="blue", alpha=0.6),
-               fontweight='bold')
-
-# Ετικέτες για ΚΑΘΕ σημείο εκφόρτωσης
-for i, (x, y) in enumerate(zip(strain_dual, voltage_unloading)):
-    offset_y = 8 if i % 2 == 1 else -15
-    ax.annotate(f'Ε({x}, {y:.2f})', 
-               (x, y), 
-               xytext=(20, offset_y), 
-               textcoords='offset points',
-               ha='center', 
-               va='bottom' if i % 2 == 1 else 'top',
-               fontsize=8,
-               alpha=0.9,
-               bbox=dict(boxstyle="round,pad=0.2", fc="white", ec="green", alpha=0.6),
-               fontweight='bold')
+# Ετικέτες για ΚΑΘΕ σημείο φόρτωσης και εκφόρτωσης (ένα artist ανά σειρά)
+even = np.arange(len(strain_dual)) % 2 == 0
+point_labels(ax, strain_dual, voltage_loading,
+             [f'Φ({x}, {y:.2f})' for x, y in zip(strain_dual, voltage_loading)],
+             offsets=np.column_stack([np.zeros(len(even)), np.where(even, 8, -15)]),
+             ha='center', va=np.where(even, 'bottom', 'top'), fontsize=8, alpha=0.9,
+             bbox=dict(boxstyle="round,pad=0.2", fc="white", ec="blue", alpha=0.6),
+             fontweight='bold')
+point_labels(ax, strain_dual, voltage_unloading,
+             [f'Ε({x}, {y:.2f})' for x, y in zip(strain_dual, voltage_unloading)],
+             offsets=np.column_stack([np.full(len(even), 20), np.where(even, -15, 8)]),
+             ha='center', va=np.where(even, 'top', 'bottom'), fontsize=8, alpha=0.9,
+             bbox=dict(boxstyle="round,pad=0.2", fc="white", ec="green", alpha=0.6),
+             fontweight='bold')
 
 # Ονομασίες αξόνων και τίτλος
 ax.set_xlabel('Μηχανική Παραμόρφωση (\u03BC\u03B5)', fontsize=14, fontweight='bold')
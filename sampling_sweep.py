@@ -0,0 +1,127 @@
+import time
+import numpy as np
+
+from dsp import m, f_max, get_spectrum, ideal_lpf_reconstruct
+
+# --- Σάρωση πολλών ρυθμών δειγματοληψίας (γενίκευση του g1.py) ---
+
+def sweep_dtype(n_target, keep_recon=False):
+    """
+    Τύπος του δομημένου πίνακα αποτελεσμάτων (μία γραμμή ανά fs).
+    """
+    fields = [('fs', 'f8'),         # Ρυθμός δειγματοληψίας (Hz)
+              ('n_samples', 'i8'),  # Πλήθος δειγμάτων = μήκος FFT
+              ('mse', 'f8'),        # MSE ανακατασκευής
+              ('max_error', 'f8'),  # Μέγιστο απόλυτο σφάλμα
+              ('peak_freq', 'f8'),  # Συχνότητα ισχυρότερης φασματικής γραμμής (Hz)
+              ('peak_mag', 'f8')]   # Μέτρο της γραμμής αυτής
+    if keep_recon:
+        fields.append(('recon', 'f8', (n_target,)))
+    return np.dtype(fields)
+
+def sweep_sampling_rates(fs_values, T_duration, fs_cont, signal_fn=m,
+                         keep_recon=False, return_spectra=False, batch_size=256):
+    """
+    Δειγματοληψία, φάσμα, ιδανική ανακατασκευή και MSE για όλα τα fs_values.
+
+    Οι ρυθμοί ομαδοποιούνται ανά μήκος FFT (ίδιο πλήθος δειγμάτων N), ώστε
+    κάθε ομάδα να υπολογίζεται με μία κλήση fft/ifft σε 2-D πίνακα. Ο άξονας
+    συχνοτήτων υπολογίζεται μία φορά ανά N και κλιμακώνεται με το fs.
+    Η ανακατασκευή γίνεται σε fs_cont * T_duration σημεία στη διάρκεια
+    N/fs των δειγμάτων και συγκρίνεται με το signal_fn στο ίδιο πλέγμα.
+
+    Επιστρέφει δομημένο πίνακα (βλ. sweep_dtype) με τη σειρά των fs_values
+    και, αν return_spectra=True, λεξικό {N: (fs, freq_axes, mags)}.
+    """
+    fs_values = np.asarray(fs_values, dtype=float)
+    n_target = int(fs_cont * T_duration)
+    # Ίδιο πλήθος δειγμάτων με το np.arange(0, T_duration, 1/fs)
+    n_samples = np.ceil(T_duration / (1 / fs_values)).astype(np.int64)
+    if np.any(n_samples > n_target):
+        raise ValueError("Όλα τα fs πρέπει να είναι <= fs_cont")
+
+    result = np.zeros(len(fs_values), dtype=sweep_dtype(n_target, keep_recon))
+    result['fs'] = fs_values
+    result['n_samples'] = n_samples
+    spectra = {}
+
+    # Κανονικοποιημένο πλέγμα-στόχος (χρησιμοποιείται μόνο το μήκος του)
+    grid = np.arange(n_target) / n_target
+
+    for N in np.unique(n_samples):
+        group = np.flatnonzero(n_samples == N)
+        # Άξονας συχνοτήτων για fs = 1, μία φορά ανά μήκος FFT
+        freq_unit, _ = get_spectrum(np.zeros(N), 1.0)
+        n_range = np.arange(N)
+        if return_spectra:
+            spectra[N] = (fs_values[group],
+                          np.empty((len(group), N)), np.empty((len(group), N)))
+
+        for start in range(0, len(group), batch_size):
+            rows = group[start:start + batch_size]
+            fs_col = fs_values[rows][:, None]
+
+            # Δειγματοληψία όλων των ρυθμών της ομάδας μαζί
+            samples = signal_fn(n_range / fs_col)
+
+            # Φάσματα (μία fft για όλη την ομάδα)
+            _, mags = get_spectrum(samples, 1.0)
+            peak = np.argmax(mags, axis=1)
+            result['peak_freq'][rows] = np.abs(freq_unit[peak]) * fs_col[:, 0]
+            result['peak_mag'][rows] = mags[np.arange(len(rows)), peak]
+            if return_spectra:
+                sl = slice(start, start + len(rows))
+                spectra[N][1][sl] = freq_unit * fs_col
+                spectra[N][2][sl] = mags
+
+            # Ανακατασκευή και σφάλμα στο πλέγμα των N/fs δευτερολέπτων
+            recon = ideal_lpf_reconstruct(samples, None, grid, fs_col)
+            error = recon - signal_fn(grid * (N / fs_col))
+            result['mse'][rows] = np.mean(error**2, axis=1)
+            result['max_error'][rows] = np.max(np.abs(error), axis=1)
+            if keep_recon:
+                result['recon'][rows] = recon
+
+    if return_spectra:
+        return result, spectra
+    return result
+
+def sweep_naive(fs_values, T_duration, fs_cont, signal_fn=m):
+    """
+    Ο ίδιος υπολογισμός με βρόχο ανά fs (όπως στο g1.py), για σύγκριση.
+    """
+    n_target = int(fs_cont * T_duration)
+    result = np.zeros(len(fs_values), dtype=sweep_dtype(n_target))
+    for i, fs in enumerate(fs_values):
+        t_samp = np.arange(0, T_duration, 1/fs)
+        samples = signal_fn(t_samp)
+        freq, mag = get_spectrum(samples, fs)
+        N = len(samples)
+        t_target = np.arange(n_target) * (N / fs) / n_target
+        recon = ideal_lpf_reconstruct(samples, t_samp, t_target, fs)
+        error = recon - signal_fn(t_target)
+        peak = np.argmax(mag)
+        result[i] = (fs, N, np.mean(error**2), np.max(np.abs(error)),
+                     abs(freq[peak]), mag[peak])
+    return result
+
+# --- Benchmark: σάρωση vs βρόχος ---
+if __name__ == "__main__":
+    T_duration = 0.02
+    fs_cont = 50 * f_max
+    fs_values = np.linspace(1000, 6000, 2000)
+
+    t0 = time.perf_counter()
+    res_loop = sweep_naive(fs_values, T_duration, fs_cont)
+    t_loop = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    res_sweep = sweep_sampling_rates(fs_values, T_duration, fs_cont)
+    t_sweep = time.perf_counter() - t0
+
+    n_groups = len(np.unique(res_sweep['n_samples']))
+    print(f"{len(fs_values)} ρυθμοί, {n_groups} μήκη FFT")
+    print(f"Βρόχος:  {t_loop:.3f} s ({len(fs_values) / t_loop:,.0f} fs/s)")
+    print(f"Σάρωση:  {t_sweep:.3f} s ({len(fs_values) / t_sweep:,.0f} fs/s)")
+    print(f"Επιτάχυνση: x{t_loop / t_sweep:.1f}")
+    print(f"Μέγιστη διαφορά MSE: {np.max(np.abs(res_loop['mse'] - res_sweep['mse'])):.2e}")
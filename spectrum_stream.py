@@ -0,0 +1,153 @@
+import os
+import time
+from collections import namedtuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from dsp import get_spectrum, spectrum_axes
+
+# --- Ανάλυση φάσματος σε ροή (Welch PSD / STFT) για μεγάλες καταγραφές ---
+
+SpectrumUpdate = namedtuple('SpectrumUpdate',
+                            ['n_frames', 't_end', 'freqs', 'psd', 'stft_times', 'stft_mag'])
+
+def read_chunks(source, chunk_len, dtype=np.float32, offset=0,
+                follow=False, poll_interval=0.5, idle_timeout=5.0):
+    """
+    Διαβάζει δείγματα σε κομμάτια των chunk_len χωρίς να φορτώνει όλη την καταγραφή.
+
+    source: np.ndarray / np.memmap, ή διαδρομή σε raw αρχείο με τιμές dtype.
+    Με follow=True το αρχείο παρακολουθείται όσο γράφεται: στο τέλος του
+    περιμένουμε νέα δεδομένα και σταματάμε μετά από idle_timeout s χωρίς αλλαγή.
+    """
+    if isinstance(source, np.ndarray):
+        for i in range(offset, len(source), chunk_len):
+            yield np.asarray(source[i:i + chunk_len])
+        return
+
+    dtype = np.dtype(dtype)
+    n_bytes = chunk_len * dtype.itemsize
+    with open(source, 'rb') as f:
+        f.seek(offset * dtype.itemsize)
+        leftover = b''
+        idle_since = None
+        while True:
+            data = leftover + f.read(n_bytes - len(leftover))
+            n_whole = len(data) // dtype.itemsize * dtype.itemsize
+            leftover = data[n_whole:]
+            if n_whole:
+                idle_since = None
+                yield np.frombuffer(data[:n_whole], dtype=dtype)
+            if len(data) < n_bytes:
+                if not follow:
+                    break
+                if idle_since is None:
+                    idle_since = time.monotonic()
+                elif time.monotonic() - idle_since > idle_timeout:
+                    break
+                time.sleep(poll_interval)
+
+def frame_batches(chunks, nperseg, noverlap=0, batch=64):
+    """
+    Μετατρέπει ροή κομματιών σε πίνακες πλαισίων (k, nperseg) με βήμα
+    nperseg - noverlap. Κρατάει μόνο την ουρά που χρειάζεται το επόμενο πλαίσιο.
+    """
+    hop = nperseg - noverlap
+    buf = np.zeros(0)
+    for chunk in chunks:
+        buf = np.concatenate([buf, chunk]) if len(buf) else np.asarray(chunk)
+        n_frames = (len(buf) - nperseg) // hop + 1 if len(buf) >= nperseg else 0
+        for start in range(0, n_frames, batch):
+            k = min(batch, n_frames - start)
+            seg = buf[start * hop:(start + k - 1) * hop + nperseg]
+            yield sliding_window_view(seg, nperseg)[::hop]
+        buf = buf[n_frames * hop:]
+
+class WelchPSD:
+    """
+    Συσσωρευτής Welch PSD (μέσος όρος περιοδογραμμάτων), σταθερής μνήμης.
+    Τα φάσματα υπολογίζονται με get_spectrum(onesided=True, window=...).
+    """
+
+    def __init__(self, fs, nperseg, window='hann', dtype=np.float32):
+        self.fs = fs
+        self.nperseg = nperseg
+        self.window = window
+        self.dtype = np.dtype(dtype)
+        self.freqs, win = spectrum_axes(nperseg, float(fs), window, True, self.dtype)
+        # Κλίμακα πυκνότητας: |FFT|^2 / (fs * sum(w^2)), με norm='ortho'
+        # το |FFT|^2 = N * |M|^2
+        scale = np.full(len(self.freqs), nperseg / (fs * np.sum(win.astype(float)**2)))
+        scale[1:(nperseg + 1) // 2] *= 2  # μονόπλευρο: διπλασιασμός εκτός DC/Nyquist
+        self._scale = scale
+        self._sum = np.zeros(len(self.freqs))
+        self.n_frames = 0
+
+    def update(self, frames):
+        """
+        Προσθέτει πίνακα πλαισίων (k, nperseg) και επιστρέφει το μέτρο STFT τους.
+        """
+        _, mag = get_spectrum(np.asarray(frames, dtype=self.dtype), self.fs,
+                              onesided=True, window=self.window)
+        self._sum += np.sum(mag.astype(float)**2, axis=0)
+        self.n_frames += len(mag)
+        return mag
+
+    def psd(self):
+        return self._sum * self._scale / max(self.n_frames, 1)
+
+def stream_spectrum(source, fs, nperseg=1024, noverlap=512, window='hann',
+                    dtype=np.float32, frames_per_update=64, keep_stft=True, **read_kwargs):
+    """
+    Welch PSD και φασματογράφημα STFT σε ροή από πίνακα/memmap ή raw αρχείο.
+
+    Μετά από κάθε frames_per_update πλαίσια δίνει SpectrumUpdate με το τρέχον
+    PSD (όλα τα πλαίσια μέχρι τώρα) και τις νέες στήλες STFT (k, nperseg//2+1),
+    ώστε μια μεγάλη καταγραφή να παρακολουθείται όσο ακόμη γράφεται.
+    """
+    hop = nperseg - noverlap
+    welch = WelchPSD(fs, nperseg, window, dtype)
+    chunks = read_chunks(source, frames_per_update * hop, dtype=dtype, **read_kwargs)
+    for frames in frame_batches(chunks, nperseg, noverlap, frames_per_update):
+        first = welch.n_frames
+        mag = welch.update(frames)
+        times = (np.arange(first, welch.n_frames) * hop + nperseg / 2) / fs
+        t_end = ((welch.n_frames - 1) * hop + nperseg) / fs
+        yield SpectrumUpdate(welch.n_frames, t_end, welch.freqs, welch.psd(),
+                             times, mag if keep_stft else None)
+
+# --- Έλεγχος με scipy.signal.welch σε memmap ---
+if __name__ == "__main__":
+    import tempfile
+    from scipy.signal import welch as scipy_welch
+    from dsp import m, f_max
+
+    fs = 50 * f_max
+    T_duration = 60.0
+    path = os.path.join(tempfile.mkdtemp(), 'capture.f32')
+    # Γράφουμε την καταγραφή σε κομμάτια (όπως μια κάρτα λήψης)
+    with open(path, 'wb') as f:
+        for i in range(0, int(fs * T_duration), 10**6):
+            n = np.arange(i, min(i + 10**6, int(fs * T_duration)))
+            f.write(m(n / fs).astype(np.float32).tobytes())
+
+    capture = np.memmap(path, dtype=np.float32, mode='r')
+    t0 = time.perf_counter()
+    for update in stream_spectrum(path, fs, nperseg=4096, noverlap=2048,
+                                  frames_per_update=256, keep_stft=False):
+        pass
+    dt = time.perf_counter() - t0
+    print(f"{len(capture)} δείγματα ({capture.nbytes / 2**20:.0f} MB), "
+          f"{update.n_frames} πλαίσια σε {dt:.2f} s ({len(capture) / dt / 1e6:.1f} MS/s)")
+
+    # Ίδιο PSD με το scipy.signal.welch (χωρίς detrend) στα πρώτα δείγματα του memmap
+    n_check = 10**6 + 1234
+    _, psd_ref = scipy_welch(np.asarray(capture[:n_check], dtype=float), fs,
+                             nperseg=4096, noverlap=2048, detrend=False)
+    for part in stream_spectrum(capture[:n_check], fs, nperseg=4096, noverlap=2048):
+        pass
+    err = np.max(np.abs(part.psd - psd_ref)) / np.max(psd_ref)
+    print(f"Πλαίσια {part.n_frames}: σχετική διαφορά από scipy.signal.welch = {err:.2e}")
+    del capture
+    os.remove(path)
@@ -0,0 +1,138 @@
+import time
+
+import numpy as np
+
+from dsp import f1, f2, f3
+
+# --- Σύνθεση αθροίσματος τόνων με περιστροφή φασιθετών (phasors) ---
+
+def m_tones():
+    """
+    Οι τόνοι του m(t) (dsp.m) ως (πλάτη, συχνότητες, φάσεις) για a*cos(2*pi*f*t + phi):
+    -3 sin(x) = 3 cos(x + pi/2).
+    """
+    return (np.array([2.0, 1.0, 3.0]),
+            np.array([f1, f2, f3], dtype=float),
+            np.array([0.0, 0.0, np.pi / 2]))
+
+class ToneBank:
+    """
+    Γεννήτρια x[n] = sum_k a_k cos(2*pi*f_k*n/fs + phi_k) σε μπλοκ.
+
+    Αντί για cos ανά δείγμα και τόνο, κρατάμε για κάθε τόνο τον φασιθέτη
+    z_k = exp(j(w_k n + phi_k)) στην αρχή του μπλοκ. Ένα μπλοκ είναι
+    Re(sum_k a_k z_k exp(j w_k b)), b = 0..B-1: οι πίνακες exp(j w_k b)
+    υπολογίζονται μία φορά και το μπλοκ βγαίνει με δύο γινόμενα πινάκων.
+    Μετά το μπλοκ z_k *= exp(j w_k B) και κάθε renorm_every μπλοκ το |z_k|
+    επανέρχεται στο 1 ώστε να μη συσσωρεύεται σφάλμα.
+    """
+
+    def __init__(self, amps, freqs, phases, fs, block_size=4096,
+                 dtype=np.float64, renorm_every=64):
+        amps, freqs, phases = np.broadcast_arrays(
+            np.asarray(amps, dtype=float), np.asarray(freqs, dtype=float),
+            np.asarray(phases, dtype=float))
+        self.amps = amps
+        self.omega = 2 * np.pi * freqs / fs
+        self.phases = phases
+        self.fs = fs
+        self.block_size = block_size
+        self.dtype = np.dtype(dtype)
+        self.renorm_every = renorm_every
+
+        arg = np.outer(self.omega, np.arange(block_size))
+        self._cos = np.cos(arg).astype(self.dtype)
+        self._sin = np.sin(arg).astype(self.dtype)
+        self._step = np.exp(1j * self.omega * block_size)
+        self.reset()
+
+    def reset(self, start=0):
+        """
+        Επιστροφή στο δείγμα 'start'.
+        """
+        self._z = np.exp(1j * (self.omega * start + self.phases))
+        self._blocks = 0
+        self.position = start
+
+    def _fill(self, out):
+        B = len(out)
+        c = self.amps * self._z
+        # Re(c * (cos + j sin)) = Re(c) cos - Im(c) sin
+        np.dot(c.real.astype(self.dtype), self._cos[:, :B], out=out)
+        out -= np.dot(c.imag.astype(self.dtype), self._sin[:, :B])
+        if B == self.block_size:
+            self._z *= self._step
+        else:
+            self._z *= np.exp(1j * self.omega * B)
+        self._blocks += 1
+        if self._blocks % self.renorm_every == 0:
+            self._z /= np.abs(self._z)
+        self.position += B
+
+    def synthesize(self, n_samples, out=None):
+        """
+        Γράφει τα επόμενα n_samples δείγματα στο out (ή σε νέο πίνακα) και το επιστρέφει.
+        """
+        if out is None:
+            out = np.empty(n_samples, dtype=self.dtype)
+        elif len(out) != n_samples or out.dtype != self.dtype:
+            raise ValueError("Το out πρέπει να έχει μήκος n_samples και dtype της ToneBank")
+        for start in range(0, n_samples, self.block_size):
+            self._fill(out[start:start + self.block_size])
+        return out
+
+    def blocks(self, n_samples=None, reuse_buffer=False):
+        """
+        Ροή μπλοκ block_size δειγμάτων (χωρίς τέλος αν n_samples=None).
+        Με reuse_buffer=True δίνεται κάθε φορά ο ίδιος πίνακας, που ισχύει
+        μόνο μέχρι το επόμενο μπλοκ.
+        """
+        buf = np.empty(self.block_size, dtype=self.dtype)
+        remaining = n_samples
+        while remaining is None or remaining > 0:
+            B = self.block_size if remaining is None else min(self.block_size, remaining)
+            out = buf[:B] if reuse_buffer else np.empty(B, dtype=self.dtype)
+            self._fill(out)
+            if remaining is not None:
+                remaining -= B
+            yield out
+
+# --- Benchmark και έλεγχος ολίσθησης ---
+if __name__ == "__main__":
+    from dsp import m
+
+    fs = 200000
+    # m(t): ίδιο σήμα με το dsp.m
+    bank = ToneBank(*m_tones(), fs)
+    n = np.arange(10**6)
+    print(f"m(t): max |ToneBank - dsp.m| = {np.max(np.abs(bank.synthesize(len(n)) - m(n / fs))):.1e}")
+
+    # 32 τόνοι για 60 s στα 200 kHz (12e6 δείγματα)
+    rng = np.random.default_rng(0)
+    K = 32
+    amps = rng.uniform(0.1, 1, K)
+    freqs = rng.uniform(50, 20000, K)
+    phases = rng.uniform(0, 2 * np.pi, K)
+    n_total = 60 * fs
+
+    def direct(n_idx):
+        t = n_idx / fs
+        return np.sum(amps[:, None] * np.cos(2 * np.pi * freqs[:, None] * t + phases[:, None]), axis=0)
+
+    t0 = time.perf_counter()
+    chunk = 1 << 16
+    for start in range(0, n_total, chunk):
+        direct(np.arange(start, min(start + chunk, n_total)))
+    t_direct = time.perf_counter() - t0
+
+    for dtype in [np.float64, np.float32]:
+        bank = ToneBank(amps, freqs, phases, fs, dtype=dtype)
+        out = np.empty(n_total, dtype=dtype)
+        t0 = time.perf_counter()
+        bank.synthesize(n_total, out=out)
+        t_bank = time.perf_counter() - t0
+        tail = np.arange(n_total - 10**5, n_total)
+        drift = np.max(np.abs(out[tail] - direct(tail)))
+        print(f"{K} τόνοι, {n_total:.1e} δείγματα, {np.dtype(dtype).name}: "
+              f"άμεσο {t_direct:.2f} s, ToneBank {t_bank:.2f} s (x{t_direct / t_bank:.1f}), "
+              f"σφάλμα στο τέλος {drift:.1e}")